@@ -0,0 +1,75 @@
+"""
+Benchmark of initData generation for large synthetic user populations.
+
+Compares a loop over generate_telegram_init_data() with the batch API
+(serial and process pool) and with re-signing one cached InitDataTemplate,
+then validates the generated corpus, and prints strings per second.
+
+Usage:
+    python examples/benchmark_init_data.py [USERS] [PROCESSES]
+"""
+
+import os
+import sys
+import time
+from tma_test_framework.init_data import (
+    InitDataTemplate,
+    InitDataValidator,
+    generate_init_data_batch,
+)
+from tma_test_framework.utils import generate_telegram_init_data
+
+BOT_TOKEN = "123456:BENCHMARK-TOKEN"
+
+
+def measure(name: str, count: int, generate) -> None:
+    """Run generator function and print throughput."""
+    start = time.perf_counter()
+    generated = sum(1 for _ in generate())
+    elapsed = time.perf_counter() - start
+    assert generated == count
+    print(f"{name:<28} {count / elapsed:>12,.0f} strings/sec ({elapsed:.2f}s)")
+
+
+def main():
+    """Compare initData generation approaches."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    print(f"Generating initData for {count:,} users")
+
+    measure(
+        "generate_telegram_init_data",
+        count,
+        lambda: (
+            generate_telegram_init_data(user_id=i, bot_token=BOT_TOKEN)
+            for i in range(count)
+        ),
+    )
+    measure(
+        "batch (serial)",
+        count,
+        lambda: generate_init_data_batch(range(count), BOT_TOKEN),
+    )
+    measure(
+        f"batch ({processes} processes)",
+        count,
+        lambda: generate_init_data_batch(range(count), BOT_TOKEN, processes=processes),
+    )
+    template = InitDataTemplate(1, BOT_TOKEN)
+    measure(
+        "InitDataTemplate.sign",
+        count,
+        lambda: (template.sign() for _ in range(count)),
+    )
+
+    corpus = list(generate_init_data_batch(range(count), BOT_TOKEN))
+    validator = InitDataValidator(BOT_TOKEN, max_age=3600)
+    measure(
+        "InitDataValidator",
+        count,
+        lambda: (result for result in validator.validate_many(corpus) if result.valid),
+    )
+
+
+if __name__ == "__main__":
+    main()
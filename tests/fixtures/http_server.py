@@ -0,0 +1,161 @@
+"""
+Local HTTP(S) server helpers for connection-level ApiClient tests.
+"""
+
+import asyncio
+import socket
+import ssl
+import struct
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 12\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b'{"ok": true}'
+)
+
+
+def make_self_signed_cert(directory: Path) -> Tuple[Path, Path]:
+    """
+    Create self-signed certificate for "localhost".
+
+    Returns:
+        Tuple of (certificate path, private key path)
+    """
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+async def _handle_request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    """Answer one request with a small JSON body and close the connection."""
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(RESPONSE)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_http_server(
+    ssl_context: Optional[ssl.SSLContext] = None, unix_path: Optional[str] = None
+) -> asyncio.Server:
+    """
+    Start local HTTP server closing the connection after each response.
+
+    Args:
+        ssl_context: Server SSL context (None for plain HTTP)
+        unix_path: Listen on Unix domain socket instead of 127.0.0.1
+
+    Returns:
+        Started asyncio server
+    """
+    if unix_path is not None:
+        return await asyncio.start_unix_server(
+            _handle_request, path=unix_path, ssl=ssl_context
+        )
+    return await asyncio.start_server(_handle_request, "127.0.0.1", 0, ssl=ssl_context)
+
+
+async def start_faulty_server(mode: str) -> asyncio.Server:
+    """
+    Start local TCP server failing every request in a given way.
+
+    Args:
+        mode: "reset" (RST after request), "garbage" (non-HTTP bytes sent
+            on connect, also breaks TLS handshakes) or "hang" (never respond)
+
+    Returns:
+        Started asyncio server on 127.0.0.1
+    """
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        if mode == "garbage":
+            writer.write(b"NOT HTTP\r\n\r\n")
+            await writer.drain()
+            writer.close()
+            return
+        await reader.readuntil(b"\r\n\r\n")
+        if mode == "reset":
+            sock = writer.get_extra_info("socket")
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            writer.transport.abort()
+        else:
+            await reader.read()
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """Answer every request with 200 and a small JSON body (404 for /missing)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = b'{"results": [{"id": 1}]}'
+        self.send_response(404 if self.path.endswith("/missing") else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def start_threaded_http_server() -> ThreadingHTTPServer:
+    """
+    Start keep-alive HTTP server on 127.0.0.1 in a background thread.
+
+    Usable from other processes (e.g. load workers); stop with shutdown().
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -3,7 +3,7 @@ Fixtures for ApiClient testing.
 """
 
 from pytest import fixture
-from httpx import Response
+from httpx import AsyncClient, MockTransport, Response
 from datetime import timedelta
 
 from tma_test_framework.clients.api_client import ApiClient
@@ -157,6 +157,18 @@ def miniapp_api_with_config(mocker, valid_config, mock_httpx_client):
     return api
 
 
+def make_transport_api(config: Config, handler) -> ApiClient:
+    """
+    Create ApiClient whose requests are served by an httpx.MockTransport handler.
+
+    Unlike miniapp_api_with_config, the full httpx request/response cycle runs,
+    which suits tests of higher-level runners built on make_request().
+    """
+    api = ApiClient("https://example.com/app", config)
+    api.client = AsyncClient(transport=MockTransport(handler), timeout=config.timeout)
+    return api
+
+
 # Test data for validate_init_data
 # Note: These are example values - in real tests, you'd generate valid init_data
 # using actual Telegram bot token and user data
@@ -456,3 +456,29 @@ class TestBaseClientAdditional:
             assert app1.config == app2.config  # Same config object
             assert app1.logger is not None
             assert app2.logger is not None
+
+
+class TestBaseClientLogSampling:
+    """Test BaseClient log sampling."""
+
+    @allure.title("TC-BASE-028: Log sampling logs 1 in N operations")
+    @allure.description("TC-BASE-028: Test _log_sampled() with sample rate 3.")
+    def test_log_sampling_rate(self, valid_config):
+        """Test _log_sampled() with sample rate 3."""
+        app = BaseClient("https://example.com/app", valid_config)
+
+        with allure.step("Verify every operation is logged by default"):
+            assert all(app._log_sampled() for _ in range(5))
+
+        with allure.step("Set sample rate 3 and verify 1 in 3 is logged"):
+            app.set_log_sampling(3)
+            decisions = [app._log_sampled() for _ in range(6)]
+            assert decisions == [True, False, False, True, False, False]
+
+    @allure.title("TC-BASE-029: Invalid log sample rate raises ValueError")
+    @allure.description("TC-BASE-029: Test set_log_sampling(0) raises ValueError.")
+    def test_log_sampling_invalid_rate(self, valid_config):
+        """Test set_log_sampling(0) raises ValueError."""
+        app = BaseClient("https://example.com/app", valid_config)
+        with pytest.raises(ValueError, match="sample_rate must be at least 1"):
+            app.set_log_sampling(0)
@@ -0,0 +1,168 @@
+"""
+Unit tests for run-to-run baseline comparison.
+"""
+
+import random
+from math import erfc, sqrt
+
+import allure
+import pytest
+
+from tma_test_framework.baseline import (
+    Baseline,
+    bootstrap_difference,
+    latency_sketch,
+    mann_whitney_u,
+)
+from tma_test_framework.load import EndpointLoadStats
+from tma_test_framework.records import ResultSet
+from tma_test_framework.stats import EndpointStats, RequestStats
+
+
+def make_stats(seed: int, slowdown: float = 1.0, samples: int = 2000) -> RequestStats:
+    """Create stats of two endpoints with log-normal latencies."""
+    rng = random.Random(seed)
+    stats = RequestStats()
+    for key, factor in (("GET v1/items/", slowdown), ("GET v1/me/", 1.0)):
+        endpoint = stats.endpoints[key] = EndpointStats(key=key)
+        for index in range(samples):
+            endpoint.record(rng.lognormvariate(-3, 0.5) * factor, False, index * 0.01)
+    return stats
+
+
+class TestStatistics:
+    """Test mann_whitney_u() and bootstrap_difference()."""
+
+    @allure.title("TC-BASELINE-001: Mann-Whitney U p-values")
+    @allure.description("Test one-sided Mann-Whitney U test. TC-BASELINE-001")
+    def test_mann_whitney_u(self):
+        """Test one-sided Mann-Whitney U test. TC-BASELINE-001"""
+        # U = 9, mean = 4.5, variance = 5.25, continuity corrected z = 4 / sqrt(5.25)
+        expected = 0.5 * erfc(4 / sqrt(5.25) / sqrt(2))
+        assert mann_whitney_u([4, 5, 6], [1, 2, 3]) == pytest.approx(expected)
+        assert mann_whitney_u([4, 5, 6], [1, 2, 3]) == pytest.approx(0.0404, abs=1e-4)
+        assert mann_whitney_u([1, 2, 3], [4, 5, 6]) > 0.95
+
+        with allure.step("Ties and degenerate samples"):
+            assert mann_whitney_u([1, 1, 1], [1, 1, 1]) == 1.0
+            assert mann_whitney_u([], [1.0]) == 1.0
+            tied = mann_whitney_u([1, 2, 2, 3], [1, 2, 2, 3])
+            assert 0.5 < tied < 0.7
+
+    @allure.title("TC-BASELINE-002: Bootstrap interval of percentile difference")
+    @allure.description("Test bootstrap_difference() intervals. TC-BASELINE-002")
+    def test_bootstrap_difference(self):
+        """Test bootstrap_difference() intervals. TC-BASELINE-002"""
+        rng = random.Random(5)
+        baseline = [rng.lognormvariate(0, 0.5) for _ in range(1000)]
+        same = [rng.lognormvariate(0, 0.5) for _ in range(1000)]
+        low, high = bootstrap_difference(same, baseline, 95, rng=random.Random(1))
+        assert low < 0 < high
+
+        shifted = [value + 1.0 for value in same]
+        low, high = bootstrap_difference(shifted, baseline, 50, rng=random.Random(1))
+        assert 0.8 < low < 1.0 < high < 1.2
+        assert bootstrap_difference(
+            shifted, baseline, 50, rng=random.Random(1)
+        ) == bootstrap_difference(shifted, baseline, 50, rng=random.Random(1))
+
+
+class TestBaseline:
+    """Test Baseline."""
+
+    @allure.title("TC-BASELINE-003: Baseline is built from any statistics and saved")
+    @allure.description("Test from_stats(), save() and load(). TC-BASELINE-003")
+    def test_from_stats_save_load(self, tmp_path):
+        """Test from_stats(), save() and load(). TC-BASELINE-003"""
+        stats = make_stats(1)
+        baseline = Baseline.from_stats(stats, label="main", sample_size=100)
+        items = baseline.endpoints["GET v1/items/"]
+        assert items.count == 2000
+        assert len(items.latencies) == 100
+        assert items.latencies == sorted(items.latencies)
+        assert items.percentile(50) == pytest.approx(
+            stats["GET v1/items/"].percentile(50), rel=0.02
+        )
+
+        path = tmp_path / "baseline.json"
+        baseline.save(path)
+        assert Baseline.load(path) == baseline
+
+        with allure.step("Load histograms and result sets"):
+            load_stats = EndpointLoadStats(key="GET v1/items/")
+            for latency in stats["GET v1/items/"].latencies:
+                load_stats.record(latency, False, 1.0)
+            sketch = latency_sketch(load_stats, 50)
+            assert len(sketch) == 50
+            assert sketch[25] == pytest.approx(items.percentile(50), rel=0.05)
+
+            results = ResultSet()
+            results.append(1.0, "GET", "v1/", 200, 0.1)
+            assert Baseline.from_stats(results).endpoints["GET v1/"].latencies == [0.1]
+
+        with allure.step("Invalid input raises ValueError"):
+            with pytest.raises(ValueError, match="sample_size"):
+                Baseline.from_stats(stats, sample_size=0)
+            path.write_text("{}")
+            with pytest.raises(ValueError, match="Invalid baseline file"):
+                Baseline.load(path)
+
+    @allure.title("TC-BASELINE-004: Noise is not reported, slowdowns are")
+    @allure.description("Test compare() verdicts. TC-BASELINE-004")
+    def test_compare(self):
+        """Test compare() verdicts. TC-BASELINE-004"""
+        baseline = Baseline.from_stats(make_stats(1), label="main")
+
+        with allure.step("Runs from the same distribution do not regress"):
+            for seed in range(2, 12):
+                comparison = baseline.compare(make_stats(seed), seed=seed)
+                assert comparison.regressions == []
+                assert comparison.improvements == []
+                comparison.assert_no_regressions()
+
+        with allure.step("20% slower endpoint regresses"):
+            comparison = baseline.compare(make_stats(20, slowdown=1.2), seed=1)
+            assert [c.key for c in comparison.regressions] == ["GET v1/items/"]
+            regression = comparison.endpoints["GET v1/items/"]
+            assert regression.change == pytest.approx(0.2, abs=0.1)
+            assert regression.p_value < 0.01 and regression.ci_low > 0
+            assert comparison.endpoints["GET v1/me/"].status == "unchanged"
+            with pytest.raises(AssertionError, match="1 endpoint\\(s\\) regressed"):
+                comparison.assert_no_regressions()
+            assert (
+                comparison.report()
+                .splitlines()[1]
+                .startswith("GET v1/items/: regressed p95")
+            )
+
+        with allure.step("Faster endpoint improves"):
+            comparison = baseline.compare(make_stats(21, slowdown=0.7), seed=1)
+            assert [c.key for c in comparison.improvements] == ["GET v1/items/"]
+
+        with allure.step("Small significant change stays below min_change"):
+            comparison = baseline.compare(
+                make_stats(22, slowdown=1.2), seed=1, min_change=0.5
+            )
+            assert comparison.regressions == []
+
+    @allure.title("TC-BASELINE-005: Missing, new and sparse endpoints")
+    @allure.description("Test compare() edge cases. TC-BASELINE-005")
+    def test_compare_edge_cases(self):
+        """Test compare() edge cases. TC-BASELINE-005"""
+        baseline = Baseline.from_stats(make_stats(1))
+        current = make_stats(2)
+        del current.endpoints["GET v1/me/"]
+        sparse = current.endpoints["GET v1/new/"] = EndpointStats(key="GET v1/new/")
+        sparse.record(0.1, False, 1.0)
+        current.endpoints["GET v1/items/"].latencies[:] = [0.2] * 10
+
+        comparison = baseline.compare(current, resamples=0)
+        assert comparison.endpoints["GET v1/me/"].status == "missing"
+        assert comparison.endpoints["GET v1/new/"].status == "new"
+        assert comparison.endpoints["GET v1/items/"].status == "insufficient"
+        assert "only in baseline" in comparison.report()
+
+        with pytest.raises(ValueError, match="alpha"):
+            baseline.compare(current, alpha=1)
+        with pytest.raises(ValueError, match="quantile"):
+            baseline.compare(current, quantile=101)
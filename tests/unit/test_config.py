@@ -7,11 +7,19 @@ import re
 import tempfile
 
 import allure
+import yaml
 from msgspec import convert, to_builtins
 from pytest import mark, raises
 
 # Local imports
-from tma_test_framework.config import Config
+from tma_test_framework import config as config_module
+from tma_test_framework.config import (
+    Config,
+    PerformanceConfig,
+    clear_yaml_cache,
+    load_yaml,
+)
+from tma_test_framework.scenario import Scenario
 
 
 # ============================================================================
@@ -2421,3 +2429,235 @@ class TestConfigAdditional:
             repr_str = repr(config)
         with allure.step("Verify repr contains class name"):
             assert "Config" in repr_str
+
+
+# ============================================================================
+# IX. Загрузка YAML
+# ============================================================================
+
+
+CONFIG_YAML = """api_id: 12345
+api_hash: "12345678901234567890123456789012"
+session_string: "test_session"
+timeout: 10
+"""
+
+
+class TestLoadYaml:
+    """Test load_yaml() parsing and caching."""
+
+    @mark.unit
+    @allure.title("TC-CONFIG-047: Parsed YAML is reused until the file changes")
+    @allure.description("TC-CONFIG-047: Test load_yaml() cache by path and mtime.")
+    def test_load_yaml_cache(self, tmp_path, mocker) -> None:
+        """Test load_yaml() cache by path and mtime. TC-CONFIG-047"""
+        path = tmp_path / "config.yaml"
+        path.write_text(CONFIG_YAML)
+        parse = mocker.spy(config_module, "load")
+
+        with allure.step("Repeated loads parse once and return copies"):
+            first = load_yaml(path)
+            assert load_yaml(str(path)) == first
+            assert load_yaml(tmp_path / "." / "config.yaml") is not first
+            assert parse.call_count == 1
+            assert parse.call_args.kwargs["Loader"] is config_module.YamlLoader
+            if hasattr(yaml, "CSafeLoader"):
+                assert config_module.YamlLoader is yaml.CSafeLoader
+
+        with allure.step("Changed file is parsed again"):
+            path.write_text(CONFIG_YAML.replace("timeout: 10", "timeout: 20"))
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+            assert load_yaml(path)["timeout"] == 20
+            assert parse.call_count == 2
+
+        with allure.step("clear_yaml_cache() forces parsing"):
+            clear_yaml_cache()
+            load_yaml(path)
+            assert parse.call_count == 3
+
+        with allure.step("Missing file raises FileNotFoundError"):
+            with raises(FileNotFoundError):
+                load_yaml(tmp_path / "missing.yaml")
+
+    @mark.unit
+    @allure.title("TC-CONFIG-048: Config and Scenario share cached YAML safely")
+    @allure.description(
+        "TC-CONFIG-048: Test from_yaml env overrides do not modify cached YAML."
+    )
+    def test_from_yaml_uses_cache(self, tmp_path, monkeypatch, mocker) -> None:
+        """Test from_yaml env overrides do not modify cached YAML. TC-CONFIG-048"""
+        path = tmp_path / "config.yaml"
+        path.write_text(CONFIG_YAML)
+        parse = mocker.spy(config_module, "load")
+
+        with allure.step("Env override applies to a copy"):
+            monkeypatch.setenv("TMA_SESSION_FILE", "override")
+            assert Config.from_yaml(str(path)).session_file == "override"
+            monkeypatch.delenv("TMA_SESSION_FILE")
+            config = Config.from_yaml(str(path))
+            assert config.session_string == "test_session"
+            assert config.session_file is None
+            assert config.timeout == 10
+            assert parse.call_count == 1
+
+        with allure.step("Scenario files go through the same cache"):
+            scenario_path = tmp_path / "scenario.yaml"
+            scenario_path.write_text(
+                "name: smoke\nsteps:\n  - name: status\n"
+                "    request:\n      endpoint: v1/status/\n"
+            )
+            first = Scenario.from_yaml(str(scenario_path))
+            assert Scenario.from_yaml(str(scenario_path)) == first
+            assert parse.call_count == 2
+
+    @mark.unit
+    @allure.title("TC-CONFIG-052: Cached YAML is copied deeply and bounded")
+    @allure.description(
+        "TC-CONFIG-052: Test nested changes do not leak and the cache is limited."
+    )
+    def test_load_yaml_copies_and_bounds(self, tmp_path, mocker) -> None:
+        """Test nested changes do not leak and the cache is limited. TC-CONFIG-052"""
+        path = tmp_path / "config.yaml"
+        path.write_text(CONFIG_YAML + "performance:\n  http_max_connections: 50\n")
+
+        with allure.step("Nested mappings are not shared"):
+            load_yaml(path)["performance"]["http_max_connections"] = 0
+            config = Config.from_yaml(str(path))
+            assert config.performance.http_max_connections == 50
+            assert load_yaml(path)["performance"] == {"http_max_connections": 50}
+
+        with allure.step("Least recently used documents are evicted"):
+            clear_yaml_cache()
+            parse = mocker.spy(config_module, "load")
+            limit = config_module._YAML_CACHE_SIZE
+            paths = [tmp_path / f"doc{index}.yaml" for index in range(limit + 1)]
+            for index, doc_path in enumerate(paths):
+                doc_path.write_text(f"index: {index}\n")
+                load_yaml(doc_path)
+            assert config_module._parse_yaml.cache_info().currsize == limit
+            assert load_yaml(paths[-1]) == {"index": limit}
+            assert parse.call_count == limit + 1
+            assert load_yaml(paths[0]) == {"index": 0}
+            assert parse.call_count == limit + 2
+
+
+# ============================================================================
+# X. Настройки производительности
+# ============================================================================
+
+
+class TestPerformanceConfig:
+    """Test PerformanceConfig and its loading through Config."""
+
+    @mark.unit
+    @mark.parametrize(
+        "kwargs, message",
+        [
+            ({"http_max_connections": 0}, "http_max_connections"),
+            ({"http_max_connections": 10001}, "http_max_connections"),
+            ({"http_max_keepalive_connections": -1}, "http_max_keepalive_connections"),
+            (
+                {"http_max_connections": 4, "http_max_keepalive_connections": 5},
+                "http_max_keepalive_connections",
+            ),
+            ({"http_keepalive_expiry": -1.0}, "http_keepalive_expiry"),
+            ({"max_concurrency": 0}, "max_concurrency"),
+            ({"log_sample_rate": 0}, "log_sample_rate"),
+        ],
+    )
+    @allure.title("TC-CONFIG-049: Performance settings are validated")
+    @allure.description(
+        "TC-CONFIG-049: Test PerformanceConfig defaults and validation."
+    )
+    def test_performance_validation(
+        self, valid_config_data: dict[str, int | str | float], kwargs, message
+    ) -> None:
+        """Test PerformanceConfig defaults and validation. TC-CONFIG-049"""
+        with allure.step("Defaults match previous client settings"):
+            config = Config(**valid_config_data)  # type: ignore[arg-type]
+            assert config.performance == PerformanceConfig(
+                http_max_connections=10,
+                http_max_keepalive_connections=5,
+                http_keepalive_expiry=5.0,
+                http2=False,
+                max_concurrency=20,
+                log_sample_rate=1,
+            )
+        with allure.step("Invalid value raises ValueError"):
+            with raises(ValueError, match=message):
+                PerformanceConfig(**kwargs)
+
+    @mark.unit
+    @allure.title("TC-CONFIG-050: Performance settings load from environment")
+    @allure.description(
+        "TC-CONFIG-050: Test from_env reads TMA_* performance variables."
+    )
+    def test_performance_from_env(
+        self, monkeypatch, mock_environment: dict[str, str]
+    ) -> None:
+        """Test from_env reads TMA_* performance variables. TC-CONFIG-050"""
+        assert Config.from_env().performance == PerformanceConfig()
+
+        monkeypatch.setenv("TMA_HTTP_MAX_CONNECTIONS", "200")
+        monkeypatch.setenv("TMA_HTTP_MAX_KEEPALIVE_CONNECTIONS", "50")
+        monkeypatch.setenv("TMA_HTTP_KEEPALIVE_EXPIRY", "30.5")
+        monkeypatch.setenv("TMA_HTTP2", "yes")
+        monkeypatch.setenv("TMA_MAX_CONCURRENCY", "100")
+        monkeypatch.setenv("TMA_LOG_SAMPLE_RATE", "500")
+        assert Config.from_env().performance == PerformanceConfig(
+            http_max_connections=200,
+            http_max_keepalive_connections=50,
+            http_keepalive_expiry=30.5,
+            http2=True,
+            max_concurrency=100,
+            log_sample_rate=500,
+        )
+
+        with allure.step("Invalid values raise ValueError"):
+            monkeypatch.setenv("TMA_HTTP2", "maybe")
+            with raises(ValueError, match="Invalid boolean value for TMA_HTTP2"):
+                Config.from_env()
+            monkeypatch.setenv("TMA_HTTP2", "off")
+            monkeypatch.setenv("TMA_MAX_CONCURRENCY", "0")
+            with raises(ValueError, match="max_concurrency must be between"):
+                Config.from_env()
+
+    @mark.unit
+    @allure.title("TC-CONFIG-051: Performance section loads from YAML")
+    @allure.description("TC-CONFIG-051: Test from_yaml reads the performance mapping.")
+    def test_performance_from_yaml(self, tmp_path) -> None:
+        """Test from_yaml reads the performance mapping. TC-CONFIG-051"""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            CONFIG_YAML + "performance:\n  http_max_connections: 64\n  http2: true\n"
+        )
+        config = Config.from_yaml(str(path))
+        assert config.performance == PerformanceConfig(
+            http_max_connections=64, http2=True
+        )
+
+        with allure.step("Empty section keeps defaults"):
+            path.write_text(CONFIG_YAML + "performance:\n")
+            assert Config.from_yaml(str(path)).performance == PerformanceConfig()
+
+        with allure.step("Unknown and invalid settings raise ValueError"):
+            path.write_text(CONFIG_YAML + "performance:\n  pool: 5\n")
+            with raises(ValueError, match="pool"):
+                Config.from_yaml(str(path))
+            path.write_text(CONFIG_YAML + "performance:\n  log_sample_rate: 0\n")
+            with raises(ValueError, match="log_sample_rate"):
+                Config.from_yaml(str(path))
+
+        with allure.step("Values are not coerced from strings"):
+            path.write_text(CONFIG_YAML + 'performance:\n  max_concurrency: "50"\n')
+            with raises(
+                ValueError, match=r"Expected `int`, got `str` - at `\$.max_concurrency`"
+            ):
+                Config.from_yaml(str(path))
+            path.write_text(CONFIG_YAML + 'performance:\n  http2: "no"\n')
+            with raises(
+                ValueError, match=r"Expected `bool`, got `str` - at `\$.http2`"
+            ):
+                Config.from_yaml(str(path))
+            path.write_text(CONFIG_YAML + "performance:\n  http_keepalive_expiry: 10\n")
+            assert Config.from_yaml(str(path)).performance.http_keepalive_expiry == 10.0
@@ -0,0 +1,189 @@
+"""
+Unit tests for scenario-wide deadline budgets.
+"""
+
+import asyncio
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+import allure
+import pytest
+from httpx import Response
+
+from tma_test_framework.clients.db_client import DBClient
+from tma_test_framework.clients.mtproto_client import UserTelegramClient
+from tma_test_framework.deadline import (
+    DeadlineExceeded,
+    current_deadline,
+    deadline,
+    effective_timeout,
+    remaining_time,
+)
+from tests.fixtures.miniapp_api import make_transport_api
+
+
+class SlowDBClient(DBClient):
+    """DBClient whose queries take a configurable time."""
+
+    delay = 0.0
+
+    async def connect(self) -> None:
+        self._is_connected = True
+
+    async def disconnect(self) -> None:
+        self._is_connected = False
+
+    async def execute_query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        await asyncio.sleep(self.delay)
+        return [{"ok": 1}]
+
+    async def execute_command(
+        self, command: str, params: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return 1
+
+    async def begin_transaction(self) -> None:
+        pass
+
+    async def commit_transaction(self) -> None:
+        pass
+
+    async def rollback_transaction(self) -> None:
+        pass
+
+
+class TestDeadlineContext:
+    """Test deadline() context manager."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-001: Timeouts shrink to remaining budget")
+    @allure.description(
+        "Test effective_timeout inside and outside deadline. TC-DEADLINE-001"
+    )
+    async def test_effective_timeout(self):
+        """Test effective_timeout inside and outside deadline. TC-DEADLINE-001"""
+        assert effective_timeout(30) == 30
+        assert remaining_time() is None
+        async with deadline(5) as active:
+            assert effective_timeout(30) <= 5
+            assert effective_timeout(1) == 1
+            assert effective_timeout(None) <= 5
+            with allure.step("Nested deadline does not extend outer one"):
+                async with deadline(60) as nested:
+                    assert current_deadline() is nested
+                    assert nested.expires_at == active.expires_at
+        assert remaining_time() is None
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-002: Block exceeding budget raises DeadlineExceeded")
+    @allure.description("Test deadline cancels slow block. TC-DEADLINE-002")
+    async def test_block_exceeds_budget(self):
+        """Test deadline cancels slow block. TC-DEADLINE-002"""
+        started = monotonic()
+        with pytest.raises(DeadlineExceeded, match="0.05s"):
+            async with deadline(0.05):
+                await asyncio.sleep(1)
+        assert monotonic() - started < 0.5
+        assert issubclass(DeadlineExceeded, TimeoutError)
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-003: Deadline propagates into concurrent tasks")
+    @allure.description("Test gathered tasks see the budget. TC-DEADLINE-003")
+    async def test_propagates_to_tasks(self):
+        """Test gathered tasks see the budget. TC-DEADLINE-003"""
+
+        async def read_budget() -> Optional[float]:
+            return remaining_time()
+
+        async with deadline(2):
+            budgets = await asyncio.gather(read_budget(), read_budget())
+        assert all(budget is not None and budget <= 2 for budget in budgets)
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-004: Non-positive deadline raises ValueError")
+    @allure.description("Test deadline(0) validation. TC-DEADLINE-004")
+    async def test_invalid_deadline(self):
+        """Test deadline(0) validation. TC-DEADLINE-004"""
+        with pytest.raises(ValueError, match="must be positive"):
+            async with deadline(0):
+                pass
+
+
+class TestClientsHonorDeadline:
+    """Test clients shrink their timeouts to the deadline budget."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-005: ApiClient request timeout shrinks to budget")
+    @allure.description(
+        "Test make_request passes remaining budget as timeout. TC-DEADLINE-005"
+    )
+    async def test_api_client_timeout_shrinks(self, valid_config):
+        """Test make_request passes remaining budget as timeout. TC-DEADLINE-005"""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"]["read"])
+            return Response(200, json={})
+
+        api = make_transport_api(valid_config, handler)
+        await api.make_request("v1/items/")
+        async with deadline(2):
+            await api.make_request("v1/items/")
+        await api.close()
+
+        assert timeouts[0] == valid_config.timeout
+        assert 0 < timeouts[1] <= 2
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-006: Slow ApiClient request raises DeadlineExceeded")
+    @allure.description("Test spent budget fails the request fast. TC-DEADLINE-006")
+    async def test_api_client_deadline_exceeded(self, valid_config):
+        """Test spent budget fails the request fast. TC-DEADLINE-006"""
+
+        async def handler(request):
+            await asyncio.sleep(1)
+            return Response(200)
+
+        api = make_transport_api(valid_config, handler)
+        started = monotonic()
+        with pytest.raises(DeadlineExceeded):
+            async with deadline(0.1):
+                await api.make_request("v1/items/")
+        assert monotonic() - started < 0.5
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-007: DBClient adapter calls honor deadline")
+    @allure.description(
+        "Test DBClient subclasses are bounded by budget. TC-DEADLINE-007"
+    )
+    async def test_db_client_honors_deadline(self, valid_config):
+        """Test DBClient subclasses are bounded by budget. TC-DEADLINE-007"""
+        db = SlowDBClient("https://example.com", valid_config)
+        with allure.step("Without deadline the query completes"):
+            db.delay = 0
+            assert await db.execute_query("SELECT 1") == [{"ok": 1}]
+        with allure.step("Inside deadline the slow query is cut"):
+            db.delay = 1
+            with pytest.raises(DeadlineExceeded):
+                async with deadline(0.05):
+                    await db.execute_query("SELECT 1")
+
+    @pytest.mark.asyncio
+    @allure.title("TC-DEADLINE-008: UserTelegramClient calls honor deadline")
+    @allure.description("Test slow MTProto call is bounded by budget. TC-DEADLINE-008")
+    async def test_telegram_client_honors_deadline(self, mocker, valid_config):
+        """Test slow MTProto call is bounded by budget. TC-DEADLINE-008"""
+        mocker.patch("tma_test_framework.clients.mtproto_client.StringSession")
+        mocker.patch("tma_test_framework.clients.mtproto_client.TelegramClient")
+        client = UserTelegramClient(valid_config)
+
+        async def slow_get_me():
+            await asyncio.sleep(1)
+
+        client.client.get_me = slow_get_me
+        with pytest.raises(DeadlineExceeded):
+            async with deadline(0.05):
+                await client.get_me()
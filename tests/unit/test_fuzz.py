@@ -0,0 +1,156 @@
+"""
+Unit tests for initData mutation fuzzing.
+"""
+
+import asyncio
+from itertools import islice
+
+import allure
+import pytest
+from httpx import Response
+
+from tma_test_framework.fuzz import (
+    MUTATIONS,
+    FuzzReport,
+    InitDataFuzzer,
+    generate_mutations,
+)
+from tma_test_framework.init_data import InitDataValidator
+from tests.fixtures.miniapp_api import make_transport_api
+
+BOT_TOKEN = "123456:TEST-TOKEN"
+
+
+def validating_handler(max_size: int = 16 * 1024, accept_all: bool = False):
+    """Create backend handler validating ``Authorization: tma <initData>``."""
+    validator = InitDataValidator(BOT_TOKEN, max_age=86400)
+
+    def handler(request):
+        init_data = request.headers.get("Authorization", "").removeprefix("tma ")
+        if len(init_data) > max_size:
+            return Response(431)
+        if accept_all or validator.validate(init_data).valid:
+            return Response(200, json={"ok": True})
+        return Response(401, json={"detail": "invalid initData"})
+
+    return handler
+
+
+class TestGenerateMutations:
+    """Test generate_mutations()."""
+
+    @allure.title("TC-FUZZ-001: Mutation classes are applied round-robin lazily")
+    @allure.description("Test generator order, limit and laziness. TC-FUZZ-001")
+    def test_round_robin(self):
+        """Test generator order, limit and laziness. TC-FUZZ-001"""
+        variants = list(generate_mutations(BOT_TOKEN, limit=2 * len(MUTATIONS)))
+        assert [v.name for v in variants] == list(MUTATIONS) * 2
+
+        with allure.step("Endless stream without limit"):
+            endless = generate_mutations(BOT_TOKEN, mutations=["bad_hash"])
+            assert len(list(islice(endless, 500))) == 500
+
+        with allure.step("Stream ends with users"):
+            assert len(list(generate_mutations(BOT_TOKEN, users=[1, 2, 3]))) == 3
+
+    @allure.title("TC-FUZZ-002: Expected outcomes match a correct validator")
+    @allure.description(
+        "Test every mutation class against InitDataValidator. TC-FUZZ-002"
+    )
+    def test_expectations_match_validator(self):
+        """Test every mutation class against InitDataValidator. TC-FUZZ-002"""
+        validator = InitDataValidator(BOT_TOKEN, max_age=86400)
+        for variant in generate_mutations(BOT_TOKEN, limit=3 * len(MUTATIONS), seed=1):
+            if variant.expect_valid is not None:
+                assert validator.validate(variant.init_data).valid is (
+                    variant.expect_valid
+                ), variant.name
+
+        with allure.step("Oversized user reaches requested size"):
+            (oversized,) = generate_mutations(
+                BOT_TOKEN, mutations=["oversized_user"], limit=1, oversized_bytes=8192
+            )
+            assert len(oversized.init_data) > 8192
+
+    @allure.title("TC-FUZZ-003: Unknown mutation class raises ValueError")
+    @allure.description("Test mutation class validation. TC-FUZZ-003")
+    def test_unknown_mutation(self):
+        """Test mutation class validation. TC-FUZZ-003"""
+        with pytest.raises(ValueError, match="Unknown mutation classes"):
+            generate_mutations(BOT_TOKEN, mutations=["nope"])
+
+
+class TestInitDataFuzzer:
+    """Test InitDataFuzzer."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-FUZZ-004: Correct backend has no unexpected outcomes")
+    @allure.description("Test fuzz run against validating backend. TC-FUZZ-004")
+    async def test_correct_backend(self, valid_config):
+        """Test fuzz run against validating backend. TC-FUZZ-004"""
+        in_flight = 0
+        max_in_flight = 0
+        handle = validating_handler()
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return handle(request)
+
+        api = make_transport_api(valid_config, handler)
+        fuzzer = InitDataFuzzer(api, "v1/me/", bot_token=BOT_TOKEN, concurrency=5)
+        report = await fuzzer.run(limit=3 * len(MUTATIONS))
+        await api.close()
+
+        assert report.sent == 3 * len(MUTATIONS)
+        assert set(report.mutations) == set(MUTATIONS)
+        assert report.unexpected == 0
+        report.assert_expected()
+        assert 1 < max_in_flight <= 5
+
+        with allure.step("Per-class tallies and latency"):
+            assert report.mutations["valid"].accepted == 3
+            assert report.mutations["bad_hash"].rejected == 3
+            assert report.mutations["oversized_user"].status_codes == {431: 3}
+            assert report.mutations["valid"].latency.count == 3
+            assert "bad_hash" in report.report()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-FUZZ-005: Backend accepting forged initData is reported")
+    @allure.description("Test fuzz run against broken backend. TC-FUZZ-005")
+    async def test_broken_backend(self, valid_config):
+        """Test fuzz run against broken backend. TC-FUZZ-005"""
+        api = make_transport_api(valid_config, validating_handler(accept_all=True))
+        fuzzer = InitDataFuzzer(api, "v1/me/", bot_token=BOT_TOKEN, concurrency=3)
+        report = await fuzzer.run(
+            mutations=generate_mutations(
+                BOT_TOKEN, mutations=["valid", "bad_hash", "duplicate_params"], limit=6
+            )
+        )
+        await api.close()
+
+        assert report.mutations["valid"].unexpected == 0
+        assert report.mutations["bad_hash"].unexpected == 2
+        assert report.mutations["bad_hash"].latency.errors == 2
+        with pytest.raises(AssertionError, match="bad_hash: 2 unexpected of 2"):
+            report.assert_expected()
+
+        with allure.step("Server errors count as failed"):
+            api = make_transport_api(valid_config, lambda request: Response(500))
+            report = await InitDataFuzzer(api, "v1/me/", bot_token=BOT_TOKEN).run(
+                limit=len(MUTATIONS)
+            )
+            await api.close()
+            assert report.unexpected == len(MUTATIONS)
+            assert isinstance(report, FuzzReport)
+
+    @allure.title("TC-FUZZ-006: Invalid concurrency raises ValueError")
+    @allure.description("Test InitDataFuzzer argument validation. TC-FUZZ-006")
+    def test_invalid_concurrency(self, valid_config):
+        """Test InitDataFuzzer argument validation. TC-FUZZ-006"""
+        api = make_transport_api(valid_config, validating_handler())
+        with pytest.raises(ValueError, match="concurrency"):
+            InitDataFuzzer(api, "v1/me/", bot_token=BOT_TOKEN, concurrency=0)
@@ -0,0 +1,187 @@
+"""
+Unit tests for the on-disk identity cache.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import allure
+import msgspec
+import pytest
+
+from tma_test_framework.clients.mtproto_client import UserInfo
+from tma_test_framework.identity_cache import (
+    IdentityCache,
+    default_cache_dir,
+    session_key,
+)
+
+
+def _put_from_worker(directory: str, config, user_id: int) -> None:
+    """Store identity from a separate process."""
+    IdentityCache(directory).put(config, UserInfo(id=user_id, first_name="Worker"))
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSessionKey:
+    """Test session_key()."""
+
+    @allure.title("TC-IDCACHE-001: Session key identifies the session")
+    @allure.description("Test session key derivation. TC-IDCACHE-001")
+    def test_session_key(self, valid_config, tmp_path):
+        """Test session key derivation. TC-IDCACHE-001"""
+        key = session_key(valid_config)
+        assert len(key) == 64
+        assert valid_config.session_string not in key
+        assert key == session_key(msgspec.structs.replace(valid_config))
+
+        with allure.step("Different session gives different key"):
+            other = msgspec.structs.replace(valid_config, session_string="other")
+            assert session_key(other) != key
+
+        with allure.step("Session file key follows path, not contents"):
+            session_file = tmp_path / "user.session"
+            session_file.write_bytes(b"first")
+            file_config = msgspec.structs.replace(
+                valid_config, session_string=None, session_file=str(tmp_path / "user")
+            )
+            first = session_key(file_config)
+            session_file.write_bytes(b"rewritten on connect")
+            assert session_key(file_config) == first
+            assert (
+                session_key(
+                    msgspec.structs.replace(file_config, session_file=str(session_file))
+                )
+                == first
+            )
+            other_path = msgspec.structs.replace(
+                file_config, session_file=str(tmp_path / "other")
+            )
+            assert session_key(other_path) != first
+            other_app = msgspec.structs.replace(
+                file_config, api_id=file_config.api_id + 1
+            )
+            assert session_key(other_app) != first
+
+    @allure.title("TC-IDCACHE-002: Default directory honors environment")
+    @allure.description("Test default_cache_dir(). TC-IDCACHE-002")
+    def test_default_cache_dir(self, monkeypatch, tmp_path):
+        """Test default_cache_dir(). TC-IDCACHE-002"""
+        monkeypatch.setenv("TMA_IDENTITY_CACHE_DIR", str(tmp_path))
+        assert default_cache_dir() == tmp_path
+        monkeypatch.delenv("TMA_IDENTITY_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "tma_test_framework" / "identities"
+
+
+class TestIdentityCache:
+    """Test IdentityCache."""
+
+    @allure.title("TC-IDCACHE-003: Stored identity round-trips without the session")
+    @allure.description("Test put() and get(). TC-IDCACHE-003")
+    def test_put_get(self, valid_config, tmp_path):
+        """Test put() and get(). TC-IDCACHE-003"""
+        cache = IdentityCache(tmp_path / "ids")
+        user = UserInfo(id=42, first_name="Cached", username="cached", is_premium=True)
+        assert cache.get(valid_config) is None
+
+        cache.put(valid_config, user)
+        assert cache.get(valid_config) == user
+
+        (entry,) = (tmp_path / "ids").iterdir()
+        assert valid_config.session_string.encode() not in entry.read_bytes()
+
+        with allure.step("Other sessions miss"):
+            other = msgspec.structs.replace(valid_config, session_string="other")
+            assert cache.get(other) is None
+
+    @allure.title("TC-IDCACHE-004: Expired and corrupted entries are misses")
+    @allure.description("Test TTL and corruption handling. TC-IDCACHE-004")
+    def test_ttl_and_corruption(self, valid_config, tmp_path):
+        """Test TTL and corruption handling. TC-IDCACHE-004"""
+        clock = Clock()
+        cache = IdentityCache(tmp_path, ttl=60, clock=clock)
+        cache.put(valid_config, UserInfo(id=1, first_name="A"))
+
+        clock.now += 60
+        assert cache.get(valid_config) is not None
+        clock.now += 1
+        assert cache.get(valid_config) is None
+        assert list(tmp_path.iterdir()) == []
+
+        with allure.step("Corrupted entry is removed"):
+            cache.put(valid_config, UserInfo(id=1, first_name="A"))
+            (entry,) = tmp_path.iterdir()
+            entry.write_bytes(b"{not json")
+            assert cache.get(valid_config) is None
+            assert not entry.exists()
+
+        with allure.step("ttl=None never expires"):
+            cache = IdentityCache(tmp_path, ttl=None, clock=clock)
+            cache.put(valid_config, UserInfo(id=1, first_name="A"))
+            clock.now += 10**9
+            assert cache.get(valid_config) is not None
+
+        with pytest.raises(ValueError, match="ttl must be positive"):
+            IdentityCache(tmp_path, ttl=0)
+
+    @allure.title("TC-IDCACHE-005: Invalidation removes one or all entries")
+    @allure.description("Test invalidate(). TC-IDCACHE-005")
+    def test_invalidate(self, valid_config, tmp_path):
+        """Test invalidate(). TC-IDCACHE-005"""
+        cache = IdentityCache(tmp_path / "ids")
+        assert cache.invalidate() == 0
+        other = msgspec.structs.replace(valid_config, session_string="other")
+        cache.put(valid_config, UserInfo(id=1, first_name="A"))
+        cache.put(other, UserInfo(id=2, first_name="B"))
+
+        assert cache.invalidate(valid_config) == 1
+        assert cache.invalidate(valid_config) == 0
+        assert cache.get(valid_config) is None
+        assert cache.get(other) is not None
+        assert cache.invalidate() == 1
+        assert cache.get(other) is None
+
+    @allure.title("TC-IDCACHE-007: Invalidating all entries keeps foreign files")
+    @allure.description("Test invalidate() only removes cache entries. TC-IDCACHE-007")
+    def test_invalidate_keeps_foreign_files(self, valid_config, tmp_path):
+        """Test invalidate() only removes cache entries. TC-IDCACHE-007"""
+        cache = IdentityCache(tmp_path)
+        cache.put(valid_config, UserInfo(id=1, first_name="A"))
+        foreign = tmp_path / "settings.json"
+        foreign.write_text("{}")
+        uppercase = tmp_path / f"{session_key(valid_config).upper()}.json"
+        uppercase.write_text("{}")
+
+        assert cache.invalidate() == 1
+        assert cache.get(valid_config) is None
+        assert foreign.read_text() == "{}"
+        assert uppercase.exists()
+
+    @allure.title("TC-IDCACHE-006: Entries written by other processes are shared")
+    @allure.description("Test cache shared across processes. TC-IDCACHE-006")
+    def test_shared_between_processes(self, valid_config, tmp_path):
+        """Test cache shared across processes. TC-IDCACHE-006"""
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(2, mp_context=context) as pool:
+            list(
+                pool.map(
+                    _put_from_worker,
+                    [str(tmp_path)] * 4,
+                    [valid_config] * 4,
+                    range(4),
+                )
+            )
+
+        cached = IdentityCache(tmp_path).get(valid_config)
+        assert cached is not None and cached.first_name == "Worker"
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
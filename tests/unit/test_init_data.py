@@ -0,0 +1,521 @@
+"""
+Unit tests for initData signing and validation.
+"""
+
+import hashlib
+import hmac
+import json
+from base64 import urlsafe_b64decode
+from urllib.parse import parse_qs, parse_qsl, quote
+
+import allure
+import pytest
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from tma_test_framework.init_data import (
+    TELEGRAM_PUBLIC_KEY,
+    Ed25519InitDataSigner,
+    BaseInitDataValidator,
+    Ed25519InitDataValidator,
+    build_third_party_check_string,
+    check_init_data_signature,
+    get_public_key,
+    InitDataSigner,
+    InitDataTemplate,
+    InitDataUser,
+    InitDataValidation,
+    InitDataValidator,
+    build_data_check_string,
+    check_init_data,
+    generate_init_data_batch,
+    get_signer,
+    parse_init_data,
+    to_init_data_user,
+)
+from tma_test_framework.clients.mtproto_client import UserInfo
+from tma_test_framework.utils import generate_telegram_init_data
+
+BOT_TOKEN = "123456:TEST-TOKEN"
+FIELDS = {"user": '{"id": 1}', "auth_date": "1700000000", "query_id": "AAE"}
+
+
+def reference_hash(bot_token: str, data_check_string: str) -> str:
+    """Compute initData hash as described in Telegram documentation."""
+    secret = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+    return hmac.new(secret, data_check_string.encode(), hashlib.sha256).hexdigest()
+
+
+class TestInitDataSigner:
+    """Test InitDataSigner."""
+
+    @allure.title("TC-INITDATA-001: Signer matches reference HMAC computation")
+    @allure.description("Test sign() equals Telegram's algorithm. TC-INITDATA-001")
+    def test_sign_matches_reference(self):
+        """Test sign() equals Telegram's algorithm. TC-INITDATA-001"""
+        check_string = build_data_check_string(FIELDS)
+        assert check_string == 'auth_date=1700000000\nquery_id=AAE\nuser={"id": 1}'
+        signer = InitDataSigner(BOT_TOKEN)
+
+        with allure.step("Repeated signatures reuse keyed HMAC state"):
+            for _ in range(3):
+                assert signer.sign(check_string) == reference_hash(
+                    BOT_TOKEN, check_string
+                )
+            assert signer.sign(check_string.encode()) == signer.sign_fields(FIELDS)
+
+    @allure.title("TC-INITDATA-002: verify() detects tampered data")
+    @allure.description("Test verify() for valid and tampered data. TC-INITDATA-002")
+    def test_verify(self):
+        """Test verify() for valid and tampered data. TC-INITDATA-002"""
+        signer = InitDataSigner(BOT_TOKEN)
+        check_string = build_data_check_string(FIELDS)
+        signature = signer.sign(check_string)
+        assert signer.verify(check_string, signature) is True
+        assert signer.verify(check_string + "x", signature) is False
+        assert InitDataSigner("other:token").verify(check_string, signature) is False
+
+    @allure.title("TC-INITDATA-003: Signers are cached per bot token")
+    @allure.description("Test get_signer() LRU cache. TC-INITDATA-003")
+    def test_get_signer_cached(self):
+        """Test get_signer() LRU cache. TC-INITDATA-003"""
+        assert get_signer(BOT_TOKEN) is get_signer(BOT_TOKEN)
+        assert get_signer(BOT_TOKEN) is not get_signer("other:token")
+        assert get_signer.cache_info().maxsize == 64
+
+    @allure.title("TC-INITDATA-004: Empty bot token is a valid key")
+    @allure.description("Test signer accepts an empty bot token. TC-INITDATA-004")
+    def test_empty_token(self):
+        """Test signer accepts an empty bot token. TC-INITDATA-004"""
+        signer = InitDataSigner("")
+        assert signer.verify("a=1", signer.sign("a=1"))
+        init_data = generate_telegram_init_data(bot_token="")
+        assert isinstance(init_data, str)
+        assert check_init_data(init_data, "").valid
+
+    @pytest.mark.asyncio
+    @allure.title("TC-INITDATA-005: Generated initData validates with ApiClient")
+    @allure.description(
+        "Test utils generator and ApiClient validator share signer. TC-INITDATA-005"
+    )
+    async def test_generate_and_validate(self, miniapp_api_with_config):
+        """Test utils generator and ApiClient validator share signer. TC-INITDATA-005"""
+        init_data = generate_telegram_init_data(user_id=42, bot_token=BOT_TOKEN)
+        assert await miniapp_api_with_config.validate_init_data(init_data, BOT_TOKEN)
+        assert not await miniapp_api_with_config.validate_init_data(
+            init_data, "other:token"
+        )
+
+
+class TestInitDataBatch:
+    """Test bulk initData generation."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-INITDATA-006: Batch initData validates with ApiClient")
+    @allure.description(
+        "Test generate_init_data_batch() output is signed correctly. TC-INITDATA-006"
+    )
+    async def test_batch_validates(self, miniapp_api_with_config):
+        """Test generate_init_data_batch() output is signed correctly. TC-INITDATA-006"""
+        with allure.step("Generate initData for 10 users in chunks of 3"):
+            batch = list(
+                generate_init_data_batch(
+                    range(1, 11), BOT_TOKEN, auth_date=1700000000, chunk_size=3
+                )
+            )
+        assert len(batch) == 10
+
+        with allure.step("Every string validates and keeps input order"):
+            for user_id, init_data in enumerate(batch, start=1):
+                assert await miniapp_api_with_config.validate_init_data(
+                    init_data, BOT_TOKEN
+                )
+                fields = dict(parse_qsl(init_data))
+                assert fields["auth_date"] == "1700000000"
+                assert json.loads(fields["user"])["id"] == user_id
+
+        with allure.step("Non-ASCII and reserved characters are quoted"):
+            user = {"id": 1, "first_name": "Имя Ω", "last_name": "a&b=c+d"}
+            (init_data,) = generate_init_data_batch([user], BOT_TOKEN)
+            assert await miniapp_api_with_config.validate_init_data(
+                init_data, BOT_TOKEN
+            )
+            decoded = json.loads(dict(parse_qsl(init_data))["user"])
+            assert decoded["first_name"] == "Имя Ω"
+            assert decoded["last_name"] == "a&b=c+d"
+
+    @allure.title("TC-INITDATA-007: Batch accepts ids, mappings and UserInfo")
+    @allure.description("Test user conversion of batch inputs. TC-INITDATA-007")
+    def test_user_conversion(self):
+        """Test user conversion of batch inputs. TC-INITDATA-007"""
+        assert to_init_data_user(7) == InitDataUser(
+            id=7, first_name="User7", username="user_7"
+        )
+        assert to_init_data_user(
+            {"id": 8, "first_name": "Ann", "is_premium": True}
+        ) == InitDataUser(id=8, first_name="Ann", is_premium=True)
+        info = UserInfo(id=9, first_name="Bob", username=None, is_premium=True)
+        assert to_init_data_user(info) == InitDataUser(
+            id=9, first_name="Bob", is_premium=True
+        )
+
+        with allure.step("Invalid users raise ValueError"):
+            with pytest.raises(ValueError, match="Invalid initData user"):
+                to_init_data_user({"id": "x"})
+            with pytest.raises(ValueError, match="Unsupported initData user"):
+                to_init_data_user("user")
+
+    @allure.title("TC-INITDATA-008: Invalid batch arguments raise ValueError")
+    @allure.description("Test batch argument validation is eager. TC-INITDATA-008")
+    def test_invalid_arguments(self):
+        """Test batch argument validation is eager. TC-INITDATA-008"""
+        with pytest.raises(ValueError, match="chunk_size"):
+            generate_init_data_batch([1], BOT_TOKEN, chunk_size=0)
+        with pytest.raises(ValueError, match="processes"):
+            generate_init_data_batch([1], BOT_TOKEN, processes=0)
+
+    @allure.title("TC-INITDATA-009: Process pool batch matches serial batch")
+    @allure.description(
+        "Test generate_init_data_batch() with processes. TC-INITDATA-009"
+    )
+    def test_process_pool(self):
+        """Test generate_init_data_batch() with processes. TC-INITDATA-009"""
+        users = ({"id": i, "first_name": f"U{i}"} for i in range(50))
+        serial = list(
+            generate_init_data_batch(range(50), BOT_TOKEN, auth_date=1700000000)
+        )
+        pooled = list(
+            generate_init_data_batch(
+                users, BOT_TOKEN, auth_date=1700000000, processes=2, chunk_size=7
+            )
+        )
+        assert len(pooled) == 50
+        assert [json.loads(dict(parse_qsl(s))["user"])["id"] for s in pooled] == list(
+            range(50)
+        )
+        assert pooled[0] != serial[0]
+
+        with allure.step("Signatures made in worker processes verify"):
+            signer = get_signer(BOT_TOKEN)
+            for init_data in pooled:
+                fields = dict(parse_qsl(init_data))
+                received_hash = fields.pop("hash")
+                assert signer.verify(build_data_check_string(fields), received_hash)
+
+
+class TestInitDataValidator:
+    """Test synchronous initData validation."""
+
+    @pytest.mark.parametrize(
+        "init_data",
+        [
+            "user=%7B%22id%22%3A1%7D&auth_date=1&hash=abc",
+            "a=1&a=2&b=x+y&c=%2B%26&empty=&flag&hash=h",
+            "na%6De=v&plain=no-escapes",
+        ],
+    )
+    @allure.title("TC-INITDATA-010: parse_init_data matches parse_qs")
+    @allure.description("Test one-pass parser parity with parse_qs. TC-INITDATA-010")
+    def test_parse_matches_parse_qs(self, init_data):
+        """Test one-pass parser parity with parse_qs. TC-INITDATA-010"""
+        expected = {key: values[0] for key, values in parse_qs(init_data).items()}
+        assert parse_init_data(init_data) == expected
+
+    @allure.title("TC-INITDATA-011: Validation returns structured results")
+    @allure.description("Test validate() results and reasons. TC-INITDATA-011")
+    def test_validate_results(self):
+        """Test validate() results and reasons. TC-INITDATA-011"""
+        validator = InitDataValidator(BOT_TOKEN)
+        (init_data,) = generate_init_data_batch([1], BOT_TOKEN, auth_date=1700000000)
+
+        with allure.step("Valid initData"):
+            result = validator.validate(init_data)
+            assert result.valid and bool(result)
+            assert result.reason is None
+            assert result.auth_date == 1700000000
+            assert set(result.fields) == {"user", "auth_date"}
+
+        with allure.step("Invalid initData reasons"):
+            assert validator.validate("") == InitDataValidation(
+                valid=False, reason="empty"
+            )
+            assert validator.validate("auth_date=1").reason == "missing_hash"
+            tampered = init_data.replace("auth_date=1700000000", "auth_date=1700000001")
+            result = validator.validate(tampered)
+            assert not result
+            assert result.reason == "invalid_hash"
+            assert InitDataValidator("other:token").validate(init_data).reason == (
+                "invalid_hash"
+            )
+
+    @allure.title("TC-INITDATA-012: max_age enforces auth_date freshness")
+    @allure.description("Test auth_date freshness check. TC-INITDATA-012")
+    def test_max_age(self):
+        """Test auth_date freshness check. TC-INITDATA-012"""
+        (init_data,) = generate_init_data_batch([1], BOT_TOKEN, auth_date=1000)
+        fresh = InitDataValidator(BOT_TOKEN, max_age=60, clock=lambda: 1060)
+        stale = InitDataValidator(BOT_TOKEN, max_age=60, clock=lambda: 1061)
+        assert fresh.validate(init_data).valid
+        result = stale.validate(init_data)
+        assert result.reason == "expired"
+        assert result.auth_date == 1000
+
+        with allure.step("Signed initData without auth_date fails freshness check"):
+            fields = {"user": '{"id":1}'}
+            init_data = f"user=%7B%22id%22%3A1%7D&hash={get_signer(BOT_TOKEN).sign_fields(fields)}"
+            assert InitDataValidator(BOT_TOKEN).validate(init_data).valid
+            assert fresh.validate(init_data).reason == "missing_auth_date"
+
+    @allure.title("TC-INITDATA-021: Non-ASCII digits are not an auth_date")
+    @allure.description("Test auth_date accepts ASCII digits only. TC-INITDATA-021")
+    @pytest.mark.parametrize(
+        "auth_date",
+        ["\u00b2", "\u0661\u0667\u0660\u0660\u0660\u0660\u0660\u0660\u0660\u0660"],
+        ids=["superscript", "arabic_indic"],
+    )
+    def test_non_ascii_auth_date(self, auth_date):
+        """Test auth_date accepts ASCII digits only. TC-INITDATA-021"""
+        validator = InitDataValidator(BOT_TOKEN, max_age=60, clock=lambda: 1060)
+        with allure.step("Unsigned initData is rejected without exception"):
+            result = validator.validate(f"auth_date={quote(auth_date)}&hash=ab")
+            assert result.reason == "invalid_hash"
+            assert result.auth_date is None
+        with allure.step("Signed initData has no usable auth_date"):
+            fields = {"auth_date": auth_date}
+            init_data = (
+                f"auth_date={quote(auth_date)}"
+                f"&hash={get_signer(BOT_TOKEN).sign_fields(fields)}"
+            )
+            result = validator.validate(init_data)
+            assert result.reason == "missing_auth_date"
+            assert result.auth_date is None
+
+        with allure.step("Negative max_age raises ValueError"):
+            with pytest.raises(ValueError, match="max_age"):
+                InitDataValidator(BOT_TOKEN, max_age=-1)
+
+    @allure.title("TC-INITDATA-013: validate_many validates corpus in order")
+    @allure.description("Test bulk validation of generated corpus. TC-INITDATA-013")
+    def test_validate_many(self):
+        """Test bulk validation of generated corpus. TC-INITDATA-013"""
+        corpus = list(generate_init_data_batch(range(100), BOT_TOKEN))
+        corpus[10] = corpus[10][:-1] + ("0" if corpus[10][-1] != "0" else "1")
+        results = list(InitDataValidator(BOT_TOKEN).validate_many(corpus))
+        assert len(results) == 100
+        assert [i for i, result in enumerate(results) if not result] == [10]
+        assert check_init_data(corpus[0], BOT_TOKEN).valid
+
+    @pytest.mark.asyncio
+    @allure.title("TC-INITDATA-014: ApiClient validator honors max_age")
+    @allure.description(
+        "Test ApiClient.validate_init_data delegates to validator. TC-INITDATA-014"
+    )
+    async def test_api_client_max_age(self, miniapp_api_with_config):
+        """Test ApiClient.validate_init_data delegates to validator. TC-INITDATA-014"""
+        (init_data,) = generate_init_data_batch([1], BOT_TOKEN, auth_date=1000)
+        assert await miniapp_api_with_config.validate_init_data(init_data, BOT_TOKEN)
+        assert not await miniapp_api_with_config.validate_init_data(
+            init_data, BOT_TOKEN, max_age=3600
+        )
+
+
+class TestEd25519InitData:
+    """Test third-party (Ed25519) initData signatures."""
+
+    @allure.title("TC-INITDATA-015: Ed25519 signature covers bot ID and fields")
+    @allure.description("Test third-party signature format. TC-INITDATA-015")
+    def test_signature_format(self):
+        """Test third-party signature format. TC-INITDATA-015"""
+        private_key = Ed25519PrivateKey.generate()
+        signer = Ed25519InitDataSigner(private_key)
+        init_data = generate_telegram_init_data(
+            user_id=42, bot_token=BOT_TOKEN, ed25519_signer=signer
+        )
+        fields = dict(parse_qsl(init_data))
+
+        with allure.step("Signature is unpadded base64url over documented string"):
+            check_string = build_third_party_check_string(123456, fields)
+            assert check_string == (
+                f"123456:WebAppData\nauth_date={fields['auth_date']}\n"
+                f"user={fields['user']}"
+            )
+            assert "=" not in fields["signature"]
+            signature = urlsafe_b64decode(fields["signature"] + "==")
+            private_key.public_key().verify(signature, check_string.encode())
+
+        with allure.step("HMAC hash covers the signature field"):
+            assert check_init_data(init_data, BOT_TOKEN).valid
+            assert "signature" in check_init_data(init_data, BOT_TOKEN).fields
+
+        with allure.step("Seed recreates the same signer"):
+            assert Ed25519InitDataSigner(signer.seed).public_key_hex == (
+                signer.public_key_hex
+            )
+
+    @allure.title("TC-INITDATA-016: Ed25519 validator reports signature failures")
+    @allure.description("Test Ed25519InitDataValidator reasons. TC-INITDATA-016")
+    def test_validator(self):
+        """Test Ed25519InitDataValidator reasons. TC-INITDATA-016"""
+        signer = Ed25519InitDataSigner()
+        init_data = generate_telegram_init_data(
+            bot_token=BOT_TOKEN, ed25519_signer=signer
+        )
+        validator = Ed25519InitDataValidator(123456, signer.public_key_hex)
+
+        result = validator.validate(init_data)
+        assert result.valid
+        assert "signature" not in result.fields and "hash" not in result.fields
+
+        with allure.step("Wrong bot ID, key or tampered data are rejected"):
+            assert (
+                check_init_data_signature(
+                    init_data, 654321, signer.public_key_hex
+                ).reason
+                == "invalid_signature"
+            )
+            assert check_init_data_signature(init_data, 123456).reason == (
+                "invalid_signature"
+            )
+            tampered = init_data.replace("signature=", "signature=A")
+            assert validator.validate(tampered).reason == "invalid_signature"
+
+        with allure.step("HMAC-only initData has no signature"):
+            plain = generate_telegram_init_data(bot_token=BOT_TOKEN)
+            assert validator.validate(plain).reason == "missing_signature"
+
+        with allure.step("Public keys are parsed once"):
+            assert get_public_key(TELEGRAM_PUBLIC_KEY) is get_public_key(
+                TELEGRAM_PUBLIC_KEY
+            )
+            with pytest.raises(ValueError):
+                Ed25519InitDataValidator(1, "00")
+
+    @pytest.mark.parametrize("processes", [None, 2])
+    @allure.title("TC-INITDATA-017: Batch generation adds Ed25519 signatures")
+    @allure.description("Test generate_init_data_batch() with Ed25519. TC-INITDATA-017")
+    def test_batch(self, processes):
+        """Test generate_init_data_batch() with Ed25519. TC-INITDATA-017"""
+        signer = Ed25519InitDataSigner()
+        batch = list(
+            generate_init_data_batch(
+                range(20), BOT_TOKEN, processes=processes, ed25519_signer=signer
+            )
+        )
+        validator = Ed25519InitDataValidator(123456, signer.public_key_hex)
+        assert all(validator.validate_many(batch))
+        assert all(InitDataValidator(BOT_TOKEN).validate_many(batch))
+
+        with allure.step("Bot token without bot ID raises ValueError"):
+            with pytest.raises(ValueError, match="bot ID"):
+                generate_init_data_batch([1], "token", ed25519_signer=signer)
+
+    @allure.title("TC-INITDATA-022: Validators share parsing and freshness checks")
+    @allure.description(
+        "Test both validators extend BaseInitDataValidator. TC-INITDATA-022"
+    )
+    def test_shared_base(self):
+        """Test both validators extend BaseInitDataValidator. TC-INITDATA-022"""
+        signer = Ed25519InitDataSigner()
+        init_data = generate_telegram_init_data(
+            bot_token=BOT_TOKEN, ed25519_signer=signer
+        )
+        auth_date = int(parse_qs(init_data)["auth_date"][0])
+        validators = [
+            InitDataValidator(BOT_TOKEN, max_age=60, clock=lambda: auth_date + 61),
+            Ed25519InitDataValidator(
+                123456, signer.public_key_hex, max_age=60, clock=lambda: auth_date + 61
+            ),
+        ]
+        for validator in validators:
+            assert isinstance(validator, BaseInitDataValidator)
+            result = validator.validate(init_data)
+            assert result.reason == "expired"
+            assert result.auth_date == auth_date
+            assert "hash" not in result.fields
+
+        assert "signature" not in validators[1].validate(init_data).fields
+        assert not isinstance(validators[1], InitDataValidator)
+        with pytest.raises(ValueError, match="max_age"):
+            Ed25519InitDataValidator(123456, signer.public_key_hex, max_age=-1)
+        with pytest.raises(NotImplementedError):
+            BaseInitDataValidator().validate(init_data)
+
+    @pytest.mark.asyncio
+    @allure.title("TC-INITDATA-018: ApiClient validates Ed25519 signature")
+    @allure.description(
+        "Test ApiClient.validate_init_data_signature(). TC-INITDATA-018"
+    )
+    async def test_api_client(self, miniapp_api_with_config, caplog):
+        """Test ApiClient.validate_init_data_signature(). TC-INITDATA-018"""
+        signer = Ed25519InitDataSigner()
+        init_data = generate_telegram_init_data(
+            bot_token=BOT_TOKEN, ed25519_signer=signer
+        )
+        api = miniapp_api_with_config
+        with caplog.at_level("DEBUG"):
+            assert await api.validate_init_data_signature(
+                init_data, 123456, signer.public_key_hex
+            )
+            assert not await api.validate_init_data_signature(init_data, 123456)
+            assert not await api.validate_init_data_signature(init_data, 123456, "zz")
+        assert "InitData signature validation: valid" in caplog.text
+        assert "InitData signature validation: invalid (invalid_signature)" in (
+            caplog.text
+        )
+        assert "InitData signature validation failed" in caplog.text
+
+
+class TestInitDataTemplate:
+    """Test InitDataTemplate."""
+
+    @allure.title("TC-INITDATA-019: Template re-signs with fresh fields")
+    @allure.description("Test InitDataTemplate.sign() output. TC-INITDATA-019")
+    def test_sign(self):
+        """Test InitDataTemplate.sign() output. TC-INITDATA-019"""
+        user = InitDataUser(id=5, first_name="Ann", last_name="B C", username="ann")
+        template = InitDataTemplate(user, BOT_TOKEN, query_id="AAE1", start_param="s 1")
+
+        with allure.step("Fields match batch generation and validate"):
+            init_data = template.sign(auth_date=1700000000)
+            result = check_init_data(init_data, BOT_TOKEN)
+            assert result.valid
+            assert result.fields == {
+                "query_id": "AAE1",
+                "user": dict(
+                    parse_qsl(
+                        next(
+                            generate_init_data_batch(
+                                [user], BOT_TOKEN, auth_date=1700000000
+                            )
+                        )
+                    )
+                )["user"],
+                "auth_date": "1700000000",
+                "start_param": "s 1",
+            }
+
+        with allure.step("Overrides and fresh auth_date"):
+            refreshed = template.sign(auth_date=1700000060, start_param="other")
+            fields = check_init_data(refreshed, BOT_TOKEN).fields
+            assert fields["auth_date"] == "1700000060"
+            assert fields["start_param"] == "other"
+            plain = InitDataTemplate(user, BOT_TOKEN).sign()
+            assert set(check_init_data(plain, BOT_TOKEN).fields) == {
+                "user",
+                "auth_date",
+            }
+
+    @allure.title("TC-INITDATA-020: Template adds Ed25519 signature")
+    @allure.description("Test InitDataTemplate with ed25519_signer. TC-INITDATA-020")
+    def test_ed25519(self):
+        """Test InitDataTemplate with ed25519_signer. TC-INITDATA-020"""
+        signer = Ed25519InitDataSigner()
+        template = InitDataTemplate(
+            7, BOT_TOKEN, query_id="AAE2", start_param="ref", ed25519_signer=signer
+        )
+        for auth_date in (1700000000, 1700000001):
+            init_data = template.sign(auth_date=auth_date)
+            assert check_init_data(init_data, BOT_TOKEN).valid
+            assert check_init_data_signature(
+                init_data, 123456, signer.public_key_hex
+            ).valid
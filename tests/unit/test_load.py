@@ -0,0 +1,194 @@
+"""
+Unit tests for multi-process load generation.
+"""
+
+import random
+
+import allure
+import pytest
+
+from tma_test_framework.load import (
+    EndpointLoadStats,
+    LatencyHistogram,
+    LoadReport,
+    LoadRunner,
+    LoadSnapshot,
+    _snapshot_decoder,
+    _snapshot_encoder,
+)
+from tma_test_framework.scenario import Scenario
+from tma_test_framework.slo import assert_slos
+from tma_test_framework.stats import percentile
+from tests.fixtures.http_server import start_threaded_http_server
+
+
+async def fetch_items(api, user: int) -> None:
+    """Virtual user fetching items (module level for worker processes)."""
+    await api.make_request("v1/items/")
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    @allure.title("TC-LOAD-001: Histogram percentiles within 1% of exact values")
+    @allure.description("Test histogram accuracy on random latencies. TC-LOAD-001")
+    def test_percentile_accuracy(self):
+        """Test histogram accuracy on random latencies. TC-LOAD-001"""
+        rng = random.Random(7)
+        latencies = [rng.lognormvariate(-3, 0.8) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for latency in latencies:
+            histogram.record(latency)
+        latencies.sort()
+
+        for q in (50, 90, 95, 99):
+            assert histogram.percentile(q) == pytest.approx(
+                percentile(latencies, q), rel=0.01
+            )
+        assert histogram.percentile(100) == latencies[-1]
+        assert histogram.percentile(0) == latencies[0]
+        assert len(histogram.buckets) < 1000
+
+    @allure.title("TC-LOAD-002: Merged histograms equal a single histogram")
+    @allure.description("Test merge() of histograms from workers. TC-LOAD-002")
+    def test_merge(self):
+        """Test merge() of histograms from workers. TC-LOAD-002"""
+        combined, first, second = (
+            LatencyHistogram(),
+            LatencyHistogram(),
+            LatencyHistogram(),
+        )
+        for index in range(1, 200):
+            latency = index / 1000
+            combined.record(latency)
+            (first if index % 2 else second).record(latency)
+        first.merge(second)
+        first.merge(LatencyHistogram())
+        assert first.buckets == combined.buckets
+        assert (first.count, first.min, first.max) == (199, 0.001, 0.199)
+        assert first.total == pytest.approx(combined.total)
+
+    @allure.title("TC-LOAD-003: Snapshots round-trip through msgpack")
+    @allure.description("Test compact snapshot encoding. TC-LOAD-003")
+    def test_snapshot_roundtrip(self):
+        """Test compact snapshot encoding. TC-LOAD-003"""
+        endpoint = EndpointLoadStats(key="GET v1/items/")
+        endpoint.record(0.1, error=False, at=1000.0)
+        endpoint.record(None, error=True, at=1000.5)
+        snapshot = LoadSnapshot(
+            worker=1, endpoints={endpoint.key: endpoint}, final=True
+        )
+
+        decoded = _snapshot_decoder.decode(_snapshot_encoder.encode(snapshot))
+        assert decoded == snapshot
+
+
+class TestLoadReport:
+    """Test LoadReport aggregation."""
+
+    @allure.title("TC-LOAD-004: Report merges worker snapshots and supports SLOs")
+    @allure.description("Test merge() and assert_slos on LoadReport. TC-LOAD-004")
+    def test_merge_and_slos(self):
+        """Test merge() and assert_slos on LoadReport. TC-LOAD-004"""
+        report = LoadReport()
+        for worker in range(3):
+            endpoint = EndpointLoadStats(key="GET v1/items/")
+            for index in range(100):
+                endpoint.record(0.05, error=index == 0, at=1000.0 + index / 100)
+            report.merge(
+                LoadSnapshot(
+                    worker=worker, endpoints={endpoint.key: endpoint}, iterations=100
+                )
+            )
+
+        assert report["GET v1/items/"].count == 300
+        assert report.iterations == 300
+        assert_slos(report, "p95 < 60ms", "error_rate < 2%")
+        with pytest.raises(AssertionError, match="error_rate < 0.500%"):
+            assert_slos(report, "error rate < 0.5%")
+        assert "GET v1/items/: count=300 errors=3" in report.report()
+
+
+class TestLoadRunner:
+    """Test LoadRunner."""
+
+    @allure.title("TC-LOAD-005: Invalid runner configuration raises ValueError")
+    @allure.description("Test LoadRunner argument validation. TC-LOAD-005")
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"user": fetch_items, "scenario": object()},
+            {"user": fetch_items, "users_per_process": 0},
+            {"user": fetch_items, "duration": 0},
+            {"user": fetch_items, "processes": 0},
+            {"user": fetch_items, "report_interval": 0},
+            {"user": fetch_items, "report_interval": -1.0},
+        ],
+    )
+    def test_invalid_arguments(self, valid_config, kwargs):
+        """Test LoadRunner argument validation. TC-LOAD-005"""
+        with pytest.raises(ValueError):
+            LoadRunner("http://127.0.0.1", valid_config, **kwargs)
+
+    @pytest.mark.slow
+    @allure.title("TC-LOAD-006: Worker processes run scenario and user functions")
+    @allure.description(
+        "Test multi-process run merges statistics of all workers. TC-LOAD-006"
+    )
+    @pytest.mark.parametrize("target", ["scenario", "user"])
+    def test_run(self, valid_config, target):
+        """Test multi-process run merges statistics of all workers. TC-LOAD-006"""
+        server = start_threaded_http_server()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        if target == "scenario":
+            kwargs = {
+                "scenario": Scenario.from_dict(
+                    {
+                        "name": "items",
+                        "steps": [
+                            {"request": {"endpoint": "v1/items/"}},
+                            {
+                                "request": {"endpoint": "v1/missing"},
+                                "assert": {"status": 200},
+                            },
+                        ],
+                    }
+                )
+            }
+        else:
+            kwargs = {"user": fetch_items}
+        snapshots = []
+        try:
+            with allure.step("Run 2 processes x 3 users x 4 iterations"):
+                report = LoadRunner(
+                    url,
+                    valid_config,
+                    processes=2,
+                    users_per_process=3,
+                    iterations=4,
+                    record_results=target == "user",
+                    **kwargs,
+                ).run(on_snapshot=snapshots.append)
+        finally:
+            server.shutdown()
+
+        with allure.step("Verify merged statistics"):
+            assert report.workers == 2
+            assert report.iterations == 24
+            assert report["GET v1/items/"].count == 24
+            assert report["GET v1/items/"].histogram.count == 24
+            assert len(snapshots) >= 2
+            if target == "scenario":
+                assert report["GET v1/missing"].errors == 24
+                assert report.user_failures == 24
+                assert report.records == []
+            else:
+                assert report.user_failures == 0
+
+        if target == "user":
+            with allure.step("Verify per-request records of all workers"):
+                assert len(report.records) == 24
+                assert {r.endpoint for r in report.records} == {"v1/items/"}
+                assert all(r.status_code == 200 for r in report.records)
+                assert all(r.body is None for r in report.records)
@@ -0,0 +1,56 @@
+"""
+Unit tests for logging setup.
+"""
+
+import io
+
+import allure
+from loguru import logger
+
+from tma_test_framework.log import configure_logging
+
+
+class TestConfigureLogging:
+    """Test configure_logging."""
+
+    @allure.title("TC-LOG-001: configure_logging honors Config.log_level")
+    @allure.description("Test records below Config.log_level are dropped. TC-LOG-001")
+    def test_configure_logging_level(self, valid_config):
+        """Test records below Config.log_level are dropped. TC-LOG-001"""
+        stream = io.StringIO()
+        config = valid_config.__class__(
+            **{
+                field: getattr(valid_config, field)
+                for field in valid_config.__struct_fields__
+                if field != "log_level"
+            },
+            log_level="WARNING",
+        )
+        with allure.step("Add synchronous sink at WARNING level"):
+            handler_id = configure_logging(
+                config, sink=stream, enqueue=False, replace_existing=False
+            )
+        try:
+            logger.info("hidden {}", "message")
+            logger.warning("visible {}", "message")
+        finally:
+            logger.remove(handler_id)
+
+        with allure.step("Verify only WARNING record was written"):
+            assert "visible message" in stream.getvalue()
+            assert "hidden message" not in stream.getvalue()
+
+    @allure.title("TC-LOG-002: configure_logging with enqueue sink")
+    @allure.description("Test enqueued records are flushed by complete(). TC-LOG-002")
+    def test_configure_logging_enqueue(self, valid_config):
+        """Test enqueued records are flushed by complete(). TC-LOG-002"""
+        stream = io.StringIO()
+        handler_id = configure_logging(
+            valid_config, sink=stream, enqueue=True, replace_existing=False
+        )
+        try:
+            logger.info("queued message")
+            logger.complete()
+        finally:
+            logger.remove(handler_id)
+        assert "queued message" in stream.getvalue()
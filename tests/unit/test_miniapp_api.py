@@ -2,16 +2,29 @@
 Unit tests for ApiClient.
 """
 
+import asyncio
+import json
 from urllib.parse import parse_qs, urlencode
 
 import allure
+import msgspec
 import pytest
-from httpx import RequestError, TimeoutException
+from httpx import RequestError, Response, TimeoutException
 
 from tma_test_framework.clients.api_client import ApiClient
 from tma_test_framework.clients.base_client import BaseClient
-from tma_test_framework.clients.models import ApiResult
-from tests.fixtures.miniapp_api import generate_valid_init_data
+from tma_test_framework.clients.models import (
+    ApiResult,
+    ErrorCategory,
+    ProvisioningError,
+)
+from tma_test_framework.clients.mtproto_client import UserInfo
+from tma_test_framework.clients.network import CachingNetworkBackend
+from tma_test_framework.config import PerformanceConfig
+from tma_test_framework.fuzz import InitDataFuzzer
+from tma_test_framework.identity_cache import IdentityCache
+from tma_test_framework.init_data import check_init_data
+from tests.fixtures.miniapp_api import generate_valid_init_data, make_transport_api
 
 
 # ============================================================================
@@ -103,6 +116,57 @@ class TestApiClientInit:
         with allure.step("Verify max_connections is 10"):
             assert limits.max_connections == 10
 
+    @allure.title("TC-API-070: ApiClient honors performance settings")
+    @allure.description(
+        "Test ApiClient applies config.performance to pool, HTTP/2 and logging. TC-API-070"
+    )
+    def test_init_honors_performance_config(
+        self, mocker, valid_config, mock_httpx_client
+    ):
+        """Test ApiClient applies config.performance to pool, HTTP/2 and logging. TC-API-070"""
+        config = msgspec.structs.replace(
+            valid_config,
+            performance=PerformanceConfig(
+                http_max_connections=64,
+                http_max_keepalive_connections=16,
+                http_keepalive_expiry=30.0,
+                http2=True,
+                max_concurrency=7,
+                log_sample_rate=50,
+            ),
+        )
+        with allure.step("Limits and HTTP/2 are passed to AsyncClient"):
+            mock_client_class = mocker.patch(
+                "tma_test_framework.clients.api_client.AsyncClient",
+                return_value=mock_httpx_client,
+            )
+            api = ApiClient("https://example.com/app", config)
+            call_kwargs = mock_client_class.call_args[1]
+            assert call_kwargs["http2"] is True
+            limits = call_kwargs["limits"]
+            assert limits.max_connections == 64
+            assert limits.max_keepalive_connections == 16
+            assert limits.keepalive_expiry == 30.0
+
+        with allure.step("Log sampling and concurrency defaults follow config"):
+            assert api._log_sample_rate == 50
+            assert InitDataFuzzer(api, "v1/me/", "token").concurrency == 7
+            mocker.stopall()
+
+        with allure.step("Network backend pool uses the same limits"):
+            config = msgspec.structs.replace(
+                config,
+                performance=msgspec.structs.replace(config.performance, http2=False),
+            )
+            api = ApiClient(
+                "https://example.com/app",
+                config,
+                network_backend=CachingNetworkBackend(),
+            )
+            pool = api.client._transport._pool
+            assert pool._max_connections == 64
+            assert pool._max_keepalive_connections == 16
+
 
 class TestApiClientClose:
     """Test ApiClient close method."""
@@ -343,9 +407,7 @@ class TestApiClientValidateInitData:
             init_data, bot_token = valid_init_data_and_token
 
         with allure.step("Mock compare_digest function"):
-            mock_compare = mocker.patch(
-                "tma_test_framework.clients.api_client.compare_digest"
-            )
+            mock_compare = mocker.patch("tma_test_framework.init_data.compare_digest")
             mock_compare.return_value = True
         with allure.step("Call validate_init_data"):
             result = await miniapp_api_with_config.validate_init_data(
@@ -368,7 +430,7 @@ class TestApiClientValidateInitData:
             init_data, bot_token = valid_init_data_and_token
 
         with allure.step("Call validate_init_data and capture logs"):
-            with caplog.at_level("INFO"):
+            with caplog.at_level("DEBUG"):
                 await miniapp_api_with_config.validate_init_data(init_data, bot_token)
 
         with allure.step("Verify success message in logs"):
@@ -385,7 +447,7 @@ class TestApiClientValidateInitData:
             init_data, bot_token = invalid_init_data_and_token
 
         with allure.step("Call validate_init_data and capture logs"):
-            with caplog.at_level("INFO"):
+            with caplog.at_level("DEBUG"):
                 await miniapp_api_with_config.validate_init_data(init_data, bot_token)
 
         with allure.step("Verify invalid message in logs"):
@@ -398,11 +460,11 @@ class TestApiClientValidateInitData:
         self, mocker, miniapp_api_with_config, caplog
     ):
         """Test validate_init_data logs error on exception. TC-API-017"""
-        with allure.step("Mock hmac.new to raise exception"):
-            # Force an exception by mocking hmac.new to raise an exception
+        with allure.step("Mock validator to raise exception"):
+            # Force an exception by mocking check_init_data to raise an exception
             with caplog.at_level("ERROR"):
                 mocker.patch(
-                    "tma_test_framework.clients.api_client.new",
+                    "tma_test_framework.clients.api_client.check_init_data",
                     side_effect=Exception("Test exception"),
                 )
         with allure.step("Call validate_init_data and capture error logs"):
@@ -877,6 +939,7 @@ class TestApiClientMakeRequest:
             assert result.status_code == 0
             assert result.success is False
             assert result.error_message == "Network error"
+            assert result.error_category is ErrorCategory.OTHER
             assert result.headers == {}
             assert result.body == b""
             assert result.content_type is None
@@ -899,6 +962,7 @@ class TestApiClientMakeRequest:
             assert result.status_code == 0
             assert result.success is False
             assert "timeout" in result.error_message.lower()
+            assert result.error_category is ErrorCategory.READ_TIMEOUT
 
     @pytest.mark.asyncio
     @allure.title("TC-API-030: Make request logs request")
@@ -958,6 +1022,109 @@ class TestApiClientMakeRequest:
         with allure.step("Verify error is logged"):
             assert "Request failed: POST /api/data" in caplog.text
 
+    @pytest.mark.asyncio
+    @allure.title("TC-API-063: Make request samples success logs, keeps failures")
+    @allure.description(
+        "Test make_request logs 1 in N successes and every failed response. TC-API-063"
+    )
+    async def test_make_request_log_sampling(
+        self,
+        mocker,
+        miniapp_api_with_config,
+        mock_httpx_response_200,
+        mock_httpx_response_500,
+        caplog,
+    ):
+        """Test make_request logs 1 in N successes and every failed response. TC-API-063"""
+        with allure.step("Enable sampling of 1 in 10 successful requests"):
+            miniapp_api_with_config.set_log_sampling(10)
+            miniapp_api_with_config.client.request = mocker.AsyncMock(
+                return_value=mock_httpx_response_200
+            )
+
+        with allure.step("Make 5 successful requests"):
+            with caplog.at_level("INFO"):
+                for _ in range(5):
+                    await miniapp_api_with_config.make_request("/api/data")
+
+        with allure.step("Verify only the first request was logged"):
+            assert caplog.text.count("Making request: GET") == 1
+            assert caplog.text.count("Response got:") == 1
+
+        with allure.step("Make a failing request inside the sampling window"):
+            miniapp_api_with_config.client.request = mocker.AsyncMock(
+                return_value=mock_httpx_response_500
+            )
+            caplog.clear()
+            with caplog.at_level("INFO"):
+                await miniapp_api_with_config.make_request("/api/data")
+
+        with allure.step("Verify failed response is logged"):
+            assert "status_code=500" in caplog.text
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-064: Make request notifies result listeners")
+    @allure.description(
+        "Test make_request passes success and failure results to listeners. TC-API-064"
+    )
+    async def test_make_request_notifies_listeners(
+        self, mocker, miniapp_api_with_config, mock_httpx_response_200
+    ):
+        """Test make_request passes success and failure results to listeners. TC-API-064"""
+        with allure.step("Register listener"):
+            received = []
+            miniapp_api_with_config.add_result_listener(received.append)
+
+        with allure.step("Make successful and failing requests"):
+            miniapp_api_with_config.client.request = mocker.AsyncMock(
+                return_value=mock_httpx_response_200
+            )
+            ok = await miniapp_api_with_config.make_request("/api/data")
+            miniapp_api_with_config.client.request = mocker.AsyncMock(
+                side_effect=RequestError("boom", request=mocker.MagicMock())
+            )
+            failed = await miniapp_api_with_config.make_request("/api/data")
+
+        with allure.step("Verify listener received both results"):
+            assert received == [ok, failed]
+
+        with allure.step("Remove listener and verify it is no longer called"):
+            miniapp_api_with_config.remove_result_listener(received.append)
+            await miniapp_api_with_config.make_request("/api/data")
+            assert len(received) == 2
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-071: Failing result listener does not change the result")
+    @allure.description(
+        "Test listener exceptions are logged and isolated from make_request. TC-API-071"
+    )
+    async def test_make_request_isolates_listener_errors(
+        self, mocker, miniapp_api_with_config, mock_httpx_response_200, caplog
+    ):
+        """Test listener exceptions are logged and isolated from make_request. TC-API-071"""
+
+        def failing(result):
+            raise RuntimeError("listener broke")
+
+        received = []
+        miniapp_api_with_config.add_result_listener(failing)
+        miniapp_api_with_config.add_result_listener(received.append)
+        miniapp_api_with_config.client.request = mocker.AsyncMock(
+            return_value=mock_httpx_response_200
+        )
+
+        with caplog.at_level("ERROR"):
+            result = await miniapp_api_with_config.make_request("/api/data")
+
+        with allure.step("Successful response stays successful"):
+            assert result.status_code == 200
+            assert result.error_message is None
+        with allure.step("Other listeners see the result exactly once"):
+            assert received == [result]
+        with allure.step("Listener failure is logged"):
+            assert "Result listener" in caplog.text
+            assert "listener broke" in caplog.text
+
     @pytest.mark.asyncio
     @allure.title("TC-API-033: Make request with PUT method")
     @allure.description("Test make_request with PUT method. TC-API-033")
@@ -1909,31 +2076,25 @@ class TestApiClientSetupTmaAuth:
                 return_value=mock_result_201
             )
 
-        with allure.step("Mock generate_telegram_init_data to verify it's called"):
-            mock_generate = mocker.patch(
-                "tma_test_framework.clients.api_client.generate_telegram_init_data",
-                return_value="test_init_data_string",
-            )
-
         with allure.step("Call await setup_tma_auth(user_info, config)"):
             await miniapp_api_with_config.setup_tma_auth(
                 valid_user_info, miniapp_api_with_config.config
             )
 
-        with allure.step(
-            "Verify generate_telegram_init_data called with user_info fields"
-        ):
-            mock_generate.assert_called_once()
-            call_kwargs = mock_generate.call_args[1]
-            assert call_kwargs["user_id"] == valid_user_info.id
-            assert call_kwargs["username"] == (valid_user_info.username or "")
-            assert call_kwargs["first_name"] == valid_user_info.first_name
-            assert call_kwargs["is_premium"] == valid_user_info.is_premium
-            # Verify bot_token is passed from config (not empty string)
+        with allure.step("Verify initData template holds user_info fields"):
+            user = miniapp_api_with_config.init_data_template.user
+            assert user.id == valid_user_info.id
+            assert user.username == (valid_user_info.username or "")
+            assert user.first_name == valid_user_info.first_name
+            assert user.is_premium == valid_user_info.is_premium
+
+        with allure.step("Verify init_data is signed with bot_token from config"):
             # This is critical: without bot_token, init_data will have invalid HMAC signature
-            assert call_kwargs["bot_token"] == miniapp_api_with_config.config.bot_token
-            assert call_kwargs["bot_token"] is not None
-            assert call_kwargs["bot_token"] != ""
+            assert miniapp_api_with_config.config.bot_token
+            assert await miniapp_api_with_config.validate_init_data(
+                miniapp_api_with_config._auth_token,
+                miniapp_api_with_config.config.bot_token,
+            )
 
     @pytest.mark.asyncio
     @allure.title("TC-API-062: Setup TMA auth sets token type to 'tma'")
@@ -1971,3 +2132,195 @@ class TestApiClientSetupTmaAuth:
         with allure.step("Verify _auth_token is set (init_data string)"):
             assert miniapp_api_with_config._auth_token is not None
             assert isinstance(miniapp_api_with_config._auth_token, str)
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-065: Refresh TMA auth re-signs initData template")
+    @allure.description(
+        "Test refresh_tma_auth() re-signs with fresh auth_date. TC-API-065"
+    )
+    async def test_refresh_tma_auth(
+        self, mocker, miniapp_api_with_config, valid_user_info
+    ):
+        """Test refresh_tma_auth() re-signs with fresh auth_date. TC-API-065"""
+        api = miniapp_api_with_config
+        with allure.step("refresh_tma_auth() before setup raises RuntimeError"):
+            with pytest.raises(RuntimeError, match="setup_tma_auth"):
+                api.refresh_tma_auth()
+
+        with allure.step("Set up TMA auth without creating user"):
+            await api.setup_tma_auth(valid_user_info, api.config, create_user=False)
+            first_token = api._auth_token
+
+        with allure.step("Refresh with new auth_date replaces token"):
+            init_data = api.refresh_tma_auth(auth_date=1700000000)
+            assert api._auth_token == init_data != first_token
+            assert api._auth_token_type == "tma"
+            result = check_init_data(init_data, api.config.bot_token)
+            assert result.valid
+            assert result.auth_date == 1700000000
+            assert f'"id":{valid_user_info.id}' in result.fields["user"]
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-066: Bulk TMA setup provisions users concurrently")
+    @allure.description(
+        "Test setup_tma_auth_bulk() creates users and signs tokens. TC-API-066"
+    )
+    async def test_setup_tma_auth_bulk(self, valid_config):
+        """Test setup_tma_auth_bulk() creates users and signs tokens. TC-API-066"""
+        statuses = {1: 201, 2: 400, 3: 409}
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            user_id = int(json.loads(request.content)["telegram_id"])
+            return Response(statuses.get(user_id, 201))
+
+        api = make_transport_api(valid_config, handler)
+        users = [UserInfo(id=i, first_name=f"User{i}") for i in range(1, 21)]
+
+        with allure.step("Provision 20 users with concurrency 4"):
+            provisioned = await api.setup_tma_auth_bulk(
+                users, valid_config, concurrency=4
+            )
+        await api.close()
+
+        with allure.step("Results keep input order, existing users succeed"):
+            assert [user.user_id for user in provisioned] == list(range(1, 21))
+            assert all(user.ok for user in provisioned)
+            assert [user.status_code for user in provisioned[:4]] == [
+                201,
+                400,
+                409,
+                201,
+            ]
+            assert 1 < max_in_flight <= 4
+
+        with allure.step("Tokens are valid and client token is unchanged"):
+            for user in provisioned:
+                result = check_init_data(user.init_data, valid_config.bot_token)
+                assert result.valid
+                assert f'"id":{user.user_id},' in result.fields["user"]
+                assert user.auth_header == {"Authorization": f"tma {user.init_data}"}
+                assert check_init_data(user.template.sign(), valid_config.bot_token)
+            assert api._auth_token is None
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-067: Bulk TMA setup reports failed users")
+    @allure.description("Test setup_tma_auth_bulk() with failing creation. TC-API-067")
+    async def test_setup_tma_auth_bulk_failures(self, valid_config):
+        """Test setup_tma_auth_bulk() with failing creation. TC-API-067"""
+
+        def handler(request):
+            user_id = int(json.loads(request.content)["telegram_id"])
+            return Response(500 if user_id == 2 else 201, text="boom")
+
+        users = [UserInfo(id=i, first_name=f"User{i}") for i in range(1, 4)]
+        api = make_transport_api(valid_config, handler)
+
+        with allure.step("Failure raises ProvisioningError by default"):
+            with pytest.raises(
+                ProvisioningError, match="Failed to provision 1 of 3 users"
+            ) as exc_info:
+                await api.setup_tma_auth_bulk(users, valid_config)
+            assert isinstance(exc_info.value, RuntimeError)
+            assert [user.user_id for user in exc_info.value.failed] == [2]
+            assert [user.ok for user in exc_info.value.provisioned] == [
+                True,
+                False,
+                True,
+            ]
+
+        with allure.step("raise_on_error=False returns failed result"):
+            provisioned = await api.setup_tma_auth_bulk(
+                users, valid_config, raise_on_error=False
+            )
+            await api.close()
+            assert [user.ok for user in provisioned] == [True, False, True]
+            assert provisioned[1].init_data is None
+            assert provisioned[1].error == "HTTP 500: boom"
+
+        with allure.step("Failed user has no auth header"):
+            assert provisioned[0].auth_header["Authorization"].startswith("tma ")
+            with pytest.raises(RuntimeError, match="User 2 was not provisioned"):
+                provisioned[1].auth_header
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-068: Bulk TMA setup without user creation")
+    @allure.description("Test setup_tma_auth_bulk() with create_user=False. TC-API-068")
+    async def test_setup_tma_auth_bulk_without_creation(self, valid_config):
+        """Test setup_tma_auth_bulk() with create_user=False. TC-API-068"""
+        requests = []
+        api = make_transport_api(
+            valid_config, lambda request: requests.append(request) or Response(201)
+        )
+        provisioned = await api.setup_tma_auth_bulk(
+            [UserInfo(id=5, first_name="Five")], valid_config, create_user=False
+        )
+        assert requests == []
+        assert provisioned[0].ok and provisioned[0].status_code is None
+        assert await api.setup_tma_auth_bulk([], valid_config) == []
+
+        with allure.step("Invalid arguments raise ValueError"):
+            with pytest.raises(ValueError, match="concurrency"):
+                await api.setup_tma_auth_bulk([], valid_config, concurrency=0)
+            with pytest.raises(ValueError, match="config is required"):
+                await api.setup_tma_auth_bulk([], None)
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-072: TMA setup without bot token signs with empty key")
+    @allure.description(
+        "Test setup_tma_auth() and bulk setup without config.bot_token. TC-API-072"
+    )
+    async def test_setup_tma_auth_without_bot_token(self, valid_config):
+        """Test setup_tma_auth() and bulk setup without config.bot_token. TC-API-072"""
+        api = make_transport_api(valid_config, lambda request: Response(201))
+        config = msgspec.structs.replace(valid_config, bot_token=None)
+        user = UserInfo(id=5, first_name="Five")
+
+        await api.setup_tma_auth(user, config)
+        assert check_init_data(api._auth_token, "").valid
+        (provisioned,) = await api.setup_tma_auth_bulk([user], config)
+        assert provisioned.ok
+        assert check_init_data(provisioned.init_data, "").valid
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-API-069: Setup TMA auth uses identity cache")
+    @allure.description(
+        "Test setup_tma_auth() skips Telegram on identity cache hit. TC-API-069"
+    )
+    async def test_setup_tma_auth_identity_cache(
+        self, mocker, valid_config, tmp_path, mock_telegram_client_context_manager
+    ):
+        """Test setup_tma_auth() skips Telegram on identity cache hit. TC-API-069"""
+        tg_client_cls = mocker.patch(
+            "tma_test_framework.clients.mtproto_client.UserTelegramClient",
+            return_value=mock_telegram_client_context_manager,
+        )
+        cache = IdentityCache(tmp_path)
+        api = make_transport_api(valid_config, lambda request: Response(201))
+
+        with allure.step("Miss resolves via Telegram and stores identity"):
+            await api.setup_tma_auth(config=valid_config, identity_cache=cache)
+            assert tg_client_cls.call_count == 1
+            user = mock_telegram_client_context_manager.get_me.return_value
+            assert cache.get(valid_config) == user
+
+        with allure.step("Hit in a fresh client does not touch Telegram"):
+            other = make_transport_api(valid_config, lambda request: Response(201))
+            await other.setup_tma_auth(config=valid_config, identity_cache=cache)
+            assert tg_client_cls.call_count == 1
+            assert other.init_data_template.user.id == user.id
+
+        with allure.step("Invalidation forces a new Telegram round trip"):
+            cache.invalidate(valid_config)
+            await other.setup_tma_auth(config=valid_config, identity_cache=cache)
+            assert tg_client_cls.call_count == 2
+        await api.close()
+        await other.close()
@@ -6,6 +6,7 @@ import base64
 
 import allure
 import json
+import math
 import pytest
 import msgspec
 
@@ -1705,6 +1706,78 @@ class TestApiResult:
         with pytest.raises(AssertionError, match="Missing required fields"):
             result.assert_has_fields("name", "id", "status", "email")
 
+    @allure.title("TC-MODEL-API-035: ApiResult decodes JSON body at most once")
+    @allure.description(
+        "Test json() and assert_has_fields() share one decode. TC-MODEL-API-035"
+    )
+    def test_api_result_json_memoized(self, mocker):
+        """Test json() and assert_has_fields() share one decode. TC-MODEL-API-035"""
+        result = ApiResult(
+            **{**VALID_API_RESULT_DATA, "body": b'{"name": "test", "id": 123}'}
+        )  # type: ignore[arg-type]
+        decode = mocker.spy(json, "loads")
+
+        result.assert_has_fields("name", "id")
+        first = result.json()
+        assert result.json() is first
+        assert decode.call_count == 1
+
+        with allure.step("Equal results keep separate caches"):
+            other = ApiResult(**msgspec.structs.asdict(result))
+            assert other == result
+            assert other.json() == first and other.json() is not first
+
+    @allure.title("TC-MODEL-API-036: ApiResult.json_as() decodes into typed values")
+    @allure.description(
+        "Test json_as() with Struct and JSON-Schema targets. TC-MODEL-API-036"
+    )
+    def test_api_result_json_as(self):
+        """Test json_as() with Struct and JSON-Schema targets. TC-MODEL-API-036"""
+
+        class Item(msgspec.Struct):
+            name: str
+            id: int
+
+        result = ApiResult(
+            **{**VALID_API_RESULT_DATA, "body": b'{"name": "test", "id": 123}'}
+        )  # type: ignore[arg-type]
+        item = result.json_as(Item)
+        assert item == Item(name="test", id=123)
+        assert result.json_as(Item) is item
+        assert result.assert_matches_schema(Item) is item
+
+        schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        assert result.json_as(schema).id == 123
+        assert result.json_as(dict(schema)) is result.json_as(schema)
+
+        with allure.step("Mismatch raises ValueError"):
+            with pytest.raises(ValueError, match="Schema validation failed"):
+                result.json_as(list)
+
+    @allure.title("TC-MODEL-API-037: Decoded bodies are stored on the result")
+    @allure.description(
+        "Test per-instance memo and json.loads-compatible decoding. TC-MODEL-API-037"
+    )
+    def test_api_result_json_cache_per_instance(self):
+        """Test per-instance memo and json.loads-compatible decoding. TC-MODEL-API-037"""
+        body = b'{"a": 1, "a": 2, "b": NaN}'
+        result = ApiResult(**{**VALID_API_RESULT_DATA, "body": body})  # type: ignore[arg-type]
+
+        with allure.step("json() matches json.loads()"):
+            data = result.json()
+            assert data["a"] == 2
+            assert math.isnan(data["b"])
+
+        with allure.step("Memo is not encoded and not copied by replace()"):
+            assert b"_decoded" not in msgspec.json.encode(result)
+            replaced = msgspec.structs.replace(result, body=b'{"a": 3}')
+            assert replaced.json() == {"a": 3}
+            assert result.json() is data
+
+        with allure.step("Shared result reflects caller mutation"):
+            data["c"] = 1
+            assert result.json()["c"] == 1
+
     @allure.title("different HTTP methods")
     @allure.description("Test different HTTP methods.")
     def test_api_result_methods(self):
@@ -0,0 +1,446 @@
+"""
+Unit tests for DNS caching and TLS session reuse of ApiClient.
+"""
+
+import socket
+import ssl
+from urllib.parse import quote
+
+import allure
+import httpcore
+import httpx
+import msgspec
+import pytest
+
+from tma_test_framework.clients.api_client import ApiClient
+from tma_test_framework.clients.models import ErrorCategory
+from tma_test_framework.clients.network import (
+    CachingNetworkBackend,
+    ConnectionStats,
+    DNSCache,
+    TLSSessionCache,
+    _ssl_session_hook_supported,
+    _transport_pool_supported,
+    classify_error,
+    create_transport,
+)
+from tests.fixtures.http_server import (
+    make_self_signed_cert,
+    start_faulty_server,
+    start_http_server,
+)
+
+
+def chained(*errors):
+    """Raise errors so that each one is caused by the next; return the first."""
+    cause = None
+    for error in reversed(errors):
+        error.__cause__ = cause
+        cause = error
+    return cause
+
+
+def make_addrinfo(*addresses):
+    """Create getaddrinfo-like result for addresses."""
+    return [(2, 1, 6, "", (address, 443)) for address in addresses]
+
+
+class TestDNSCache:
+    """Test DNSCache."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-NET-001: DNS cache reuses addresses until TTL expires")
+    @allure.description("Test resolve() caches lookups with TTL. TC-NET-001")
+    async def test_resolve_ttl(self, mocker):
+        """Test resolve() caches lookups with TTL. TC-NET-001"""
+        with allure.step("Mock resolver and clock"):
+            loop = mocker.MagicMock()
+            loop.getaddrinfo = mocker.AsyncMock(
+                return_value=make_addrinfo("10.0.0.1", "10.0.0.1", "10.0.0.2")
+            )
+            mocker.patch(
+                "tma_test_framework.clients.network.get_running_loop",
+                return_value=loop,
+            )
+            clock = mocker.patch(
+                "tma_test_framework.clients.network.monotonic", return_value=100.0
+            )
+            cache = DNSCache(ttl=10)
+
+        with allure.step("Resolve twice within TTL"):
+            assert await cache.resolve("api.example.com", 443) == [
+                "10.0.0.1",
+                "10.0.0.2",
+            ]
+            await cache.resolve("api.example.com", 443)
+            assert (cache.lookups, cache.hits) == (1, 1)
+
+        with allure.step("Resolve after TTL"):
+            clock.return_value = 111.0
+            await cache.resolve("api.example.com", 443)
+            assert cache.lookups == 2
+
+        with allure.step("Resolve after invalidate"):
+            cache.invalidate("api.example.com")
+            await cache.resolve("api.example.com", 443)
+            assert cache.lookups == 3
+
+    @pytest.mark.asyncio
+    @allure.title("TC-NET-002: IP literals are not resolved")
+    @allure.description("Test resolve() returns IP literals as-is. TC-NET-002")
+    async def test_ip_literal(self, mocker):
+        """Test resolve() returns IP literals as-is. TC-NET-002"""
+        get_loop = mocker.patch("tma_test_framework.clients.network.get_running_loop")
+        cache = DNSCache()
+        assert await cache.resolve("127.0.0.1", 80) == ["127.0.0.1"]
+        assert await cache.resolve("::1", 80) == ["::1"]
+        get_loop.assert_not_called()
+        assert cache.lookups == 0
+
+    @allure.title("TC-NET-003: Invalid DNS cache settings raise ValueError")
+    @allure.description("Test DNSCache validates ttl and max_entries. TC-NET-003")
+    @pytest.mark.parametrize("kwargs", [{"ttl": -1}, {"max_entries": 0}])
+    def test_invalid_settings(self, kwargs):
+        """Test DNSCache validates ttl and max_entries. TC-NET-003"""
+        with pytest.raises(ValueError):
+            DNSCache(**kwargs)
+
+
+class TestCachingNetworkBackend:
+    """Test CachingNetworkBackend with ApiClient."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-NET-004: Shared backend resumes TLS sessions across clients")
+    @allure.description(
+        "Test short-lived clients reuse DNS results and TLS sessions. TC-NET-004"
+    )
+    async def test_tls_resumption_across_clients(self, valid_config, tmp_path):
+        """Test short-lived clients reuse DNS results and TLS sessions. TC-NET-004"""
+        with allure.step("Start local HTTPS server"):
+            cert_path, key_path = make_self_signed_cert(tmp_path)
+            server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            server_context.load_cert_chain(cert_path, key_path)
+            server = await start_http_server(ssl_context=server_context)
+            port = server.sockets[0].getsockname()[1]
+
+        try:
+            with allure.step("Make requests with three short-lived clients"):
+                backend = CachingNetworkBackend(
+                    ssl_context=ssl.create_default_context(cafile=str(cert_path))
+                )
+                for _ in range(3):
+                    async with ApiClient(
+                        f"https://localhost:{port}",
+                        valid_config,
+                        network_backend=backend,
+                    ) as api:
+                        result = await api.make_request("status")
+                        assert result.status_code == 200
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        with allure.step("Verify setup costs were paid once"):
+            stats = backend.stats
+            assert stats.tcp_connects == 3
+            assert stats.dns_lookups == 1
+            assert stats.dns_cache_hits == 2
+            assert stats.tls_handshakes == 3
+            assert stats.tls_resumptions == 2
+            assert api.connection_stats is stats
+
+    @allure.title("TC-NET-005: ApiClient without backend has no connection stats")
+    @allure.description("Test default ApiClient keeps plain transport. TC-NET-005")
+    def test_default_client(self, valid_config):
+        """Test default ApiClient keeps plain transport. TC-NET-005"""
+        api = ApiClient("https://example.com", valid_config)
+        assert api.network_backend is None
+        assert api.connection_stats is None
+
+    @allure.title("TC-NET-006: Backend without DNS cache")
+    @allure.description("Test dns_ttl=None disables DNS caching. TC-NET-006")
+    def test_dns_cache_disabled(self):
+        """Test dns_ttl=None disables DNS caching. TC-NET-006"""
+        backend = CachingNetworkBackend(dns_ttl=None)
+        assert backend.dns_cache is None
+        assert backend.stats == ConnectionStats()
+        assert isinstance(backend.ssl_context, ssl.SSLContext)
+
+    @allure.title("TC-NET-013: CPython and httpx internals used by the backend exist")
+    @allure.description(
+        "Test private APIs behind session resumption and pool replacement. TC-NET-013"
+    )
+    def test_private_api_canary(self):
+        """Test private APIs behind session resumption and pool replacement. TC-NET-013"""
+        with allure.step("SSLObject._create accepts a session"):
+            assert _ssl_session_hook_supported(), (
+                "ssl.SSLObject._create changed, TLS session resumption is disabled"
+            )
+        with allure.step("AsyncHTTPTransport keeps its pool in _pool"):
+            assert _transport_pool_supported(httpx.AsyncHTTPTransport()), (
+                f"httpx {httpx.__version__} changed AsyncHTTPTransport._pool, "
+                "CachingNetworkBackend is not used"
+            )
+        with allure.step("Backend is installed on the transport"):
+            backend = CachingNetworkBackend()
+            transport = create_transport(backend, httpx.Limits())
+            assert transport._pool._network_backend is backend
+            assert backend.tls_sessions.resumption_enabled
+
+    @allure.title("TC-NET-014: Unsupported internals fall back to plain transport")
+    @allure.description(
+        "Test fallback when private APIs are missing or changed. TC-NET-014"
+    )
+    def test_private_api_fallback(self, mocker):
+        """Test fallback when private APIs are missing or changed. TC-NET-014"""
+        with allure.step("No SSLObject hook: sessions are not resumed"):
+            mocker.patch(
+                "tma_test_framework.clients.network._ssl_session_hook_supported",
+                return_value=False,
+            )
+            cache = TLSSessionCache(ssl.create_default_context())
+            assert not cache.resumption_enabled
+            assert cache.ssl_context.sslobject_class is ssl.SSLObject
+
+        with allure.step("Unknown httpx version: default pool is kept"):
+            mocker.patch.object(httpx, "__version__", "1.0.0")
+            backend = CachingNetworkBackend()
+            transport = create_transport(backend, httpx.Limits(max_connections=3))
+            assert isinstance(transport, httpx.AsyncHTTPTransport)
+            assert transport._pool._network_backend is not backend
+            assert transport._pool._max_connections == 3
+
+    @allure.title("TC-NET-015: Session cache does not modify the given SSL context")
+    @allure.description(
+        "Test TLSSessionCache copies the caller's SSL context. TC-NET-015"
+    )
+    def test_ssl_context_copied(self, tmp_path):
+        """Test TLSSessionCache copies the caller's SSL context. TC-NET-015"""
+        cert_path, _ = make_self_signed_cert(tmp_path)
+        context = ssl.create_default_context(cafile=str(cert_path))
+        context.minimum_version = ssl.TLSVersion.TLSv1_3
+        cache = TLSSessionCache(context)
+
+        assert cache.ssl_context is not context
+        assert context.sslobject_class is ssl.SSLObject
+        assert cache.ssl_context.sslobject_class is not ssl.SSLObject
+        copy = cache.ssl_context
+        assert copy.minimum_version == ssl.TLSVersion.TLSv1_3
+        assert copy.verify_mode == context.verify_mode
+        assert copy.check_hostname == context.check_hostname
+        assert copy.options == context.options
+        assert copy.get_ca_certs() == context.get_ca_certs()
+        assert copy.get_ciphers() == context.get_ciphers()
+
+        with allure.step("Unverified context stays unverified"):
+            unverified = ssl._create_unverified_context()
+            copy = TLSSessionCache(unverified).ssl_context
+            assert copy.verify_mode == ssl.CERT_NONE
+            assert not copy.check_hostname
+
+
+class TestUnixSocketTransport:
+    """Test ApiClient over Unix domain sockets."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-NET-007: http+unix URL sends requests over Unix socket")
+    @allure.description("Test ApiClient with http+unix:// base URL. TC-NET-007")
+    async def test_unix_socket_url(self, valid_config, tmp_path):
+        """Test ApiClient with http+unix:// base URL. TC-NET-007"""
+        with allure.step("Start local HTTP server on Unix socket"):
+            socket_path = str(tmp_path / "app.sock")
+            server = await start_http_server(unix_path=socket_path)
+
+        try:
+            with allure.step("Make request through http+unix URL"):
+                url = f"http+unix://{quote(socket_path, safe='')}/api"
+                async with ApiClient(url, valid_config) as api:
+                    assert api.url == "http://localhost/api"
+                    assert api.uds == socket_path
+                    result = await api.make_request("v1/status/")
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        with allure.step("Verify response"):
+            assert result.status_code == 200
+            assert result.json() == {"ok": True}
+
+    @pytest.mark.asyncio
+    @allure.title("TC-NET-008: uds option works with network backend")
+    @allure.description(
+        "Test uds= with CachingNetworkBackend counts connections. TC-NET-008"
+    )
+    async def test_uds_with_network_backend(self, valid_config, tmp_path):
+        """Test uds= with CachingNetworkBackend counts connections. TC-NET-008"""
+        socket_path = str(tmp_path / "app.sock")
+        server = await start_http_server(unix_path=socket_path)
+        backend = CachingNetworkBackend()
+        try:
+            async with ApiClient(
+                "http://localhost",
+                valid_config,
+                network_backend=backend,
+                uds=socket_path,
+            ) as api:
+                for _ in range(2):
+                    result = await api.make_request("v1/status/")
+                    assert result.status_code == 200
+        finally:
+            server.close()
+            await server.wait_closed()
+        assert backend.stats.tcp_connects == 2
+        assert backend.stats.dns_lookups == 0
+
+    @allure.title("TC-NET-009: http+unix URL without socket path raises ValueError")
+    @allure.description("Test invalid Unix socket URL. TC-NET-009")
+    def test_unix_socket_url_without_path(self, valid_config):
+        """Test invalid Unix socket URL. TC-NET-009"""
+        with pytest.raises(ValueError, match="must include socket path"):
+            ApiClient("http+unix:///api", valid_config)
+
+
+class TestClassifyError:
+    """Test classify_error() and error categories of failed requests."""
+
+    @pytest.mark.parametrize(
+        "error, category",
+        [
+            (httpx.ConnectTimeout("timeout"), ErrorCategory.CONNECT_TIMEOUT),
+            (
+                chained(
+                    httpx.ConnectTimeout(""),
+                    TimeoutError(),
+                    ssl.SSLWantReadError(),
+                ),
+                ErrorCategory.CONNECT_TIMEOUT,
+            ),
+            (httpx.ReadTimeout("timeout"), ErrorCategory.READ_TIMEOUT),
+            (httpx.WriteTimeout("timeout"), ErrorCategory.WRITE_TIMEOUT),
+            (httpx.PoolTimeout("timeout"), ErrorCategory.POOL_TIMEOUT),
+            (httpcore.PoolTimeout("timeout"), ErrorCategory.POOL_TIMEOUT),
+            (TimeoutError(), ErrorCategory.READ_TIMEOUT),
+            (
+                chained(
+                    httpx.ConnectError("lookup"),
+                    httpcore.ConnectError("lookup"),
+                    socket.gaierror(-2, "Name or service not known"),
+                ),
+                ErrorCategory.DNS,
+            ),
+            (
+                chained(
+                    httpx.ConnectError("failed"),
+                    OSError("All connection attempts failed"),
+                    ConnectionRefusedError(111, "refused"),
+                ),
+                ErrorCategory.CONNECT_ERROR,
+            ),
+            (httpx.ConnectError("unreachable"), ErrorCategory.CONNECT_ERROR),
+            (
+                chained(httpx.ReadError(""), ConnectionResetError(104, "reset")),
+                ErrorCategory.CONNECTION_RESET,
+            ),
+            (
+                chained(httpx.ConnectError(""), ConnectionResetError(104, "reset")),
+                ErrorCategory.CONNECTION_RESET,
+            ),
+            (httpx.WriteError("broken"), ErrorCategory.CONNECTION_RESET),
+            (
+                chained(httpx.ConnectError("ssl"), ssl.SSLCertVerificationError()),
+                ErrorCategory.TLS,
+            ),
+            (httpx.RemoteProtocolError("illegal"), ErrorCategory.PROTOCOL),
+            (httpx.LocalProtocolError("illegal"), ErrorCategory.PROTOCOL),
+            (httpx.UnsupportedProtocol("ftp"), ErrorCategory.OTHER),
+            (ValueError("bad"), ErrorCategory.OTHER),
+        ],
+    )
+    @allure.title("TC-NET-010: Transport exceptions map to error categories")
+    @allure.description("Test classify_error() on exception chains. TC-NET-010")
+    def test_classify_error(self, error, category):
+        """Test classify_error() on exception chains. TC-NET-010"""
+        assert classify_error(error) is category
+
+    @allure.title("TC-NET-011: Error categories serialize and guide retries")
+    @allure.description("Test ErrorCategory values and retry flags. TC-NET-011")
+    def test_error_category(self):
+        """Test ErrorCategory values and retry flags. TC-NET-011"""
+        assert ErrorCategory.DNS == "dns"
+        assert msgspec.json.encode(ErrorCategory.READ_TIMEOUT) == b'"read_timeout"'
+        assert msgspec.json.decode(b'"tls"', type=ErrorCategory) is ErrorCategory.TLS
+
+        with allure.step("Unsent requests are always retryable"):
+            unsent = [category for category in ErrorCategory if category.unsent]
+            assert unsent == [
+                ErrorCategory.CONNECT_TIMEOUT,
+                ErrorCategory.POOL_TIMEOUT,
+                ErrorCategory.DNS,
+                ErrorCategory.CONNECT_ERROR,
+            ]
+            assert all(category.retryable for category in unsent)
+
+        with allure.step("Protocol, TLS and unknown failures are not retryable"):
+            assert ErrorCategory.READ_TIMEOUT.retryable
+            assert ErrorCategory.CONNECTION_RESET.retryable
+            assert not ErrorCategory.READ_TIMEOUT.unsent
+            assert not ErrorCategory.TLS.retryable
+            assert not ErrorCategory.PROTOCOL.retryable
+            assert not ErrorCategory.OTHER.retryable
+
+    @pytest.mark.asyncio
+    @allure.title("TC-NET-012: Failed requests carry error category")
+    @allure.description(
+        "Test make_request sets error_category for real socket failures. TC-NET-012"
+    )
+    async def test_make_request_error_category(self, valid_config):
+        """Test make_request sets error_category for real socket failures. TC-NET-012"""
+        config = msgspec.structs.replace(valid_config, timeout=1)
+
+        with allure.step("Closed port is a connect error"):
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+            async with ApiClient(f"http://127.0.0.1:{port}", config) as api:
+                result = await api.make_request("v1/status/")
+            assert result.status_code == 0
+            assert result.error_category is ErrorCategory.CONNECT_ERROR
+
+        with allure.step("TLS to non-TLS server is a TLS error"):
+            server = await start_faulty_server("garbage")
+            port = server.sockets[0].getsockname()[1]
+            try:
+                async with ApiClient(f"https://127.0.0.1:{port}", config) as api:
+                    result = await api.make_request("v1/status/")
+            finally:
+                server.close()
+            assert result.error_category is ErrorCategory.TLS
+
+        for mode, category in (
+            ("reset", ErrorCategory.CONNECTION_RESET),
+            ("garbage", ErrorCategory.PROTOCOL),
+            ("hang", ErrorCategory.READ_TIMEOUT),
+        ):
+            with allure.step(f"Server {mode} gives {category.value}"):
+                server = await start_faulty_server(mode)
+                port = server.sockets[0].getsockname()[1]
+                try:
+                    async with ApiClient(f"http://127.0.0.1:{port}", config) as api:
+                        result = await api.make_request("v1/status/")
+                finally:
+                    server.close()
+                assert result.status_code == 0
+                assert result.error_category is category
+                assert result.error_message is not None
+
+        with allure.step("Successful response has no category"):
+            server = await start_http_server()
+            port = server.sockets[0].getsockname()[1]
+            try:
+                async with ApiClient(f"http://127.0.0.1:{port}", config) as api:
+                    result = await api.make_request("v1/status/")
+            finally:
+                server.close()
+                await server.wait_closed()
+            assert result.status_code == 200
+            assert result.error_category is None
@@ -0,0 +1,363 @@
+"""
+Unit tests for compact result records.
+"""
+
+import csv
+import gc
+import io
+import sys
+
+import allure
+import msgspec
+import pytest
+from httpx import ConnectTimeout, ReadTimeout, Response
+
+from tma_test_framework.clients.models import ApiResult, ErrorCategory
+from tma_test_framework.records import (
+    ResultRecord,
+    ResultRecorder,
+    ResultSet,
+    error_breakdown,
+)
+from tma_test_framework.slo import assert_slos
+from tma_test_framework.stats import RequestStats
+from tests.fixtures.miniapp_api import make_transport_api
+
+
+def make_result(status_code: int = 200, endpoint: str = "v1/items/") -> ApiResult:
+    """Create ApiResult with a small JSON body."""
+    return ApiResult(
+        endpoint=endpoint,
+        method="GET",
+        status_code=status_code,
+        response_time=0.25,
+        success=200 <= status_code < 300,
+        redirect=False,
+        client_error=400 <= status_code < 500,
+        server_error=status_code >= 500,
+        informational=False,
+        headers={"content-type": "application/json"},
+        body=b'{"items": []}',
+        error_message="connection refused" if status_code == 0 else None,
+        error_category=ErrorCategory.CONNECT_ERROR if status_code == 0 else None,
+    )
+
+
+class TestResultRecord:
+    """Test ResultRecord."""
+
+    @allure.title("TC-RECORD-001: Record is compact, array-like and untracked by GC")
+    @allure.description("Test ResultRecord layout and from_result(). TC-RECORD-001")
+    def test_record_layout(self):
+        """Test ResultRecord layout and from_result(). TC-RECORD-001"""
+        record = ResultRecord.from_result(make_result(), started_at=10.0)
+        assert record == ResultRecord(10.0, "v1/items/", "GET", 200, 0.25, 13)
+        assert record.success and not record.failed
+        assert not gc.is_tracked(record)
+        assert msgspec.json.encode(record) == (
+            b'[10.0,"v1/items/","GET",200,0.25,13,null,null,null,null]'
+        )
+
+        with allure.step("Payload kept on request"):
+            record = ResultRecord.from_result(make_result(500), keep_payload=True)
+            assert record.failed
+            assert record.body == b'{"items": []}'
+            assert record.headers == {"content-type": "application/json"}
+
+
+class TestResultRecorder:
+    """Test ResultRecorder."""
+
+    @allure.title("TC-RECORD-002: Recorder samples payloads and interns strings")
+    @allure.description("Test ResultRecorder payload sampling. TC-RECORD-002")
+    def test_payload_sampling(self):
+        """Test ResultRecorder payload sampling. TC-RECORD-002"""
+        recorder = ResultRecorder(payload_every=3, payload_on_error=True)
+        statuses = [200, 200, 200, 404, 200, 200, 0]
+        for status in statuses:
+            recorder.record(make_result(status, endpoint="".join(["v1/", "items/"])))
+
+        assert len(recorder) == 7
+        assert [r.body is not None for r in recorder] == [
+            False,
+            False,
+            True,
+            True,
+            False,
+            True,
+            True,
+        ]
+        assert recorder.records[-1].error == "connection refused"
+        assert recorder.records[-1].error_category is ErrorCategory.CONNECT_ERROR
+        assert len({id(r.endpoint) for r in recorder}) == 1
+        assert all(r.started_at > 0 for r in recorder)
+
+        with allure.step("drain() hands over records"):
+            drained = recorder.drain()
+            assert len(drained) == 7 and len(recorder) == 0
+
+        with pytest.raises(ValueError, match="payload_every"):
+            ResultRecorder(payload_every=-1)
+
+    @pytest.mark.asyncio
+    @allure.title("TC-RECORD-003: Recorder works as ApiClient result listener")
+    @allure.description("Test ResultRecorder attached to ApiClient. TC-RECORD-003")
+    async def test_listener(self, valid_config):
+        """Test ResultRecorder attached to ApiClient. TC-RECORD-003"""
+        api = make_transport_api(
+            valid_config, lambda request: Response(200, content=b"ok")
+        )
+        recorder = ResultRecorder()
+        api.add_result_listener(recorder.record)
+        for _ in range(5):
+            await api.make_request("v1/items/")
+        await api.close()
+
+        assert len(recorder) == 5
+        assert {(r.method, r.status_code, r.size) for r in recorder} == {
+            ("GET", 200, 2)
+        }
+        recorder.clear()
+        assert len(recorder) == 0
+
+    @pytest.mark.asyncio
+    @allure.title("TC-RECORD-008: Failures are grouped by error category")
+    @allure.description("Test error_breakdown() of recorded failures. TC-RECORD-008")
+    async def test_error_breakdown(self, valid_config):
+        """Test error_breakdown() of recorded failures. TC-RECORD-008"""
+        calls = iter(range(10))
+
+        def handler(request):
+            call = next(calls)
+            if call % 3 == 1:
+                raise ReadTimeout("timed out", request=request)
+            if call == 5:
+                raise ConnectTimeout("timed out", request=request)
+            return Response(500 if call == 0 else 200)
+
+        api = make_transport_api(valid_config, handler)
+        recorder = ResultRecorder()
+        result_set = ResultSet()
+        api.add_result_listener(recorder.record)
+        api.add_result_listener(result_set.record)
+        results = [await api.make_request("v1/items/") for _ in range(10)]
+        await api.close()
+
+        assert error_breakdown(recorder) == {
+            ErrorCategory.READ_TIMEOUT: 3,
+            ErrorCategory.CONNECT_TIMEOUT: 1,
+        }
+        assert list(error_breakdown(recorder)) == [
+            ErrorCategory.READ_TIMEOUT,
+            ErrorCategory.CONNECT_TIMEOUT,
+        ]
+        assert error_breakdown(results) == error_breakdown(recorder)
+        assert error_breakdown([]) == {}
+
+        with allure.step("Category survives serialization"):
+            encoded = msgspec.msgpack.encode(recorder.records)
+            decoded = msgspec.msgpack.decode(encoded, type=list[ResultRecord])
+            assert error_breakdown(decoded) == error_breakdown(recorder)
+
+        with allure.step("ResultSet keeps the category column"):
+            expected = error_breakdown(recorder)
+            assert result_set.error_breakdown() == expected
+            assert error_breakdown(result_set) == expected
+            assert result_set.error_breakdown("GET v1/items/") == expected
+            assert ResultSet.from_records(recorder).error_breakdown() == expected
+
+
+def make_result_set() -> ResultSet:
+    """Create result set with two endpoints over three seconds."""
+    records = [
+        ResultRecord(100.0 + i * 0.25, "v1/items/", "GET", 200, 0.01 * (i + 1), 10)
+        for i in range(10)
+    ]
+    records += [
+        ResultRecord(100.5, "v1/items/", "POST", 500, 0.5, 0),
+        ResultRecord(
+            102.9,
+            "v1/items/",
+            "POST",
+            0,
+            0.0,
+            0,
+            "timeout",
+            error_category=ErrorCategory.READ_TIMEOUT,
+        ),
+    ]
+    return ResultSet.from_records(records)
+
+
+class TestResultSet:
+    """Test ResultSet."""
+
+    @allure.title("TC-RECORD-004: ResultSet aggregates like RequestStats")
+    @allure.description("Test ResultSet group-by, percentiles and SLOs. TC-RECORD-004")
+    def test_group_by(self):
+        """Test ResultSet group-by, percentiles and SLOs. TC-RECORD-004"""
+        results = make_result_set()
+        assert len(results) == 12
+        assert results.endpoint_keys == ["GET v1/items/", "POST v1/items/"]
+        assert results.endpoint_codes.itemsize == 4
+        assert results.status_code.typecode == "H"
+
+        get = results["GET v1/items/"]
+        assert (get.count, get.errors) == (10, 0)
+        assert get.latencies == pytest.approx([0.01 * (i + 1) for i in range(10)])
+        assert get.first_at == 100.0
+        assert get.last_at == pytest.approx(102.25 + 0.1)
+        post = results["POST v1/items/"]
+        assert (post.count, post.errors, post.latencies) == (2, 2, [0.5])
+        assert results.group_by_endpoint() is results.endpoints
+
+        with allure.step("Same numbers as RequestStats for the same results"):
+            stats, listener = RequestStats(), ResultSet()
+            for status in (200, 404, 0):
+                stats.record(make_result(status))
+                listener.record(make_result(status))
+            expected = stats["GET v1/items/"]
+            actual = listener["GET v1/items/"]
+            assert (actual.count, actual.errors, actual.latencies) == (
+                expected.count,
+                expected.errors,
+                expected.latencies,
+            )
+
+        with allure.step("Percentiles and SLOs"):
+            assert results.percentiles((50,), "GET v1/items/") == {
+                50: pytest.approx(0.055)
+            }
+            assert results.percentiles((100,))[100] == 0.5
+            assert results.total().count == 12
+            assert_slos(results, "p50 of GET v1/items/ < 60ms")
+            with pytest.raises(AssertionError, match="error_rate"):
+                assert_slos(results, "error_rate < 10%")
+            assert "POST v1/items/" in results.report()
+
+        with allure.step("Appending invalidates cached groups"):
+            results.append(103.0, "get", "v1/items/", 200, 0.02)
+            assert results["GET v1/items/"].count == 11
+
+    @allure.title("TC-RECORD-005: ResultSet aggregates time buckets")
+    @allure.description("Test ResultSet.time_buckets(). TC-RECORD-005")
+    def test_time_buckets(self):
+        """Test ResultSet.time_buckets(). TC-RECORD-005"""
+        results = make_result_set()
+        buckets = results.time_buckets(1.0)
+        assert [b.start for b in buckets] == [100.0, 101.0, 102.0]
+        assert [b.count for b in buckets] == [5, 4, 3]
+        assert [b.errors for b in buckets] == [1, 0, 1]
+        assert buckets[0].max == 0.5
+        assert buckets[2].error_rate == pytest.approx(1 / 3)
+        assert buckets[1].mean == pytest.approx(0.065)
+
+        only_post = results.time_buckets(1.0, endpoint="POST v1/items/")
+        assert [b.count for b in only_post] == [1, 0, 1]
+        assert ResultSet().time_buckets() == []
+        with pytest.raises(ValueError, match="width must be positive"):
+            results.time_buckets(0)
+
+    @allure.title("TC-RECORD-009: ResultSet groups failures by category")
+    @allure.description(
+        "Test ResultSet error category column and breakdowns. TC-RECORD-009"
+    )
+    def test_error_breakdown(self):
+        """Test ResultSet error category column and breakdowns. TC-RECORD-009"""
+        results = make_result_set()
+        results.append(103.0, "GET", "v1/other/", 0, 0.0, 0, ErrorCategory.DNS)
+        results.append(103.1, "GET", "v1/other/", 0, 0.0, 0, ErrorCategory.DNS)
+        results.append(103.2, "GET", "v1/other/", 200, 0.1, 5)
+
+        with allure.step("One byte per request"):
+            assert results.error_codes.itemsize == 1
+            assert len(results.error_codes) == len(results) == 15
+            assert list(results.rows())[-1][-1] is None
+            assert list(results.rows())[-2][-1] is ErrorCategory.DNS
+
+        with allure.step("Totals and per-endpoint breakdowns"):
+            assert results.error_breakdown() == {
+                ErrorCategory.DNS: 2,
+                ErrorCategory.READ_TIMEOUT: 1,
+            }
+            assert list(results.error_breakdown()) == [
+                ErrorCategory.DNS,
+                ErrorCategory.READ_TIMEOUT,
+            ]
+            assert results.error_breakdown("GET v1/items/") == {}
+            assert results.error_breakdown_by_endpoint() == {
+                "POST v1/items/": {ErrorCategory.READ_TIMEOUT: 1},
+                "GET v1/other/": {ErrorCategory.DNS: 2},
+            }
+            with pytest.raises(KeyError):
+                results.error_breakdown("GET v1/missing/")
+            assert ResultSet().error_breakdown() == {}
+
+    @allure.title("TC-RECORD-006: ResultSet streams CSV")
+    @allure.description("Test ResultSet.to_csv(). TC-RECORD-006")
+    def test_to_csv(self, tmp_path):
+        """Test ResultSet.to_csv(). TC-RECORD-006"""
+        results = make_result_set()
+        results.append(104.0, "GET", 'v1/"quoted",path/', 200, 0.1, 3)
+        path = tmp_path / "run.csv"
+        results.to_csv(path, chunk_size=5)
+
+        rows = list(csv.reader(path.open(newline="")))
+        assert rows[0] == list(ResultSet.COLUMNS)
+        assert len(rows) == 14
+        assert rows[1] == ["100.0", "GET v1/items/", "200", "0.01", "10", ""]
+        assert rows[12] == ["102.9", "POST v1/items/", "0", "0.0", "0", "read_timeout"]
+        assert rows[-1] == ["104.0", 'GET v1/"quoted",path/', "200", "0.1", "3", ""]
+
+        stream = io.StringIO()
+        results.to_csv(stream)
+        assert stream.getvalue() == path.read_bytes().decode()
+
+    @allure.title("TC-RECORD-010: CSV rows stay aligned for keys with line breaks")
+    @allure.description(
+        "Test ResultSet.to_csv() with multi-line endpoint keys. TC-RECORD-010"
+    )
+    def test_to_csv_line_breaks_in_keys(self):
+        """Test ResultSet.to_csv() with multi-line endpoint keys. TC-RECORD-010"""
+        endpoints = ["v1/a\nb/", "v1/c\rd/", "v1/e\u2028f/", "v1/plain/"]
+        results = ResultSet()
+        for index, endpoint in enumerate(endpoints):
+            results.append(100.0 + index, "GET", endpoint, 200, 0.1, index)
+
+        stream = io.StringIO(newline="")
+        results.to_csv(stream)
+        stream.seek(0)
+        rows = list(csv.reader(stream))
+        assert len(rows) == len(endpoints) + 1
+        assert [row[1] for row in rows[1:]] == [f"GET {e}" for e in endpoints]
+        assert [row[4] for row in rows[1:]] == ["0", "1", "2", "3"]
+
+    @allure.title("TC-RECORD-007: ResultSet exports Arrow and Parquet")
+    @allure.description(
+        "Test ResultSet Arrow export and missing pyarrow. TC-RECORD-007"
+    )
+    def test_to_arrow(self, tmp_path, monkeypatch):
+        """Test ResultSet Arrow export and missing pyarrow. TC-RECORD-007"""
+        results = make_result_set()
+        with allure.step("Missing pyarrow raises ImportError"):
+            with monkeypatch.context() as patch:
+                patch.setitem(sys.modules, "pyarrow", None)
+                with pytest.raises(ImportError, match="uv add pyarrow"):
+                    results.to_arrow()
+
+        pyarrow = pytest.importorskip("pyarrow")
+        table = results.to_arrow()
+        assert table.num_rows == 12
+        assert table.column_names == list(ResultSet.COLUMNS)
+        assert table.column("endpoint").to_pylist()[-1] == "POST v1/items/"
+        assert table.column("status_code").type == pyarrow.uint16()
+
+        with allure.step("Result set stays appendable while table is alive"):
+            results.record(make_result())
+            assert len(results) == 13
+            assert table.num_rows == 12
+            assert table.column("response_time").to_pylist()[-1] == 0.0
+
+        pytest.importorskip("pyarrow.parquet")
+        results.to_parquet(tmp_path / "run.parquet")
+        assert (tmp_path / "run.parquet").stat().st_size > 0
@@ -0,0 +1,219 @@
+"""
+Unit tests for declarative YAML scenarios.
+"""
+
+import json
+from pathlib import Path
+
+import allure
+import pytest
+from httpx import Request, Response
+
+from tma_test_framework.scenario import (
+    Scenario,
+    ScenarioRunner,
+    extract_path,
+)
+from tests.fixtures.miniapp_api import make_transport_api
+
+SCENARIO_PATH = Path(__file__).parent.parent / "data" / "scenario.yaml"
+
+
+def items_handler(request: Request) -> Response:
+    """Serve a tiny items API for scenario tests."""
+    if request.url.path == "/app/v1/items/":
+        page_size = int(request.url.params.get("page_size", "0"))
+        body = {"count": page_size, "results": [{"id": 42}]}
+        return Response(200, json=body)
+    if request.url.path == "/app/v1/items/42/":
+        return Response(200, json={"id": 42})
+    return Response(404, json={"detail": "Not found"})
+
+
+class TestScenarioLoading:
+    """Test Scenario definition loading and validation."""
+
+    @allure.title("TC-SCENARIO-001: Load scenario from YAML")
+    @allure.description("Test Scenario.from_yaml parses steps. TC-SCENARIO-001")
+    def test_from_yaml(self):
+        """Test Scenario.from_yaml parses steps. TC-SCENARIO-001"""
+        with allure.step("Load scenario from YAML file"):
+            scenario = Scenario.from_yaml(str(SCENARIO_PATH))
+
+        with allure.step("Verify scenario settings"):
+            assert scenario.name == "browse_items"
+            assert scenario.instances == 4
+            assert scenario.concurrency == 2
+        with allure.step("Verify steps, extraction and 'assert' key mapping"):
+            assert len(scenario.steps) == 2
+            assert scenario.steps[0].extract == {"first_id": "results.0.id"}
+            assert scenario.steps[0].assertion.status == 200
+            assert scenario.steps[1].request.method == "GET"
+
+    @allure.title("TC-SCENARIO-002: Missing scenario file raises ValueError")
+    @allure.description("Test from_yaml with missing file. TC-SCENARIO-002")
+    def test_from_yaml_missing_file(self):
+        """Test from_yaml with missing file. TC-SCENARIO-002"""
+        with pytest.raises(ValueError, match="Scenario file not found"):
+            Scenario.from_yaml("missing_scenario.yaml")
+
+    @allure.title("TC-SCENARIO-003: Invalid scenario definitions are rejected")
+    @allure.description("Test validation of steps and concurrency. TC-SCENARIO-003")
+    @pytest.mark.parametrize(
+        "definition",
+        [
+            {"name": "empty", "steps": []},
+            {"name": "bad", "steps": [{"request": {"endpoint": "x"}}], "instances": 0},
+            {
+                "name": "bad",
+                "steps": [{"request": {"endpoint": "x"}}],
+                "concurrency": 0,
+            },
+            {"name": "bad", "steps": [{"request": {}}]},
+        ],
+    )
+    def test_invalid_definition(self, definition):
+        """Test validation of steps and concurrency. TC-SCENARIO-003"""
+        with pytest.raises(ValueError):
+            Scenario.from_dict(definition)
+
+
+class TestExtractPath:
+    """Test extract_path helper."""
+
+    @allure.title("TC-SCENARIO-004: Extract nested values by dotted path")
+    @allure.description("Test extract_path with dicts and lists. TC-SCENARIO-004")
+    def test_extract_nested(self):
+        """Test extract_path with dicts and lists. TC-SCENARIO-004"""
+        data = {"results": [{"id": 1, "tags": ["a", "b"]}]}
+        assert extract_path(data, "results.0.id") == 1
+        assert extract_path(data, "results.0.tags.1") == "b"
+
+    @allure.title("TC-SCENARIO-005: Extract missing path raises KeyError")
+    @allure.description("Test extract_path with missing path. TC-SCENARIO-005")
+    def test_extract_missing(self):
+        """Test extract_path with missing path. TC-SCENARIO-005"""
+        with pytest.raises(KeyError, match="results.5.id"):
+            extract_path({"results": []}, "results.5.id")
+
+
+class TestScenarioRunner:
+    """Test ScenarioRunner execution."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-SCENARIO-006: Run scenario instances with extraction")
+    @allure.description(
+        "Test runner executes all instances and threads extracted values. TC-SCENARIO-006"
+    )
+    async def test_run_passes(self, valid_config):
+        """Test runner executes all instances and threads extracted values. TC-SCENARIO-006"""
+        with allure.step("Create runner on MockTransport-backed ApiClient"):
+            api = make_transport_api(valid_config, items_handler)
+            runner = ScenarioRunner(api)
+            scenario = Scenario.from_yaml(str(SCENARIO_PATH))
+
+        with allure.step("Run scenario"):
+            result = await runner.run(scenario)
+
+        with allure.step("Verify all instances passed"):
+            assert result.passed == 4
+            assert result.failed == 0
+            result.assert_all_passed()
+        with allure.step("Verify extracted id was used by the second step"):
+            assert result.instances[0].steps[1].endpoint == "v1/items/42/"
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-SCENARIO-007: Failed assertion marks instance as failed")
+    @allure.description("Test status assertion failure is reported. TC-SCENARIO-007")
+    async def test_run_reports_failures(self, valid_config):
+        """Test status assertion failure is reported. TC-SCENARIO-007"""
+        scenario = Scenario.from_dict(
+            {
+                "name": "missing",
+                "instances": 2,
+                "steps": [
+                    {"request": {"endpoint": "v1/unknown/"}, "assert": {"status": 200}},
+                    {"request": {"endpoint": "v1/items/"}},
+                ],
+            }
+        )
+        api = make_transport_api(valid_config, items_handler)
+
+        with allure.step("Run scenario"):
+            result = await ScenarioRunner(api).run(scenario)
+
+        with allure.step("Verify failures stop the instance and are reported"):
+            assert result.failed == 2
+            assert len(result.instances[0].steps) == 1
+            assert "Expected status code 200, got 404" in (
+                result.instances[0].error_message or ""
+            )
+            with pytest.raises(AssertionError, match="2 of 2 instances failed"):
+                result.assert_all_passed()
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-SCENARIO-008: Typed placeholders and instance variable")
+    @allure.description(
+        "Test whole-value placeholders keep their type in request data. TC-SCENARIO-008"
+    )
+    async def test_placeholders_keep_type(self, valid_config):
+        """Test whole-value placeholders keep their type in request data. TC-SCENARIO-008"""
+        received = []
+
+        def handler(request: Request) -> Response:
+            received.append(json.loads(request.content))
+            return Response(201, json={"ok": True})
+
+        scenario = Scenario.from_dict(
+            {
+                "name": "create",
+                "variables": {"amount": 5},
+                "steps": [
+                    {
+                        "request": {
+                            "method": "post",
+                            "endpoint": "v1/orders/",
+                            "data": {"amount": "${amount}", "ref": "order-${instance}"},
+                        },
+                        "assert": {"status": 201},
+                    }
+                ],
+            }
+        )
+        api = make_transport_api(valid_config, handler)
+
+        with allure.step("Run scenario with instance override"):
+            result = await ScenarioRunner(api).run(scenario, instances=3, concurrency=3)
+
+        with allure.step("Verify rendered request bodies"):
+            result.assert_all_passed()
+            assert sorted(body["ref"] for body in received) == [
+                "order-0",
+                "order-1",
+                "order-2",
+            ]
+            assert all(body["amount"] == 5 for body in received)
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-SCENARIO-009: Undefined variable fails the instance")
+    @allure.description("Test undefined placeholder is reported. TC-SCENARIO-009")
+    async def test_undefined_variable(self, valid_config):
+        """Test undefined placeholder is reported. TC-SCENARIO-009"""
+        scenario = Scenario.from_dict(
+            {
+                "name": "undefined",
+                "steps": [{"request": {"endpoint": "v1/${missing}/"}}],
+            }
+        )
+        api = make_transport_api(valid_config, items_handler)
+
+        result = await ScenarioRunner(api).run(scenario)
+
+        assert result.failed == 1
+        assert "Undefined scenario variable: missing" in (
+            result.instances[0].error_message or ""
+        )
+        await api.close()
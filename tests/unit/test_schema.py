@@ -0,0 +1,206 @@
+"""
+Unit tests for compiled response schema validation.
+"""
+
+from typing import Annotated, List, Optional
+
+import allure
+import msgspec
+import pytest
+
+from tma_test_framework.clients.models import ApiResult
+from tma_test_framework.schema import (
+    clear_schema_cache,
+    compile_schema,
+    validate_schema,
+)
+
+
+class Owner(msgspec.Struct):
+    """Nested struct used in schema tests."""
+
+    id: int
+    name: str
+
+
+class Item(msgspec.Struct):
+    """Struct schema used in schema tests."""
+
+    id: Annotated[int, msgspec.Meta(ge=1)]
+    owner: Owner
+    tags: List[str] = []
+    note: Optional[str] = None
+
+
+ITEMS_JSON_SCHEMA = {
+    "type": "object",
+    "required": ["count", "results"],
+    "properties": {
+        "count": {"type": "integer", "minimum": 0},
+        "next": {"type": ["string", "null"]},
+        "results": {
+            "type": "array",
+            "maxItems": 2,
+            "items": {
+                "type": "object",
+                "required": ["id", "status"],
+                "properties": {
+                    "id": {"type": "integer"},
+                    "status": {"enum": ["active", "archived"]},
+                    "name": {"type": "string", "minLength": 1},
+                },
+            },
+        },
+    },
+}
+
+
+def make_result(body: bytes) -> ApiResult:
+    """Create successful ApiResult with given body."""
+    return ApiResult(
+        endpoint="v1/items/",
+        method="GET",
+        status_code=200,
+        response_time=0.1,
+        success=True,
+        redirect=False,
+        client_error=False,
+        server_error=False,
+        informational=False,
+        body=body,
+    )
+
+
+class TestCompileSchema:
+    """Test compile_schema caching."""
+
+    @allure.title("TC-SCHEMA-001: Struct schema compiles to cached decoder")
+    @allure.description("Test compile_schema returns the same decoder. TC-SCHEMA-001")
+    def test_type_schema_cached(self):
+        """Test compile_schema returns the same decoder. TC-SCHEMA-001"""
+        clear_schema_cache()
+        assert compile_schema(List[Item]) is compile_schema(List[Item])
+
+    @allure.title("TC-SCHEMA-002: JSON-Schema dict cached regardless of key order")
+    @allure.description("Test equal JSON-Schema dicts share a decoder. TC-SCHEMA-002")
+    def test_json_schema_cached(self):
+        """Test equal JSON-Schema dicts share a decoder. TC-SCHEMA-002"""
+        reordered = dict(reversed(list(ITEMS_JSON_SCHEMA.items())))
+        assert compile_schema(ITEMS_JSON_SCHEMA) is compile_schema(reordered)
+
+    @allure.title("TC-SCHEMA-003: Unsupported schema raises ValueError")
+    @allure.description("Test invalid schemas are rejected. TC-SCHEMA-003")
+    @pytest.mark.parametrize("schema", [object(), {"type": "tuple"}])
+    def test_invalid_schema(self, schema):
+        """Test invalid schemas are rejected. TC-SCHEMA-003"""
+        with pytest.raises(ValueError):
+            compile_schema(schema)
+
+
+class TestValidateSchema:
+    """Test validate_schema with Struct and JSON-Schema definitions."""
+
+    @allure.title("TC-SCHEMA-004: Valid nested body decodes into Structs")
+    @allure.description("Test Struct schema decodes nested data. TC-SCHEMA-004")
+    def test_struct_schema_valid(self):
+        """Test Struct schema decodes nested data. TC-SCHEMA-004"""
+        body = b'[{"id": 1, "owner": {"id": 7, "name": "a"}, "tags": ["x"]}]'
+        items = validate_schema(body, List[Item])
+        assert items[0].owner.name == "a"
+        assert items[0].tags == ["x"]
+
+    @allure.title("TC-SCHEMA-005: Nested constraint violation reports path")
+    @allure.description("Test constraint failures include the JSON path. TC-SCHEMA-005")
+    def test_struct_schema_constraint_violation(self):
+        """Test constraint failures include the JSON path. TC-SCHEMA-005"""
+        body = b'[{"id": 0, "owner": {"id": 7, "name": "a"}}]'
+        with pytest.raises(ValueError, match=r"\$\[0\]\.id"):
+            validate_schema(body, List[Item])
+
+    @allure.title("TC-SCHEMA-006: JSON-Schema validates types, enums and constraints")
+    @allure.description("Test JSON-Schema subset validation. TC-SCHEMA-006")
+    @pytest.mark.parametrize(
+        "body, valid",
+        [
+            (
+                b'{"count": 1, "next": null, "results": [{"id": 1, "status": "active"}]}',
+                True,
+            ),
+            (b'{"count": 1, "results": [{"id": 1, "status": "deleted"}]}', False),
+            (b'{"count": -1, "results": []}', False),
+            (b'{"count": 1, "results": [{"id": "1", "status": "active"}]}', False),
+            (
+                b'{"count": 1, "results": [{"id": 1, "status": "active", "name": ""}]}',
+                False,
+            ),
+            (
+                b'{"count": 3, "results": [{"id": 1, "status": "active"}, {"id": 2, "status": "active"}, {"id": 3, "status": "active"}]}',
+                False,
+            ),
+            (b'{"results": []}', False),
+            (b"not json", False),
+        ],
+    )
+    def test_json_schema(self, body, valid):
+        """Test JSON-Schema subset validation. TC-SCHEMA-006"""
+        if valid:
+            data = validate_schema(body, ITEMS_JSON_SCHEMA)
+            assert data.results[0].status == "active"
+        else:
+            with pytest.raises(ValueError, match="Schema validation failed"):
+                validate_schema(body, ITEMS_JSON_SCHEMA)
+
+    @allure.title("TC-SCHEMA-009: JSON-Schema keys that are not identifiers")
+    @allure.description("Test hyphenated and reserved property names. TC-SCHEMA-009")
+    def test_json_schema_non_identifier_keys(self):
+        """Test hyphenated and reserved property names. TC-SCHEMA-009"""
+        schema = {
+            "type": "object",
+            "required": ["first-name"],
+            "properties": {
+                "first-name": {"type": "string"},
+                "first_name": {"type": "integer"},
+                "class": {"type": "integer"},
+                "2fa": {
+                    "type": "object",
+                    "properties": {"x-enabled": {"type": "boolean"}},
+                },
+            },
+        }
+        body = (
+            b'{"first-name": "Ann", "first_name": 1, "class": 2,'
+            b' "2fa": {"x-enabled": true}}'
+        )
+        data = validate_schema(body, schema)
+        assert data.first_name == 1
+        assert data.first_name_2 == "Ann"
+        assert data.f_class == 2
+        assert data.f_2fa.x_enabled is True
+        assert msgspec.json.decode(msgspec.json.encode(data)) == msgspec.json.decode(
+            body
+        )
+
+        with allure.step("Required renamed key is still enforced by original name"):
+            with pytest.raises(ValueError, match="`first-name`"):
+                validate_schema(b'{"first_name": 1}', schema)
+
+
+class TestApiResultAssertMatchesSchema:
+    """Test ApiResult.assert_matches_schema."""
+
+    @allure.title("TC-SCHEMA-007: assert_matches_schema returns decoded data")
+    @allure.description("Test assertion returns typed data. TC-SCHEMA-007")
+    def test_assert_matches_schema_success(self):
+        """Test assertion returns typed data. TC-SCHEMA-007"""
+        result = make_result(b'{"id": 3, "owner": {"id": 1, "name": "b"}}')
+        item = result.assert_matches_schema(Item)
+        assert isinstance(item, Item)
+        assert item.id == 3
+
+    @allure.title("TC-SCHEMA-008: assert_matches_schema raises AssertionError")
+    @allure.description("Test assertion failure message. TC-SCHEMA-008")
+    def test_assert_matches_schema_failure(self):
+        """Test assertion failure message. TC-SCHEMA-008"""
+        result = make_result(b'{"id": 3}')
+        with pytest.raises(AssertionError, match="GET v1/items/ does not match schema"):
+            result.assert_matches_schema(Item)
@@ -0,0 +1,161 @@
+"""
+Unit tests for msgpack serialization and message streams.
+"""
+
+import asyncio
+import io
+import multiprocessing
+from typing import List
+
+import allure
+import pytest
+
+from tma_test_framework.clients.models import ApiResult
+from tma_test_framework.clients.mtproto_client import ChatInfo, MessageInfo, UserInfo
+from tma_test_framework.records import ResultRecord
+from tma_test_framework.serialization import (
+    PREFIX_SIZE,
+    MessageReader,
+    MessageWriter,
+    decode,
+    encode,
+    read_messages,
+)
+from tests.data.constants import (
+    VALID_API_RESULT_DATA,
+    VALID_CHAT_INFO_DATA,
+    VALID_MESSAGE_INFO_DATA,
+    VALID_USER_INFO_DATA,
+)
+
+USER = UserInfo(**VALID_USER_INFO_DATA)
+CHAT = ChatInfo(**VALID_CHAT_INFO_DATA)
+MESSAGE = MessageInfo(**{**VALID_MESSAGE_INFO_DATA, "chat": CHAT, "from_user": USER})
+RESULT = ApiResult(**VALID_API_RESULT_DATA)  # type: ignore[arg-type]
+
+
+def _write_results(path: str, count: int) -> None:
+    """Write results from a separate process."""
+    with MessageWriter(open(path, "wb")) as writer:
+        for index in range(count):
+            writer.write(ResultRecord(float(index), "v1/items/", "GET", 200, 0.1))
+
+
+class TestEncodeDecode:
+    """Test encode() and decode()."""
+
+    @allure.title("TC-SERIAL-001: Framework models round-trip through msgpack")
+    @allure.description("Test encode()/decode() of framework models. TC-SERIAL-001")
+    @pytest.mark.parametrize(
+        "value,type_",
+        [
+            (RESULT, ApiResult),
+            (USER, UserInfo),
+            (CHAT, ChatInfo),
+            (MESSAGE, MessageInfo),
+            (ResultRecord(1.0, "v1/", "GET", 200, 0.1), ResultRecord),
+            ([USER, USER], List[UserInfo]),
+        ],
+    )
+    def test_round_trip(self, value, type_):
+        """Test encode()/decode() of framework models. TC-SERIAL-001"""
+        assert decode(encode(value), type_) == value
+
+    @allure.title("TC-SERIAL-002: Invalid data raises ValueError")
+    @allure.description("Test decode() error handling. TC-SERIAL-002")
+    def test_invalid_data(self):
+        """Test decode() error handling. TC-SERIAL-002"""
+        with pytest.raises(ValueError, match="Failed to decode"):
+            decode(encode(USER), ChatInfo)
+        with pytest.raises(ValueError, match="Failed to decode"):
+            decode(b"\xc1", UserInfo)
+
+
+class TestMessageStreams:
+    """Test MessageWriter, MessageReader and read_messages()."""
+
+    @allure.title("TC-SERIAL-003: Length-prefixed stream round-trips messages")
+    @allure.description("Test MessageWriter and MessageReader. TC-SERIAL-003")
+    def test_stream_round_trip(self):
+        """Test MessageWriter and MessageReader. TC-SERIAL-003"""
+        stream = io.BytesIO()
+        writer = MessageWriter(stream, buffer_size=1024)
+        writer.write_many([RESULT] * 50)
+        total = 50 * (PREFIX_SIZE + len(encode(RESULT)))
+        assert 0 <= total - len(stream.getvalue()) < 1024
+        writer.flush()
+        assert writer.count == 50
+        assert len(stream.getvalue()) == total
+
+        stream.seek(0)
+        reader = MessageReader(stream, ApiResult, chunk_size=100)
+        assert reader.read() == RESULT
+        assert reader.read_all() == [RESULT] * 49
+        assert reader.read() is None
+        assert list(MessageReader(io.BytesIO(), ApiResult)) == []
+
+        with allure.step("Writer as result listener closes stream on exit"):
+            stream = io.BytesIO()
+            with MessageWriter(stream, buffer_size=0) as writer:
+                writer.write(USER)
+                assert len(stream.getvalue()) == PREFIX_SIZE + len(encode(USER))
+            assert stream.closed
+        with pytest.raises(ValueError, match="buffer_size"):
+            MessageWriter(io.BytesIO(), buffer_size=-1)
+
+    @allure.title("TC-SERIAL-004: Truncated streams raise ValueError")
+    @allure.description("Test truncated and corrupted streams. TC-SERIAL-004")
+    def test_truncated(self):
+        """Test truncated and corrupted streams. TC-SERIAL-004"""
+        stream = io.BytesIO()
+        writer = MessageWriter(stream)
+        writer.write_many([USER, USER])
+        writer.flush()
+        data = stream.getvalue()
+
+        reader = MessageReader(io.BytesIO(data[:-3]), UserInfo)
+        assert reader.read() == USER
+        with pytest.raises(ValueError, match="expected .* bytes"):
+            reader.read()
+        with pytest.raises(ValueError, match="incomplete length prefix"):
+            MessageReader(io.BytesIO(b"\x00\x00"), UserInfo).read()
+        with pytest.raises(ValueError, match="Failed to decode"):
+            MessageReader(io.BytesIO(data), ChatInfo).read()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-SERIAL-005: Messages are read from asyncio streams")
+    @allure.description("Test read_messages() over StreamReader. TC-SERIAL-005")
+    async def test_read_messages(self):
+        """Test read_messages() over StreamReader. TC-SERIAL-005"""
+        stream = io.BytesIO()
+        writer = MessageWriter(stream)
+        writer.write_many([MESSAGE] * 3)
+        writer.flush()
+        data = stream.getvalue()
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        assert [m async for m in read_messages(reader, MessageInfo)] == [MESSAGE] * 3
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(data[:-1])
+        reader.feed_eof()
+        with pytest.raises(ValueError, match="Truncated message stream"):
+            _ = [m async for m in read_messages(reader, MessageInfo)]
+
+    @allure.title("TC-SERIAL-006: Stream written by another process is readable")
+    @allure.description("Test cross-process streaming through a file. TC-SERIAL-006")
+    def test_cross_process(self, tmp_path):
+        """Test cross-process streaming through a file. TC-SERIAL-006"""
+        path = tmp_path / "results.bin"
+        process = multiprocessing.get_context("spawn").Process(
+            target=_write_results, args=(str(path), 1000)
+        )
+        process.start()
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+        with path.open("rb") as file:
+            records = MessageReader(file, ResultRecord).read_all()
+        assert [r.started_at for r in records] == [float(i) for i in range(1000)]
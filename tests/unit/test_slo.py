@@ -0,0 +1,112 @@
+"""
+Unit tests for SLO assertions.
+"""
+
+import allure
+import pytest
+
+from tma_test_framework.slo import SLO, assert_slos, check_slo
+from tma_test_framework.stats import RequestStats, EndpointStats
+
+
+def make_stats(latencies, errors: int = 0, duration: float = 1.0) -> RequestStats:
+    """Create RequestStats with one GET v1/items/ endpoint."""
+    endpoint = EndpointStats(
+        key="GET v1/items/",
+        count=len(latencies) + errors,
+        errors=errors,
+        latencies=list(latencies),
+        first_at=0.0,
+        last_at=duration,
+    )
+    stats = RequestStats()
+    stats.endpoints[endpoint.key] = endpoint
+    return stats
+
+
+class TestSLOParse:
+    """Test SLO expression parsing."""
+
+    @allure.title("TC-SLO-001: Parse SLO expressions with units")
+    @allure.description(
+        "Test SLO.parse for latency, error rate, throughput. TC-SLO-001"
+    )
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            (
+                "p95 of GET v1/items/ < 300ms",
+                SLO(metric="p95", threshold=0.3, endpoint="GET v1/items/"),
+            ),
+            ("error rate < 0.5%", SLO(metric="error_rate", threshold=0.005)),
+            (
+                "throughput > 200 rps",
+                SLO(metric="throughput", threshold=200.0, comparison=">"),
+            ),
+            ("max <= 2s", SLO(metric="max", threshold=2.0, comparison="<=")),
+            ("P99.9 < 1", SLO(metric="p99.9", threshold=1.0)),
+        ],
+    )
+    def test_parse(self, expression, expected):
+        """Test SLO.parse for latency, error rate, throughput. TC-SLO-001"""
+        assert SLO.parse(expression) == expected
+
+    @allure.title("TC-SLO-002: Invalid SLO expressions raise ValueError")
+    @allure.description("Test invalid expressions and metrics. TC-SLO-002")
+    @pytest.mark.parametrize(
+        "expression", ["latency < 3", "p95 = 300ms", "p101 < 1", ""]
+    )
+    def test_parse_invalid(self, expression):
+        """Test invalid expressions and metrics. TC-SLO-002"""
+        with pytest.raises(ValueError):
+            SLO.parse(expression)
+
+
+class TestCheckSLO:
+    """Test SLO evaluation."""
+
+    @allure.title("TC-SLO-003: SLOs pass on healthy statistics")
+    @allure.description("Test assert_slos returns results. TC-SLO-003")
+    def test_assert_slos_pass(self):
+        """Test assert_slos returns results. TC-SLO-003"""
+        stats = make_stats([0.1] * 99 + [0.2], duration=0.5)
+        results = assert_slos(
+            stats,
+            "p95 of GET v1/items/ < 300ms",
+            "error_rate < 0.5%",
+            "throughput > 100rps",
+        )
+        assert all(result.passed for result in results)
+        assert results[2].actual == pytest.approx(200.0)
+
+    @allure.title("TC-SLO-004: Violated SLO raises readable report")
+    @allure.description(
+        "Test assert_slos failure message includes distribution. TC-SLO-004"
+    )
+    def test_assert_slos_failure_report(self):
+        """Test assert_slos failure message includes distribution. TC-SLO-004"""
+        stats = make_stats([0.1] * 90 + [0.5] * 10, errors=2)
+        with pytest.raises(AssertionError) as error:
+            assert_slos(stats, "p95 < 300ms", "error rate < 1%", "max < 1s")
+        message = str(error.value)
+        assert message.startswith("2 of 3 SLOs violated")
+        assert "SLO violated: p95 < 300.0ms (actual: 500.0ms)" in message
+        assert "error_rate < 1.000%" in message
+        assert "latency ms:" in message
+
+    @allure.title("TC-SLO-005: SLO for unknown endpoint fails")
+    @allure.description("Test check_slo with endpoint without requests. TC-SLO-005")
+    def test_unknown_endpoint(self):
+        """Test check_slo with endpoint without requests. TC-SLO-005"""
+        result = check_slo(make_stats([0.1]), "p95 of GET v1/other/ < 1s")
+        assert result.passed is False
+        assert result.actual is None
+        assert "recorded: GET v1/items/" in result.report
+
+    @allure.title("TC-SLO-006: SLO on empty statistics fails")
+    @allure.description("Test check_slo without any requests. TC-SLO-006")
+    def test_empty_stats(self):
+        """Test check_slo without any requests. TC-SLO-006"""
+        result = check_slo(RequestStats(), SLO(metric="mean", threshold=1.0))
+        assert result.passed is False
+        assert result.report == "No requests recorded"
@@ -0,0 +1,121 @@
+"""
+Unit tests for aggregated request statistics.
+"""
+
+import allure
+import pytest
+
+from tma_test_framework.clients.models import ApiResult
+from tma_test_framework.stats import EndpointStats, RequestStats, percentile
+
+
+def make_result(
+    endpoint: str = "v1/items/",
+    status_code: int = 200,
+    response_time: float = 0.1,
+    method: str = "GET",
+) -> ApiResult:
+    """Create ApiResult with status flags derived from status code."""
+    return ApiResult(
+        endpoint=endpoint,
+        method=method,
+        status_code=status_code,
+        response_time=response_time,
+        success=200 <= status_code < 300,
+        redirect=300 <= status_code < 400,
+        client_error=400 <= status_code < 500,
+        server_error=500 <= status_code < 600,
+        informational=100 <= status_code < 200,
+    )
+
+
+class TestPercentile:
+    """Test percentile helper."""
+
+    @allure.title("TC-STATS-001: Percentile interpolates between ranks")
+    @allure.description("Test percentile with linear interpolation. TC-STATS-001")
+    def test_percentile_interpolation(self):
+        """Test percentile with linear interpolation. TC-STATS-001"""
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 95) == 0.0
+
+    @allure.title("TC-STATS-002: Percentile out of range raises ValueError")
+    @allure.description("Test percentile with q > 100. TC-STATS-002")
+    def test_percentile_out_of_range(self):
+        """Test percentile with q > 100. TC-STATS-002"""
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            percentile([1.0], 101)
+
+
+class TestRequestStats:
+    """Test RequestStats collector."""
+
+    @allure.title("TC-STATS-003: Record groups results per endpoint")
+    @allure.description("Test record() groups by method and endpoint. TC-STATS-003")
+    def test_record_groups_by_endpoint(self):
+        """Test record() groups by method and endpoint. TC-STATS-003"""
+        stats = RequestStats()
+        stats.record(make_result())
+        stats.record(make_result(status_code=500, response_time=0.3))
+        stats.record(make_result(method="post", status_code=201))
+
+        with allure.step("Verify endpoint keys and counters"):
+            assert sorted(stats.endpoints) == ["GET v1/items/", "POST v1/items/"]
+            assert stats["GET v1/items/"].count == 2
+            assert stats["GET v1/items/"].errors == 1
+            assert stats["GET v1/items/"].error_rate == 0.5
+            assert stats.total().count == 3
+
+    @allure.title("TC-STATS-004: Transport failures count without latency")
+    @allure.description(
+        "Test status_code=0 results count as errors without latency. TC-STATS-004"
+    )
+    def test_transport_failure_has_no_latency(self):
+        """Test status_code=0 results count as errors without latency. TC-STATS-004"""
+        stats = RequestStats()
+        stats.record(make_result(status_code=0, response_time=0))
+        endpoint = stats["GET v1/items/"]
+        assert endpoint.errors == 1
+        assert endpoint.latencies == []
+
+    @allure.title("TC-STATS-005: Custom key function collapses endpoints")
+    @allure.description("Test key_func groups parametrized paths. TC-STATS-005")
+    def test_custom_key_func(self):
+        """Test key_func groups parametrized paths. TC-STATS-005"""
+        stats = RequestStats(key_func=lambda result: result.endpoint.split("/")[0])
+        stats.record(make_result(endpoint="items/1"))
+        stats.record(make_result(endpoint="items/2"))
+        assert stats["items"].count == 2
+
+    @allure.title("TC-STATS-006: Merge combines collectors")
+    @allure.description("Test merge() sums counters and latencies. TC-STATS-006")
+    def test_merge(self):
+        """Test merge() sums counters and latencies. TC-STATS-006"""
+        first, second = RequestStats(), RequestStats()
+        first.record(make_result(response_time=0.1))
+        second.record(make_result(response_time=0.2))
+        second.record(make_result(endpoint="v1/users/"))
+
+        first.merge(second)
+
+        assert first["GET v1/items/"].count == 2
+        assert sorted(first["GET v1/items/"].latencies) == [0.1, 0.2]
+        assert first["GET v1/users/"].count == 1
+        assert second["GET v1/items/"].count == 1
+
+    @allure.title("TC-STATS-007: Report shows percentiles and histogram")
+    @allure.description("Test report() renders distribution. TC-STATS-007")
+    def test_report(self):
+        """Test report() renders distribution. TC-STATS-007"""
+        endpoint = EndpointStats(key="GET v1/items/")
+        for index, latency in enumerate([0.02, 0.04, 0.3, 6.0]):
+            endpoint.record(latency, error=False, timestamp=10.0 + index)
+        report = endpoint.report()
+        assert report.startswith("GET v1/items/: count=4 errors=0")
+        assert "p95=" in report
+        assert "<=50ms" in report
+        assert ">5000ms" in report
+        assert endpoint.throughput > 0
@@ -0,0 +1,246 @@
+"""
+Unit tests for SSE and WebSocket streaming clients.
+"""
+
+import asyncio
+import time
+
+import allure
+import msgspec
+import pytest
+from httpx import Response
+
+from tma_test_framework.clients.api_client import ApiClient
+from tma_test_framework.clients.streaming import (
+    SSEParser,
+    StreamMessage,
+    StreamStats,
+    timestamp_latency,
+)
+from tests.fixtures.miniapp_api import make_transport_api
+
+
+class TestSSEParser:
+    """Test text/event-stream parsing."""
+
+    @allure.title("TC-STREAM-001: Parser assembles events from lines")
+    @allure.description(
+        "Test SSEParser event, id, retry and multiline data. TC-STREAM-001"
+    )
+    def test_parse_events(self):
+        """Test SSEParser event, id, retry and multiline data. TC-STREAM-001"""
+        parser = SSEParser()
+        lines = [
+            ": keep-alive",
+            "retry: 2500",
+            "event: update",
+            "id: 7",
+            "data: line1",
+            "data:line2",
+            "",
+            "",
+            "data: plain",
+            "",
+            "retry: \u00b2",
+        ]
+        messages = [m for m in (parser.feed(line) for line in lines) if m is not None]
+
+        assert [(m.event, m.id, m.data) for m in messages] == [
+            ("update", "7", "line1\nline2"),
+            ("message", "7", "plain"),
+        ]
+        assert parser.retry == 2.5
+        assert parser.last_event_id == "7"
+
+
+class TestStreamStats:
+    """Test stream statistics."""
+
+    @allure.title("TC-STREAM-002: Stream stats compute rate, latency and merge")
+    @allure.description(
+        "Test StreamStats message_rate, percentile, merge. TC-STREAM-002"
+    )
+    def test_stats(self):
+        """Test StreamStats message_rate, percentile, merge. TC-STREAM-002"""
+        first, second = StreamStats(), StreamStats(reconnects=1)
+        for index in range(5):
+            first.record_message(0.01 * (index + 1), timestamp=10.0 + index * 0.5)
+        second.record_message(None, timestamp=13.0)
+
+        assert first.message_rate == pytest.approx(2.0)
+        assert first.percentile(100) == pytest.approx(0.05)
+
+        first.merge(second)
+        assert (first.messages, first.reconnects, len(first.latencies)) == (6, 1, 5)
+        assert first.last_at == 13.0
+
+    @allure.title("TC-STREAM-003: timestamp_latency measures from payload field")
+    @allure.description("Test latency from JSON send timestamp. TC-STREAM-003")
+    def test_timestamp_latency(self):
+        """Test latency from JSON send timestamp. TC-STREAM-003"""
+        measure = timestamp_latency("sent_ms", scale=0.001)
+        message = StreamMessage(data='{"sent_ms": 1000500}', received_at=1001.0)
+        assert measure(message) == pytest.approx(0.5)
+        assert measure(StreamMessage(data="not json")) is None
+        assert measure(StreamMessage(data="{}")) is None
+
+
+class TestStreamEvents:
+    """Test ApiClient.stream_events()."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-STREAM-004: SSE stream authenticates and reconnects")
+    @allure.description(
+        "Test stream_events sends token, Last-Event-ID and counts reconnects. TC-STREAM-004"
+    )
+    async def test_stream_events_reconnect(self, valid_config):
+        """Test stream_events sends token, Last-Event-ID and counts reconnects. TC-STREAM-004"""
+        with allure.step("Create SSE endpoint sending 3 events, then nothing"):
+            requests = []
+
+            def handler(request):
+                requests.append(request)
+                event_id = len(requests)
+                sent = time.time() - 0.2
+                body = "retry: 0\n"
+                if event_id <= 3:
+                    body += f'id: {event_id}\ndata: {{"ts": {sent}}}\n\n'
+                return Response(
+                    200,
+                    content=body.encode(),
+                    headers={"Content-Type": "text/event-stream"},
+                )
+
+            api = make_transport_api(valid_config, handler)
+            api.set_auth_token("token-1")
+
+        with allure.step("Consume stream until reconnects are exhausted"):
+            stats = StreamStats()
+            stream = api.stream_events(
+                "v1/updates/",
+                stats=stats,
+                latency_func=timestamp_latency("ts"),
+                max_reconnects=2,
+            )
+            messages = [message async for message in stream]
+
+        with allure.step("Verify messages, headers and statistics"):
+            assert [message.id for message in messages] == ["1", "2", "3"]
+            assert requests[0].headers["Authorization"] == "Bearer token-1"
+            assert requests[0].headers["Accept"] == "text/event-stream"
+            assert "Last-Event-ID" not in requests[0].headers
+            assert requests[2].headers["Last-Event-ID"] == "2"
+            assert requests[4].headers["Last-Event-ID"] == "3"
+        with allure.step("Messages reset the limit, 2 empty reconnects end it"):
+            assert len(requests) == 5
+            assert stats.messages == 3
+            assert stats.reconnects == 4
+            assert stats.errors == 0
+            assert stats.percentile(50) == pytest.approx(0.2, abs=0.1)
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-STREAM-005: Rejected SSE subscription is not retried")
+    @allure.description("Test 401 response raises without reconnect. TC-STREAM-005")
+    async def test_stream_events_rejected(self, valid_config):
+        """Test 401 response raises without reconnect. TC-STREAM-005"""
+        api = make_transport_api(valid_config, lambda request: Response(401))
+        stream = api.stream_events("v1/updates/")
+        with pytest.raises(Exception, match="401"):
+            async for _ in stream:
+                pass
+        assert stream.stats.errors == 1
+        assert stream.stats.reconnects == 0
+        await api.close()
+
+    @pytest.mark.asyncio
+    @allure.title("TC-STREAM-008: SSE stream is not limited by the read timeout")
+    @allure.description(
+        "Test stream_events replaces the read timeout with idle_timeout. TC-STREAM-008"
+    )
+    async def test_stream_events_idle_timeout(self, valid_config):
+        """Test stream_events replaces the read timeout with idle_timeout. TC-STREAM-008"""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return Response(
+                200,
+                content=b"data: x\n\n",
+                headers={"Content-Type": "text/event-stream"},
+            )
+
+        api = make_transport_api(valid_config, handler)
+        with allure.step("Default: no read timeout, connect timeout from config"):
+            async for _ in api.stream_events("v1/updates/", reconnect=False):
+                pass
+            assert timeouts[0]["read"] is None
+            assert timeouts[0]["connect"] == valid_config.timeout
+        with allure.step("idle_timeout becomes the read timeout"):
+            async for _ in api.stream_events(
+                "v1/updates/", reconnect=False, idle_timeout=30.0
+            ):
+                pass
+            assert timeouts[1]["read"] == 30.0
+        with allure.step("Regular requests keep the configured read timeout"):
+            await api.make_request("v1/status/")
+            assert timeouts[2]["read"] == valid_config.timeout
+        await api.close()
+
+
+class TestWebSocket:
+    """Test ApiClient.websocket()."""
+
+    @pytest.mark.asyncio
+    @allure.title("TC-STREAM-006: WebSocket sends token and records messages")
+    @allure.description(
+        "Test websocket handshake auth, send/receive and statistics. TC-STREAM-006"
+    )
+    async def test_websocket_echo(self, valid_config):
+        """Test websocket handshake auth, send/receive and statistics. TC-STREAM-006"""
+        pytest.importorskip("websockets")
+        from websockets.asyncio.server import serve
+
+        with allure.step("Start local WebSocket echo server"):
+            auth_headers = []
+
+            async def echo(connection):
+                auth_headers.append(connection.request.headers.get("Authorization"))
+                async for message in connection:
+                    await connection.send(message)
+                    if msgspec.json.decode(message)["n"] == 2:
+                        await connection.close()
+
+            server = await serve(echo, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+
+        try:
+            with allure.step("Send messages and read echoes"):
+                api = ApiClient(f"http://127.0.0.1:{port}", valid_config)
+                api.set_auth_token("token-2", token_type="tma")
+                async with api.websocket("v1/ws/") as ws:
+                    assert ws.url == f"ws://127.0.0.1:{port}/v1/ws/"
+                    for n in range(3):
+                        await ws.send({"n": n})
+                    received = [message.json()["n"] async for message in ws]
+                await api.close()
+        finally:
+            server.close()
+            await asyncio.wait_for(server.wait_closed(), 5)
+
+        with allure.step("Verify auth header and statistics"):
+            assert auth_headers == ["tma token-2"]
+            assert received == [0, 1, 2]
+            assert ws.stats.messages == 3
+            assert ws.stats.reconnects == 0
+
+    @pytest.mark.asyncio
+    @allure.title("TC-STREAM-007: WebSocket send before connect raises RuntimeError")
+    @allure.description("Test send() on unconnected stream. TC-STREAM-007")
+    async def test_websocket_send_not_connected(self, valid_config):
+        """Test send() on unconnected stream. TC-STREAM-007"""
+        api = make_transport_api(valid_config, lambda request: Response(200))
+        ws = api.websocket("v1/ws/")
+        with pytest.raises(RuntimeError, match="not connected"):
+            await ws.send("ping")
+        await api.close()
@@ -2,8 +2,42 @@
 from .clients.mtproto_client import UserTelegramClient, UserInfo, ChatInfo, MessageInfo
 from .clients.api_client import ApiClient as MiniAppApi
 from .clients.ui_client import UiClient as MiniAppUI
-from .clients.models import MiniAppInfo, ApiResult
-from .config import Config
+from .clients.models import (
+    MiniAppInfo,
+    ApiResult,
+    ErrorCategory,
+    ProvisionedUser,
+    ProvisioningError,
+)
+from .clients.network import CachingNetworkBackend, ConnectionStats
+from .clients.streaming import StreamMessage, StreamStats, timestamp_latency
+from .config import Config, PerformanceConfig
+from .log import configure_logging
+from .deadline import deadline, DeadlineExceeded
+from .init_data import (
+    BaseInitDataValidator,
+    Ed25519InitDataSigner,
+    Ed25519InitDataValidator,
+    InitDataSigner,
+    InitDataTemplate,
+    InitDataUser,
+    InitDataValidation,
+    InitDataValidator,
+    check_init_data,
+    check_init_data_signature,
+    get_signer,
+    generate_init_data_batch,
+)
+from .schema import compile_schema, validate_schema
+from .stats import RequestStats, EndpointStats
+from .slo import SLO, assert_slos, check_slo
+from .scenario import Scenario, ScenarioRunner, ScenarioRunResult
+from .load import LoadRunner, LoadReport
+from .records import ResultRecord, ResultRecorder, ResultSet, error_breakdown
+from .serialization import MessageReader, MessageWriter
+from .baseline import Baseline, BaselineComparison
+from .fuzz import InitDataFuzzer, FuzzReport, generate_mutations
+from .identity_cache import IdentityCache
 from .utils import (
     parse_json,
     validate_response_structure,
@@ -25,7 +59,55 @@ __all__ = [
     "MiniAppUI",
     "MiniAppInfo",
     "ApiResult",
+    "ErrorCategory",
+    "ProvisionedUser",
+    "ProvisioningError",
+    "CachingNetworkBackend",
+    "ConnectionStats",
+    "StreamMessage",
+    "StreamStats",
+    "timestamp_latency",
     "Config",
+    "PerformanceConfig",
+    "configure_logging",
+    "deadline",
+    "DeadlineExceeded",
+    "InitDataSigner",
+    "Ed25519InitDataSigner",
+    "Ed25519InitDataValidator",
+    "InitDataTemplate",
+    "InitDataUser",
+    "InitDataValidation",
+    "InitDataValidator",
+    "BaseInitDataValidator",
+    "check_init_data",
+    "check_init_data_signature",
+    "get_signer",
+    "generate_init_data_batch",
+    "compile_schema",
+    "validate_schema",
+    "RequestStats",
+    "EndpointStats",
+    "SLO",
+    "assert_slos",
+    "check_slo",
+    "Scenario",
+    "ScenarioRunner",
+    "ScenarioRunResult",
+    "LoadRunner",
+    "LoadReport",
+    "ResultRecord",
+    "ResultRecorder",
+    "ResultSet",
+    "error_breakdown",
+    "MessageReader",
+    "MessageWriter",
+    "Baseline",
+    "BaselineComparison",
+    "InitDataFuzzer",
+    "FuzzReport",
+    "generate_mutations",
+    "IdentityCache",
     "parse_json",
     "validate_response_structure",
     "extract_pagination_info",
@@ -0,0 +1,453 @@
+"""
+Run-to-run performance baselines with statistical regression testing.
+
+A Baseline stores, per endpoint, a quantile sketch of the latency
+distribution plus counts and throughput. A later run is compared against
+it with a one-sided Mann-Whitney U test and a bootstrap confidence interval
+on the latency percentile difference, so noise does not raise false alarms:
+
+    Baseline.from_stats(stats, label="main").save("perf-baseline.json")
+    ...
+    comparison = Baseline.load("perf-baseline.json").compare(stats)
+    comparison.assert_no_regressions()
+"""
+
+# Python imports
+from math import erfc, floor, sqrt
+from pathlib import Path
+from random import Random
+from time import time
+from typing import Optional, Dict, List, Any, Tuple, Union, TYPE_CHECKING
+import msgspec
+
+# Local imports
+from .stats import EndpointStats, RequestStats, percentile
+
+if TYPE_CHECKING:
+    from .load import EndpointLoadStats, LoadReport
+    from .records import ResultSet
+
+DEFAULT_SAMPLE_SIZE = 1000
+
+# Outcomes of comparing one endpoint
+REGRESSED = "regressed"
+IMPROVED = "improved"
+UNCHANGED = "unchanged"
+INSUFFICIENT = "insufficient"
+NEW = "new"
+MISSING = "missing"
+
+
+def latency_sketch(
+    stats: Union[EndpointStats, "EndpointLoadStats"],
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> List[float]:
+    """
+    Summarize latency distribution by evenly spaced quantiles.
+
+    Args:
+        stats: Endpoint statistics (raw latencies or load histogram)
+        sample_size: Maximum number of quantiles kept
+
+    Returns:
+        Sorted list of at most sample_size latencies in seconds
+    """
+    if isinstance(stats, EndpointStats):
+        latencies = stats.latencies
+        samples = len(latencies)
+        latencies.sort()
+        if samples <= sample_size:
+            return list(latencies)
+        return [
+            percentile(latencies, 100 * (i + 0.5) / sample_size)
+            for i in range(sample_size)
+        ]
+    samples = min(stats.histogram.count, sample_size)
+    return [stats.percentile(100 * (i + 0.5) / samples) for i in range(samples)]
+
+
+class EndpointBaseline(msgspec.Struct, frozen=True):
+    """Baseline of one endpoint."""
+
+    key: str
+    count: int
+    errors: int
+    throughput: float
+    latencies: List[float]
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile of the sketch in seconds."""
+        return percentile(self.latencies, q)
+
+
+class EndpointComparison(msgspec.Struct, frozen=True):
+    """
+    Comparison of one endpoint against its baseline.
+
+    ``difference``, ``ci_low`` and ``ci_high`` are in seconds (current minus
+    baseline percentile); ``change`` is relative to the baseline.
+    """
+
+    key: str
+    status: str
+    quantile: float
+    baseline: Optional[float] = None
+    current: Optional[float] = None
+    difference: Optional[float] = None
+    change: Optional[float] = None
+    p_value: Optional[float] = None
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+    baseline_throughput: Optional[float] = None
+    current_throughput: Optional[float] = None
+
+    def describe(self) -> str:
+        """Render one-line summary."""
+        if self.status in (NEW, MISSING):
+            where = "current run" if self.status == NEW else "baseline"
+            return f"{self.key}: {self.status} (only in {where})"
+        line = f"{self.key}: {self.status}"
+        if self.baseline is not None and self.current is not None:
+            line += (
+                f" p{self.quantile:g} {self.baseline * 1000:.1f}ms -> "
+                f"{self.current * 1000:.1f}ms ({self.change:+.1%})"
+            )
+        if self.p_value is not None:
+            line += f" p={self.p_value:.4f}"
+        if self.ci_low is not None and self.ci_high is not None:
+            line += f" CI [{self.ci_low * 1000:+.1f}ms, {self.ci_high * 1000:+.1f}ms]"
+        if self.baseline_throughput and self.current_throughput is not None:
+            line += (
+                f" throughput {self.baseline_throughput:.1f} -> "
+                f"{self.current_throughput:.1f} rps"
+            )
+        return line
+
+
+class BaselineComparison(msgspec.Struct, frozen=True):
+    """Outcome of comparing a run against a baseline."""
+
+    endpoints: Dict[str, EndpointComparison]
+    alpha: float
+    min_change: float
+    baseline_label: Optional[str] = None
+
+    @property
+    def regressions(self) -> List[EndpointComparison]:
+        """Endpoints significantly slower than the baseline."""
+        return [c for c in self.endpoints.values() if c.status == REGRESSED]
+
+    @property
+    def improvements(self) -> List[EndpointComparison]:
+        """Endpoints significantly faster than the baseline."""
+        return [c for c in self.endpoints.values() if c.status == IMPROVED]
+
+    def report(self) -> str:
+        """Render comparison of every endpoint, regressions first."""
+        order = {REGRESSED: 0, IMPROVED: 1}
+        label = f" '{self.baseline_label}'" if self.baseline_label else ""
+        lines = [
+            f"Baseline comparison{label}: {len(self.regressions)} regressed, "
+            f"{len(self.improvements)} improved of {len(self.endpoints)} endpoints "
+            f"(alpha={self.alpha:g}, min change={self.min_change:.0%})"
+        ]
+        lines.extend(
+            comparison.describe()
+            for comparison in sorted(
+                self.endpoints.values(), key=lambda c: (order.get(c.status, 2), c.key)
+            )
+        )
+        return "\n".join(lines)
+
+    def assert_no_regressions(self) -> None:
+        """
+        Assert that no endpoint got significantly slower.
+
+        Raises:
+            AssertionError: If any endpoint regressed, with the comparison report
+        """
+        if self.regressions:
+            raise AssertionError(
+                f"{len(self.regressions)} endpoint(s) regressed:\n" + self.report()
+            )
+
+
+def mann_whitney_u(current: List[float], baseline: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that current tends to be larger.
+
+    Uses the normal approximation with tie and continuity correction.
+
+    Args:
+        current: Sample of the current run
+        baseline: Sample of the baseline
+
+    Returns:
+        p-value (small values mean current is stochastically larger)
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted(
+        [(value, 1) for value in current] + [(value, 0) for value in baseline]
+    )
+    total = n1 + n2
+    rank_sum = 0.0
+    tie_term = 0.0
+    index = 0
+    while index < total:
+        end = index
+        while end + 1 < total and combined[end + 1][0] == combined[index][0]:
+            end += 1
+        ties = end - index + 1
+        # Tied values share the average of their ranks (1-based)
+        average_rank = (index + end) / 2 + 1
+        rank_sum += average_rank * sum(combined[k][1] for k in range(index, end + 1))
+        tie_term += ties**3 - ties
+        index = end + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / sqrt(variance)
+    return 0.5 * erfc(z / sqrt(2))
+
+
+def _resampled_percentile(sorted_values: List[float], q: float, rng: Random) -> float:
+    """
+    Draw the percentile of one bootstrap resample of sorted_values.
+
+    A resample of n values maps n uniform draws onto the sorted sample, so
+    its k-th smallest value is sorted_values[floor(n * U(k))], where U(k) is
+    the k-th order statistic of n uniforms, distributed Beta(k, n + 1 - k).
+    Drawing the two order statistics the interpolated percentile needs is
+    equivalent to sorting a full resample, at O(1) cost.
+    """
+    n = len(sorted_values)
+    position = (n - 1) * q / 100
+    lower = floor(position)
+    fraction = position - lower
+    u_low = rng.betavariate(lower + 1, n - lower)
+    low_value = sorted_values[min(int(u_low * n), n - 1)]
+    if fraction == 0:
+        return low_value
+    # Next order statistic: smallest of the n - lower - 1 draws above u_low
+    u_high = u_low + (1 - u_low) * rng.betavariate(1, n - lower - 1)
+    high_value = sorted_values[min(int(u_high * n), n - 1)]
+    return low_value + (high_value - low_value) * fraction
+
+
+def bootstrap_difference(
+    current: List[float],
+    baseline: List[float],
+    q: float,
+    resamples: int = 1000,
+    confidence: float = 0.99,
+    rng: Optional[Random] = None,
+) -> Tuple[float, float]:
+    """
+    Bootstrap confidence interval of percentile difference (current - baseline).
+
+    Args:
+        current: Sample of the current run
+        baseline: Sample of the baseline
+        q: Percentile in range 0-100
+        resamples: Number of bootstrap resamples
+        confidence: Confidence level of the interval
+        rng: Random generator (for reproducible intervals)
+
+    Returns:
+        (low, high) bounds in the samples' unit
+    """
+    rng = rng or Random()
+    current = sorted(current)
+    baseline = sorted(baseline)
+    differences = sorted(
+        _resampled_percentile(current, q, rng) - _resampled_percentile(baseline, q, rng)
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2 * 100
+    return percentile(differences, tail), percentile(differences, 100 - tail)
+
+
+class Baseline(msgspec.Struct, frozen=True):
+    """
+    Stored per-endpoint latency distribution and throughput of a run.
+
+    Saved as JSON, so baseline files can be committed or kept as CI artifacts.
+    """
+
+    endpoints: Dict[str, EndpointBaseline]
+    created_at: float
+    label: Optional[str] = None
+
+    @classmethod
+    def from_stats(
+        cls,
+        stats: Union[RequestStats, "LoadReport", "ResultSet"],
+        label: Optional[str] = None,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ) -> "Baseline":
+        """
+        Create baseline from collected statistics.
+
+        Args:
+            stats: RequestStats, LoadReport or ResultSet
+            label: Free-form label (e.g. commit or build id)
+            sample_size: Maximum latency quantiles kept per endpoint
+
+        Returns:
+            Baseline
+
+        Raises:
+            ValueError: If sample_size is less than 1
+        """
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be at least 1, got {sample_size}")
+        return cls(
+            endpoints={
+                key: EndpointBaseline(
+                    key=key,
+                    count=endpoint.count,
+                    errors=endpoint.errors,
+                    throughput=endpoint.throughput,
+                    latencies=latency_sketch(endpoint, sample_size),
+                )
+                for key, endpoint in stats.endpoints.items()
+            },
+            created_at=time(),
+            label=label,
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write baseline to JSON file."""
+        Path(path).write_bytes(msgspec.json.encode(self))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Baseline":
+        """
+        Read baseline from JSON file.
+
+        Raises:
+            ValueError: If file is not a valid baseline
+        """
+        try:
+            return msgspec.json.decode(Path(path).read_bytes(), type=cls)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid baseline file {path}: {e}") from e
+
+    def compare(
+        self,
+        current: Union["Baseline", RequestStats, "LoadReport", "ResultSet"],
+        quantile: float = 95,
+        alpha: float = 0.01,
+        min_change: float = 0.05,
+        min_samples: int = 20,
+        resamples: int = 1000,
+        seed: Optional[int] = None,
+    ) -> BaselineComparison:
+        """
+        Compare a run against this baseline.
+
+        An endpoint regressed when its latencies are significantly larger
+        (Mann-Whitney p-value below alpha), the bootstrap confidence
+        interval of the percentile difference lies above zero, and the
+        percentile grew by at least min_change. Improvements are detected
+        symmetrically.
+
+        Args:
+            current: Statistics or Baseline of the current run
+            quantile: Latency percentile compared (0-100)
+            alpha: Significance level (also sets the 1 - alpha interval)
+            min_change: Minimum relative percentile change worth reporting
+            min_samples: Minimum latencies per side for a verdict
+            resamples: Bootstrap resamples (0 disables the interval check)
+            seed: Random seed for reproducible intervals
+
+        Returns:
+            BaselineComparison
+
+        Raises:
+            ValueError: If alpha or quantile are out of range
+        """
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be between 0 and 1, got {alpha}")
+        if not 0 <= quantile <= 100:
+            raise ValueError(f"quantile must be between 0 and 100, got {quantile}")
+        if not isinstance(current, Baseline):
+            current = Baseline.from_stats(current)
+        rng = Random(seed)
+        comparisons: Dict[str, EndpointComparison] = {}
+        for key in sorted(set(self.endpoints) | set(current.endpoints)):
+            before = self.endpoints.get(key)
+            after = current.endpoints.get(key)
+            if before is None or after is None:
+                comparisons[key] = EndpointComparison(
+                    key=key,
+                    status=NEW if before is None else MISSING,
+                    quantile=quantile,
+                )
+                continue
+            comparisons[key] = self._compare_endpoint(
+                before, after, quantile, alpha, min_change, min_samples, resamples, rng
+            )
+        return BaselineComparison(
+            endpoints=comparisons,
+            alpha=alpha,
+            min_change=min_change,
+            baseline_label=self.label,
+        )
+
+    @staticmethod
+    def _compare_endpoint(
+        before: EndpointBaseline,
+        after: EndpointBaseline,
+        quantile: float,
+        alpha: float,
+        min_change: float,
+        min_samples: int,
+        resamples: int,
+        rng: Random,
+    ) -> EndpointComparison:
+        """Compare one endpoint present in both runs."""
+        common: Dict[str, Any] = {
+            "key": before.key,
+            "quantile": quantile,
+            "baseline_throughput": before.throughput,
+            "current_throughput": after.throughput,
+        }
+        if len(before.latencies) < min_samples or len(after.latencies) < min_samples:
+            return EndpointComparison(status=INSUFFICIENT, **common)
+        baseline_value = before.percentile(quantile)
+        current_value = after.percentile(quantile)
+        difference = current_value - baseline_value
+        change = difference / baseline_value if baseline_value > 0 else 0.0
+        p_slower = mann_whitney_u(after.latencies, before.latencies)
+        p_faster = mann_whitney_u(before.latencies, after.latencies)
+        ci_low = ci_high = None
+        if resamples > 0:
+            ci_low, ci_high = bootstrap_difference(
+                after.latencies, before.latencies, quantile, resamples, 1 - alpha, rng
+            )
+        status = UNCHANGED
+        p_value = min(p_slower, p_faster)
+        if p_slower < alpha and change >= min_change and (ci_low is None or ci_low > 0):
+            status, p_value = REGRESSED, p_slower
+        elif (
+            p_faster < alpha
+            and change <= -min_change
+            and (ci_high is None or ci_high < 0)
+        ):
+            status, p_value = IMPROVED, p_faster
+        return EndpointComparison(
+            status=status,
+            baseline=baseline_value,
+            current=current_value,
+            difference=difference,
+            change=change,
+            p_value=p_value,
+            ci_low=ci_low,
+            ci_high=ci_high,
+            **common,
+        )
@@ -11,7 +11,17 @@ This package provides classes for testing Telegram Mini Apps:
 from .models import (
     MiniAppInfo,
     ApiResult,
+    ErrorCategory,
+    ProvisionedUser,
+    ProvisioningError,
 )
+from .network import (
+    CachingNetworkBackend,
+    ConnectionStats,
+    DNSCache,
+    classify_error,
+)
+from .streaming import StreamMessage, StreamStats, timestamp_latency
 from .api_client import ApiClient
 from .ui_client import UiClient
 from .mtproto_client import UserTelegramClient, UserInfo, ChatInfo, MessageInfo
@@ -20,7 +30,17 @@ from .db_client import DBClient
 __all__ = [
     "MiniAppInfo",
     "ApiResult",
+    "ErrorCategory",
+    "ProvisionedUser",
+    "ProvisioningError",
     "ApiClient",
+    "CachingNetworkBackend",
+    "ConnectionStats",
+    "DNSCache",
+    "classify_error",
+    "StreamMessage",
+    "StreamStats",
+    "timestamp_latency",
     "UiClient",
     "UserTelegramClient",
     "UserInfo",
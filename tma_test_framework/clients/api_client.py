@@ -3,21 +3,88 @@ Telegram Mini App API client for interacting with HTTP API endpoints.
 """
 
 # Python imports
-from hashlib import sha256
-from hmac import compare_digest, new
-from urllib.parse import parse_qs
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from asyncio import gather
+from urllib.parse import unquote
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    List,
+    Callable,
+    Iterable,
+    Tuple,
+    TYPE_CHECKING,
+)
 from http import HTTPStatus
-from httpx import AsyncClient, Limits
+from httpx import AsyncClient, AsyncHTTPTransport, Limits
 
 # Local imports
 from .base_client import BaseClient
-from .models import ApiResult
+from .models import ApiResult, ProvisionedUser, ProvisioningError
+from .network import (
+    CachingNetworkBackend,
+    ConnectionStats,
+    classify_error,
+    create_transport,
+)
+from .streaming import LatencyFunc, SSEStream, StreamStats, WebSocketStream
 from ..config import Config
-from ..utils import generate_telegram_init_data, user_info_to_tma_data
+from ..init_data import (
+    TELEGRAM_PUBLIC_KEY,
+    InitDataTemplate,
+    InitDataUser,
+    check_init_data,
+    check_init_data_signature,
+)
+from ..deadline import DeadlineExceeded, current_deadline, effective_timeout
+from ..utils import user_info_to_tma_data
 
 if TYPE_CHECKING:
     from .mtproto_client import UserInfo
+    from ..identity_cache import IdentityCache
+
+
+UNIX_SOCKET_SCHEME = "http+unix://"
+
+# User creation responses meaning the user exists afterwards (400/409: already exists)
+USER_CREATED_STATUSES = (
+    HTTPStatus.CREATED,
+    HTTPStatus.BAD_REQUEST,
+    HTTPStatus.CONFLICT,
+)
+
+
+def _split_unix_socket_url(url: str) -> Tuple[str, Optional[str]]:
+    """
+    Split ``http+unix://`` URL into HTTP base URL and socket path.
+
+    The socket path is the percent-encoded host part, e.g.
+    ``http+unix://%2Frun%2Fapp.sock/api`` -> (``http://localhost/api``, ``/run/app.sock``).
+
+    Returns:
+        Tuple of (URL used for requests, socket path or None for other schemes)
+    """
+    if not url.startswith(UNIX_SOCKET_SCHEME):
+        return url, None
+    socket_part, _, path = url[len(UNIX_SOCKET_SCHEME) :].partition("/")
+    if not socket_part:
+        raise ValueError(f"Unix socket URL must include socket path: {url}")
+    return f"http://localhost/{path}", unquote(socket_part)
+
+
+def _init_data_template(user_info: "UserInfo", config: Config) -> InitDataTemplate:
+    """Create initData template of a user signed with the config bot token."""
+    return InitDataTemplate(
+        InitDataUser(
+            id=user_info.id,
+            first_name=user_info.first_name or "",
+            last_name=user_info.last_name or "",
+            username=user_info.username or "",
+            language_code=config.language_code,
+            is_premium=user_info.is_premium,
+        ),
+        config.bot_token or "",
+    )
 
 
 class ApiClient(BaseClient):
@@ -32,21 +99,62 @@ class ApiClient(BaseClient):
     - Response analysis and validation
     """
 
-    def __init__(self, url: str, config: Optional[Config] = None) -> None:
+    def __init__(
+        self,
+        url: str,
+        config: Optional[Config] = None,
+        network_backend: Optional[CachingNetworkBackend] = None,
+        uds: Optional[str] = None,
+    ) -> None:
         """
         Initialize API client.
 
         Args:
-            url: Mini App URL
+            url: Mini App URL; ``http+unix://<percent-encoded socket path>/<path>``
+                connects over a Unix domain socket
             config: Configuration object
+            network_backend: Backend with DNS cache and TLS session reuse,
+                shareable between clients (default: plain httpx connections)
+            uds: Unix domain socket path for a local backend (alternative to
+                ``http+unix://`` URL)
+
+        Raises:
+            ValueError: If Unix socket URL has no socket path
         """
         super().__init__(url, config)
-        self.client = AsyncClient(
-            timeout=self.config.timeout,
-            limits=Limits(max_keepalive_connections=5, max_connections=10),
+        self.url, url_socket = _split_unix_socket_url(url)
+        self.uds = uds or url_socket
+        performance = self.config.performance
+        limits = Limits(
+            max_keepalive_connections=performance.http_max_keepalive_connections,
+            max_connections=performance.http_max_connections,
+            keepalive_expiry=performance.http_keepalive_expiry,
         )
+        http2 = performance.http2
+        self.network_backend = network_backend
+        if network_backend is not None:
+            transport = create_transport(
+                network_backend, limits, uds=self.uds, http2=http2
+            )
+            self.client = AsyncClient(timeout=self.config.timeout, transport=transport)
+        elif self.uds is not None:
+            transport = AsyncHTTPTransport(uds=self.uds, limits=limits, http2=http2)
+            self.client = AsyncClient(timeout=self.config.timeout, transport=transport)
+        else:
+            self.client = AsyncClient(
+                timeout=self.config.timeout, limits=limits, http2=http2
+            )
         self._auth_token: Optional[str] = None
         self._auth_token_type: str = "Bearer"
+        self._result_listeners: List[Callable[[ApiResult], None]] = []
+        self._init_data_template: Optional[InitDataTemplate] = None
+
+    @property
+    def connection_stats(self) -> Optional[ConnectionStats]:
+        """Connection setup counters of the network backend (None without backend)."""
+        if self.network_backend is None:
+            return None
+        return self.network_backend.stats
 
     async def close(self) -> None:
         """Close HTTP client."""
@@ -70,7 +178,51 @@ class ApiClient(BaseClient):
         """
         self._auth_token = token
         self._auth_token_type = token_type
-        self.logger.debug(f"Authentication token set (type: {token_type})")
+        self.logger.debug("Authentication token set (type: {})", token_type)
+
+    def add_result_listener(self, listener: Callable[[ApiResult], None]) -> None:
+        """
+        Register a callable invoked with every ApiResult returned by make_request.
+
+        Args:
+            listener: Callable receiving ApiResult (e.g. RequestStats.record)
+
+        Example:
+            >>> stats = RequestStats()
+            >>> client.add_result_listener(stats.record)
+        """
+        self._result_listeners.append(listener)
+
+    def remove_result_listener(self, listener: Callable[[ApiResult], None]) -> None:
+        """
+        Unregister a result listener.
+
+        Args:
+            listener: Previously registered listener
+
+        Raises:
+            ValueError: If listener is not registered
+        """
+        self._result_listeners.remove(listener)
+
+    def _notify_result(self, result: ApiResult) -> ApiResult:
+        """
+        Pass result to registered listeners and return it.
+
+        A failing listener is logged and skipped, so it can neither change
+        the result nor keep other listeners from seeing it.
+        """
+        for listener in self._result_listeners:
+            try:
+                listener(result)
+            except Exception:
+                self.logger.exception(
+                    "Result listener {!r} failed for {} {}",
+                    listener,
+                    result.method,
+                    result.endpoint,
+                )
+        return result
 
     def clear_auth_token(self) -> None:
         """Clear authentication token."""
@@ -78,13 +230,19 @@ class ApiClient(BaseClient):
         self._auth_token_type = "Bearer"
         self.logger.debug("Authentication token cleared")
 
-    async def validate_init_data(self, init_data: str, bot_token: str) -> bool:
+    async def validate_init_data(
+        self, init_data: str, bot_token: str, max_age: Optional[float] = None
+    ) -> bool:
         """
         Validate Telegram initData using HMAC-SHA256.
 
+        For bulk validation without an ApiClient use
+        init_data.InitDataValidator, which returns structured results.
+
         Args:
             init_data: Raw initData string from Telegram
             bot_token: Bot token for validation
+            max_age: Maximum age of ``auth_date`` in seconds (None skips check)
 
         Returns:
             True if initData is valid, False otherwise
@@ -92,34 +250,198 @@ class ApiClient(BaseClient):
         try:
             if not init_data or not bot_token:
                 return False
-            parsed_data = parse_qs(qs=init_data)
-            if "hash" not in parsed_data:
-                return False
-            received_hash = parsed_data["hash"][0]
-            # Remove 'hash' parameter for data_check_string construction
-            params_without_hash = {k: v for k, v in parsed_data.items() if k != "hash"}
-            # Build data_check_string: sort keys alphabetically, join "key=value" pairs with newlines
-            # Use first value for each key (parse_qs returns lists)
-            sorted_keys = sorted(params_without_hash.keys())
-            data_check_pairs = [
-                f"{key}={params_without_hash[key][0]}" for key in sorted_keys
-            ]
-            data_to_validate = "\n".join(data_check_pairs)
-            secret_key = new(
-                key="WebAppData".encode(), msg=bot_token.encode(), digestmod=sha256
-            ).digest()
-            expected_hash = new(
-                key=secret_key, msg=data_to_validate.encode(), digestmod=sha256
-            ).hexdigest()
-            is_valid = compare_digest(received_hash, expected_hash)
-            self.logger.info(
-                f"InitData validation: {'valid' if is_valid else 'invalid'}"
+            result = check_init_data(init_data, bot_token, max_age=max_age)
+            self.logger.debug(
+                "InitData validation: {}{}",
+                "valid" if result.valid else "invalid",
+                f" ({result.reason})" if result.reason else "",
             )
-            return is_valid
+            return result.valid
         except Exception as e:
-            self.logger.error(f"InitData validation failed: {e}")
+            self.logger.error("InitData validation failed: {}", e)
             return False
 
+    async def validate_init_data_signature(
+        self,
+        init_data: str,
+        bot_id: int,
+        public_key: str = TELEGRAM_PUBLIC_KEY,
+        max_age: Optional[float] = None,
+    ) -> bool:
+        """
+        Validate third-party (Ed25519) initData signature without bot token.
+
+        Args:
+            init_data: Raw initData string from Telegram
+            bot_id: Bot ID the initData was issued for
+            public_key: Ed25519 public key in hex (default: Telegram production key)
+            max_age: Maximum age of ``auth_date`` in seconds (None skips check)
+
+        Returns:
+            True if signature is valid, False otherwise
+        """
+        try:
+            result = check_init_data_signature(
+                init_data, bot_id, public_key, max_age=max_age
+            )
+            self.logger.debug(
+                "InitData signature validation: {}{}",
+                "valid" if result.valid else "invalid",
+                f" ({result.reason})" if result.reason else "",
+            )
+            return result.valid
+        except Exception as e:
+            self.logger.error("InitData signature validation failed: {}", e)
+            return False
+
+    def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        Build absolute request URL.
+
+        Args:
+            endpoint: Absolute URL or endpoint relative to Mini App URL
+            params: Query parameters
+
+        Returns:
+            Request URL
+        """
+        if endpoint.startswith(("http", "ws://", "wss://")):
+            url = endpoint
+        else:
+            # Assume endpoint is relative to Mini App URL
+            base_url = self.url.split("?")[0]  # Remove query params
+            url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+        # Add query params to URL
+        if params:
+            from urllib.parse import urlencode
+
+            query_string = urlencode(params)
+            if query_string:
+                separator = "&" if "?" in url else "?"
+                url = f"{url}{separator}{query_string}"
+        return url
+
+    def _build_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """
+        Merge request headers with authentication token.
+
+        Args:
+            headers: Request headers
+
+        Returns:
+            Headers with Authorization added if a token is set
+        """
+        request_headers: Dict[str, str] = {}
+        if headers:
+            request_headers.update(headers)
+
+        # Automatically add token if set (unless Authorization header is already provided)
+        if self._auth_token and "Authorization" not in request_headers:
+            auth_header = f"{self._auth_token_type} {self._auth_token}"
+            request_headers["Authorization"] = auth_header
+        return request_headers
+
+    def stream_events(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stats: Optional[StreamStats] = None,
+        latency_func: Optional[LatencyFunc] = None,
+        reconnect: bool = True,
+        max_reconnects: int = 5,
+        retry_delay: float = 1.0,
+        idle_timeout: Optional[float] = None,
+    ) -> SSEStream:
+        """
+        Subscribe to Server-Sent Events endpoint.
+
+        The subscription uses this client's connection pool and auth token.
+
+        Args:
+            endpoint: SSE endpoint
+            params: Query parameters
+            headers: Extra request headers
+            stats: StreamStats to record into (shareable between subscribers)
+            latency_func: Function measuring per-message latency
+                (e.g. ``timestamp_latency("ts")``)
+            reconnect: Whether to reconnect after the connection drops
+            max_reconnects: Maximum number of reconnects in a row without
+                receiving a message
+            retry_delay: Seconds between reconnects (server ``retry`` wins)
+            idle_timeout: Seconds without data before reconnecting (None:
+                wait indefinitely; config.timeout is not applied to reads)
+
+        Returns:
+            SSEStream async iterator of StreamMessage
+
+        Example:
+            >>> async for message in client.stream_events("v1/updates/"):
+            ...     print(message.event, message.json())
+        """
+        return SSEStream(
+            self.client,
+            self._build_url(endpoint, params),
+            headers=self._build_headers(headers),
+            stats=stats,
+            latency_func=latency_func,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            retry_delay=retry_delay,
+            idle_timeout=idle_timeout,
+        )
+
+    def websocket(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stats: Optional[StreamStats] = None,
+        latency_func: Optional[LatencyFunc] = None,
+        reconnect: bool = True,
+        max_reconnects: int = 5,
+        retry_delay: float = 1.0,
+    ) -> WebSocketStream:
+        """
+        Open WebSocket connection authenticated with this client's token.
+
+        ``http(s)`` URLs are mapped to ``ws(s)``. Requires ``websockets``.
+
+        Args:
+            endpoint: WebSocket endpoint
+            params: Query parameters
+            headers: Extra handshake headers
+            stats: StreamStats to record into (shareable between connections)
+            latency_func: Function measuring per-message latency
+            reconnect: Whether to reconnect after abnormal disconnects
+            max_reconnects: Maximum number of reconnects in a row without
+                receiving a message
+            retry_delay: Seconds between reconnects
+
+        Returns:
+            WebSocketStream (async context manager and async iterator)
+
+        Example:
+            >>> async with client.websocket("v1/ws/") as ws:
+            ...     await ws.send({"type": "subscribe"})
+            ...     async for message in ws:
+            ...         print(message.json())
+        """
+        url = self._build_url(endpoint, params)
+        if url.startswith("http"):
+            url = "ws" + url[len("http") :]
+        return WebSocketStream(
+            url,
+            uds=self.uds,
+            headers=self._build_headers(headers),
+            stats=stats,
+            latency_func=latency_func,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            retry_delay=retry_delay,
+        )
+
     async def make_request(
         self,
         endpoint: str,
@@ -140,41 +462,32 @@ class ApiClient(BaseClient):
 
         Returns:
             ApiResult with request result
+
+        Raises:
+            DeadlineExceeded: If the budget of an active deadline block is spent
         """
         try:
-            if endpoint.startswith("http"):
-                url = endpoint
-            else:
-                # Assume endpoint is relative to Mini App URL
-                base_url = self.url.split("?")[0]  # Remove query params
-                url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-
-            # Add query params to URL
-            if params:
-                from urllib.parse import urlencode
-
-                query_string = urlencode(params)
-                if query_string:
-                    separator = "&" if "?" in url else "?"
-                    url = f"{url}{separator}{query_string}"
-
-            # Prepare headers with automatic token addition
-            request_headers: Dict[str, str] = {}
-            if headers:
-                request_headers.update(headers)
-
-            # Automatically add token if set (unless Authorization header is already provided)
-            if self._auth_token and "Authorization" not in request_headers:
-                auth_header = f"{self._auth_token_type} {self._auth_token}"
-                request_headers["Authorization"] = auth_header
+            url = self._build_url(endpoint, params)
+            request_headers = self._build_headers(headers)
 
             # Set default Content-Type if not specified and data is provided
             if data is not None and "Content-Type" not in request_headers:
                 request_headers["Content-Type"] = "application/json"
 
-            self.logger.info(f"Making request: {method} {url}")
+            # Successful calls are logged 1 in N (see set_log_sampling), failures always
+            log_call = self._log_sampled()
+            if log_call:
+                self.logger.info("Making request: {} {}", method, url)
+            # Inside a deadline block the request timeout shrinks to the remaining budget
+            request_kwargs: Dict[str, Any] = {}
+            if current_deadline() is not None:
+                request_kwargs["timeout"] = effective_timeout(self.config.timeout)
             response = await self.client.request(
-                method=method, url=url, json=data, headers=request_headers
+                method=method,
+                url=url,
+                json=data,
+                headers=request_headers,
+                **request_kwargs,
             )
             # Extract response data before closing
             # response.content automatically reads the response body
@@ -212,13 +525,17 @@ class ApiClient(BaseClient):
                 # If elapsed is not available (e.g., timeout or response not fully read), use 0
                 response_time = 0.0
 
-            self.logger.info(
-                f"Response got: status_code={response.status_code}, "
-                f"elapsed={response_time:.3f}s, "
-                f"content_length={len(response_body)}"
-            )
-
-            return ApiResult(
+            if log_call or not response.is_success:
+                self.logger.info(
+                    "Response got: {} {} status_code={}, elapsed={:.3f}s, content_length={}",
+                    method,
+                    url,
+                    response.status_code,
+                    response_time,
+                    len(response_body),
+                )
+
+            result = ApiResult(
                 endpoint=endpoint,
                 method=method,
                 informational=response.is_informational,
@@ -234,10 +551,22 @@ class ApiClient(BaseClient):
                 reason=reason,
                 error_message=None,
             )
+        except DeadlineExceeded:
+            raise
         except Exception as e:
+            active_deadline = current_deadline()
+            if active_deadline is not None and active_deadline.expired:
+                raise active_deadline.error() from e
             error_msg = str(e)
-            self.logger.error(f"Request failed: {method} {endpoint} - {error_msg}")
-            return ApiResult(
+            error_category = classify_error(e)
+            self.logger.error(
+                "Request failed: {} {} - {} ({})",
+                method,
+                endpoint,
+                error_category.value,
+                error_msg,
+            )
+            result = ApiResult(
                 endpoint=endpoint,
                 method=method,
                 status_code=0,
@@ -252,7 +581,11 @@ class ApiClient(BaseClient):
                 content_type=None,
                 reason=None,
                 error_message=error_msg,
+                error_category=error_category,
             )
+        # Listeners run outside the try block: their errors must not turn
+        # a received response into a transport failure
+        return self._notify_result(result)
 
     async def setup_tma_auth(
         self,
@@ -260,6 +593,7 @@ class ApiClient(BaseClient):
         config: Optional[Config] = None,
         create_user: bool = True,
         create_user_endpoint: str = "v1/create/tma/",
+        identity_cache: Optional["IdentityCache"] = None,
     ) -> None:
         """
         Setup TMA authentication: create user and set init_data token.
@@ -269,6 +603,8 @@ class ApiClient(BaseClient):
             config: Config object (required for generating init_data and for getting user_info if user_info is None)
             create_user: Whether to create user via API (default: True)
             create_user_endpoint: Endpoint for creating user (default: "v1/create/tma/")
+            identity_cache: IdentityCache consulted before connecting to Telegram
+                when user_info is None; a resolved user is stored in it
 
         Raises:
             ValueError: If config is None, or if both user_info and config are None
@@ -278,6 +614,11 @@ class ApiClient(BaseClient):
         if config is None:
             raise ValueError("config is required for generating init_data")
 
+        if user_info is None and identity_cache is not None:
+            user_info = identity_cache.get(config)
+            if user_info is not None:
+                self.logger.debug("Using cached identity for user {}", user_info.id)
+
         if user_info is None:
             # Import here to avoid circular dependency
             from .mtproto_client import UserTelegramClient
@@ -288,6 +629,8 @@ class ApiClient(BaseClient):
                     user_info = await tg_client.get_me()
             except Exception as e:
                 raise ValueError(f"Failed to get user info from Telegram: {e}") from e
+            if identity_cache is not None:
+                identity_cache.put(config, user_info)
 
         # Prepare user data
         user_data = user_info_to_tma_data(user_info)
@@ -299,21 +642,119 @@ class ApiClient(BaseClient):
                 method="POST",
                 data=user_data,
             )
-            # 400 means user already exists, which is fine
-            if result.status_code not in [HTTPStatus.CREATED, HTTPStatus.BAD_REQUEST]:
+            # 400/409 mean user already exists, which is fine
+            if result.status_code not in USER_CREATED_STATUSES:
                 result.raise_for_status()
 
-        # Generate init_data
-
-        init_data = generate_telegram_init_data(
-            user_id=user_info.id,
-            username=user_info.username or "",
-            first_name=user_info.first_name or "",
-            last_name=user_info.last_name or "",
-            bot_token=config.bot_token or "",
-            language_code=config.language_code,
-            is_premium=user_info.is_premium,
-        )
+        # Keep initData template so refresh_tma_auth() can re-sign cheaply
+        self._init_data_template = _init_data_template(user_info, config)
 
         # Set auth token
+        self.refresh_tma_auth()
+
+    async def setup_tma_auth_bulk(
+        self,
+        users: Iterable["UserInfo"],
+        config: Config,
+        create_user: bool = True,
+        create_user_endpoint: str = "v1/create/tma/",
+        concurrency: Optional[int] = None,
+        raise_on_error: bool = True,
+    ) -> List[ProvisionedUser]:
+        """
+        Provision many TMA users concurrently and sign their auth tokens.
+
+        Unlike setup_tma_auth(), no Telegram connection is opened and the
+        client's own auth token is left unchanged; each result carries the
+        user's ``tma`` token. Requests in flight are also bounded by the
+        client's connection limit.
+
+        Args:
+            users: UserInfo objects to provision
+            config: Config with bot_token and language_code
+            create_user: Whether to create users via API (default: True)
+            create_user_endpoint: Endpoint for creating users
+            concurrency: Number of creation requests in flight
+                (default: config.performance.max_concurrency of this client)
+            raise_on_error: Raise if any user could not be created
+
+        Returns:
+            ProvisionedUser results in input order
+
+        Raises:
+            ValueError: If config is None or concurrency is less than 1
+            ProvisioningError: If raise_on_error is set and any user creation
+                failed
+        """
+        if config is None:
+            raise ValueError("config is required for generating init_data")
+        if concurrency is None:
+            concurrency = self.config.performance.max_concurrency
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        templates = [(user, _init_data_template(user, config)) for user in users]
+        results: List[Optional[ProvisionedUser]] = [None] * len(templates)
+        pending = iter(enumerate(templates))
+
+        async def worker() -> None:
+            # Workers share one iterator, so at most `concurrency` requests run
+            for index, (user_info, template) in pending:
+                status_code: Optional[int] = None
+                error: Optional[str] = None
+                if create_user:
+                    result = await self.make_request(
+                        create_user_endpoint,
+                        method="POST",
+                        data=user_info_to_tma_data(user_info),
+                    )
+                    status_code = result.status_code
+                    if status_code not in USER_CREATED_STATUSES:
+                        error = (
+                            f"HTTP {status_code}: "
+                            f"{result.error_message or result.text()}"
+                        )
+                results[index] = ProvisionedUser(
+                    user_id=user_info.id,
+                    template=template,
+                    init_data=template.sign() if error is None else None,
+                    status_code=status_code,
+                    error=error,
+                )
+
+        await gather(*(worker() for _ in range(min(concurrency, len(templates)))))
+        provisioned = [result for result in results if result is not None]
+        failed = [result for result in provisioned if not result.ok]
+        if failed:
+            self.logger.error(
+                "Failed to provision {} of {} TMA users", len(failed), len(provisioned)
+            )
+            if raise_on_error:
+                raise ProvisioningError(failed, provisioned)
+        return provisioned
+
+    @property
+    def init_data_template(self) -> Optional[InitDataTemplate]:
+        """initData template of the user set up by setup_tma_auth()."""
+        return self._init_data_template
+
+    def refresh_tma_auth(self, auth_date: Optional[int] = None) -> str:
+        """
+        Re-sign initData with a fresh ``auth_date`` and set it as ``tma`` token.
+
+        Only the signature is recomputed, so long-running virtual users can
+        refresh their token before every request.
+
+        Args:
+            auth_date: Unix time of authentication (default: now)
+
+        Returns:
+            New initData string
+
+        Raises:
+            RuntimeError: If setup_tma_auth() was not called
+        """
+        if self._init_data_template is None:
+            raise RuntimeError("TMA auth is not set up, call setup_tma_auth() first")
+        init_data = self._init_data_template.sign(auth_date=auth_date)
         self.set_auth_token(init_data, token_type="tma")
+        return init_data
@@ -15,7 +15,7 @@ class BaseClient:
     Provides common functionality for all client types:
     - URL management
     - Configuration handling
-    - Logging setup
+    - Logging setup (with optional sampling of successful operations)
     - Context manager support
     """
 
@@ -38,6 +38,38 @@ class BaseClient:
         self.url = url
         self.config = config
         self.logger = logger.bind(name=self.__class__.__name__)
+        self._log_sample_rate = config.performance.log_sample_rate
+        self._log_sample_counter = 0
+
+    def set_log_sampling(self, sample_rate: int) -> None:
+        """
+        Log only one in every ``sample_rate`` successful operations.
+
+        Failures are always logged. Use 1 to log every operation. The initial
+        rate is ``config.performance.log_sample_rate`` (1 by default).
+
+        Args:
+            sample_rate: Log 1 in N successful operations
+
+        Raises:
+            ValueError: If sample_rate is less than 1
+        """
+        if sample_rate < 1:
+            raise ValueError(f"sample_rate must be at least 1, got {sample_rate}")
+        self._log_sample_rate = sample_rate
+        self._log_sample_counter = 0
+
+    def _log_sampled(self) -> bool:
+        """
+        Decide whether the current successful operation should be logged.
+
+        Returns:
+            True for the first operation of every sampling window
+        """
+        if self._log_sample_rate == 1:
+            return True
+        self._log_sample_counter += 1
+        return self._log_sample_counter % self._log_sample_rate == 1
 
     async def __aenter__(self):
         """Async context manager entry."""
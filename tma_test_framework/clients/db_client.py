@@ -13,6 +13,7 @@ from contextlib import asynccontextmanager
 # Local imports
 from .base_client import BaseClient
 from ..config import Config
+from ..deadline import honor_deadline
 
 if TYPE_CHECKING:
     pass
@@ -28,9 +29,27 @@ class DBClient(BaseClient, ABC):
     - Transaction handling
     - Connection pooling
 
-    Subclasses should implement database-specific logic.
+    Subclasses should implement database-specific logic. Their connection,
+    query and transaction methods honor active deadline blocks.
     """
 
+    _DEADLINE_METHODS = (
+        "connect",
+        "execute_query",
+        "execute_command",
+        "begin_transaction",
+        "commit_transaction",
+        "rollback_transaction",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Bound adapter operations by the active deadline budget."""
+        super().__init_subclass__(**kwargs)
+        for name in cls._DEADLINE_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__honors_deadline__", False):
+                setattr(cls, name, honor_deadline(method))
+
     def __init__(
         self,
         url: str,
@@ -2,9 +2,16 @@
 Data models for Telegram Mini App testing framework.
 """
 
-from typing import Optional, Dict, Any
+from enum import Enum
+from typing import Optional, Dict, Any, Callable, List, TYPE_CHECKING
+import json
 import msgspec
 
+from ..schema import SchemaType, compile_schema
+
+if TYPE_CHECKING:
+    from ..init_data import InitDataTemplate
+
 
 class MiniAppInfo(msgspec.Struct, frozen=True):
     """
@@ -19,12 +26,56 @@ class MiniAppInfo(msgspec.Struct, frozen=True):
     platform: str = "web"
 
 
-class ApiResult(msgspec.Struct, frozen=True):
+class ErrorCategory(str, Enum):
+    """
+    Category of a transport failure (ApiResult with status_code 0).
+
+    Values are plain strings, so categories serialize as-is and group
+    cheaply in large runs.
+    """
+
+    CONNECT_TIMEOUT = "connect_timeout"
+    READ_TIMEOUT = "read_timeout"
+    WRITE_TIMEOUT = "write_timeout"
+    POOL_TIMEOUT = "pool_timeout"
+    DNS = "dns"
+    CONNECT_ERROR = "connect_error"
+    CONNECTION_RESET = "connection_reset"
+    TLS = "tls"
+    PROTOCOL = "protocol"
+    OTHER = "other"
+
+    @property
+    def retryable(self) -> bool:
+        """Whether the failure is transient (worth retrying idempotent requests)."""
+        return self not in (
+            ErrorCategory.TLS,
+            ErrorCategory.PROTOCOL,
+            ErrorCategory.OTHER,
+        )
+
+    @property
+    def unsent(self) -> bool:
+        """Whether the request never reached the server (safe to retry any method)."""
+        return self in (
+            ErrorCategory.CONNECT_TIMEOUT,
+            ErrorCategory.POOL_TIMEOUT,
+            ErrorCategory.DNS,
+            ErrorCategory.CONNECT_ERROR,
+        )
+
+
+class ApiResult(msgspec.Struct, frozen=True, dict=True):
     """
     API request result.
 
     Contains complete information about an HTTP API request and response,
     including status, headers, body, and timing information.
+
+    The body is decoded at most once per target type: json(), json_as() and
+    the JSON assertions share memoized results. The memo lives in the
+    instance __dict__, so it is not encoded, compared or copied by
+    msgspec.structs.replace().
     """
 
     endpoint: str
@@ -41,24 +92,61 @@ class ApiResult(msgspec.Struct, frozen=True):
     content_type: Optional[str] = None
     reason: Optional[str] = None
     error_message: Optional[str] = None
+    error_category: Optional[ErrorCategory] = None
+
+    def _memoized(self, key: Any, decode: Callable[[], Any]) -> Any:
+        """Return decode() result cached for this result under key."""
+        cache = self.__dict__.setdefault("_decoded", {})
+        if key not in cache:
+            cache[key] = decode()
+        return cache[key]
 
     def json(self) -> Dict[str, Any]:
         """
         Parse JSON from response body.
 
+        Decoding follows json.loads(), so NaN/Infinity literals are accepted
+        and the last duplicate key wins. The body is decoded once and every
+        call returns the same shared object: mutating it changes what later
+        json() calls and the JSON assertions see, so copy it first.
+
         Returns:
             Parsed JSON data as dictionary
 
         Raises:
             ValueError: If body is not valid JSON
         """
-        import json
-
         try:
-            return json.loads(self.body.decode("utf-8"))
+            return self._memoized(None, lambda: json.loads(self.body.decode("utf-8")))
         except (json.JSONDecodeError, ValueError, UnicodeDecodeError) as e:
             raise ValueError(f"Failed to parse JSON: {e}") from e
 
+    def json_as(self, schema: SchemaType) -> Any:
+        """
+        Decode JSON body into a typed value, validating it in the same pass.
+
+        The decoded value is cached per schema.
+
+        Args:
+            schema: msgspec-compatible type (e.g. Struct, List[Struct]) or
+                JSON-Schema dictionary
+
+        Returns:
+            Decoded response (Struct instances for Struct/object schemas)
+
+        Raises:
+            ValueError: If body does not match schema or is not valid JSON
+
+        Example:
+            >>> user = result.json_as(User)
+            >>> items = result.json_as(List[Item])
+        """
+        decoder = compile_schema(schema)
+        try:
+            return self._memoized(decoder, lambda: decoder.decode(self.body))
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Schema validation failed: {e}") from e
+
     def text(self) -> str:
         """
         Get response body as text.
@@ -116,3 +204,79 @@ class ApiResult(msgspec.Struct, frozen=True):
             raise AssertionError(
                 f"Missing required fields: {', '.join(missing)}. Response: {data}"
             )
+
+    def assert_matches_schema(self, schema: SchemaType) -> Any:
+        """
+        Assert that JSON response matches schema and return decoded data.
+
+        The schema is compiled once and cached, so nested structure, types and
+        constraints are validated in the same pass as decoding.
+
+        Args:
+            schema: msgspec-compatible type (e.g. Struct, List[Struct]) or
+                JSON-Schema dictionary
+
+        Returns:
+            Decoded response (Struct instances for Struct/object schemas)
+
+        Raises:
+            AssertionError: If response does not match schema
+        """
+        try:
+            return self.json_as(schema)
+        except ValueError as e:
+            raise AssertionError(
+                f"Response from {self.method} {self.endpoint} does not match schema: {e}"
+            ) from e
+
+
+class ProvisionedUser(msgspec.Struct, frozen=True):
+    """
+    Result of provisioning one TMA user with ApiClient.setup_tma_auth_bulk().
+
+    ``init_data`` is the ``tma`` token signed at provisioning time; use
+    ``template.sign()`` for a token with a fresh ``auth_date``.
+    """
+
+    user_id: int
+    template: "InitDataTemplate"
+    init_data: Optional[str] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the user was created (or already existed)."""
+        return self.error is None
+
+    @property
+    def auth_header(self) -> Dict[str, str]:
+        """
+        Authorization header for requests as this user.
+
+        Raises:
+            RuntimeError: If the user was not provisioned (no init_data)
+        """
+        if self.init_data is None:
+            raise RuntimeError(f"User {self.user_id} was not provisioned: {self.error}")
+        return {"Authorization": f"tma {self.init_data}"}
+
+
+class ProvisioningError(RuntimeError):
+    """
+    Raised by ApiClient.setup_tma_auth_bulk() when users could not be created.
+
+    ``failed`` holds the failed ProvisionedUser results, ``provisioned``
+    all results in input order (e.g. to retry only the failed users).
+    """
+
+    def __init__(
+        self, failed: List[ProvisionedUser], provisioned: List[ProvisionedUser]
+    ) -> None:
+        first = failed[0]
+        super().__init__(
+            f"Failed to provision {len(failed)} of {len(provisioned)} users, "
+            f"first: user {first.user_id}: {first.error}"
+        )
+        self.failed = failed
+        self.provisioned = provisioned
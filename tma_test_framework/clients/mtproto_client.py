@@ -17,6 +17,7 @@ from loguru import logger
 
 # Local imports
 from ..config import Config
+from ..deadline import effective_timeout, honor_deadline
 from .ui_client import UiClient
 from ..utils import generate_telegram_init_data, user_info_to_tma_data
 
@@ -129,6 +130,7 @@ class UserTelegramClient:
         """
         await self.disconnect()
 
+    @honor_deadline
     async def connect(self) -> None:
         """
         Connect to Telegram using API credentials.
@@ -163,6 +165,7 @@ class UserTelegramClient:
             self._is_connected = False
             self.logger.info("Disconnected from Telegram")
 
+    @honor_deadline
     async def get_me(self) -> UserInfo:
         """
         Get current user information.
@@ -184,6 +187,7 @@ class UserTelegramClient:
             )
         return self._me
 
+    @honor_deadline
     async def get_entity(self, entity: Union[str, int]) -> ChatInfo:
         """
         Get entity (user, chat, channel) information.
@@ -280,6 +284,7 @@ class UserTelegramClient:
             self.logger.error(f"Failed to get entity {entity}: {e}")
             raise
 
+    @honor_deadline
     async def send_message(
         self,
         entity: Union[str, int],
@@ -322,6 +327,7 @@ class UserTelegramClient:
             self.logger.error(f"Failed to send message to {entity}: {e}")
             raise
 
+    @honor_deadline
     async def get_messages(
         self, entity: Union[str, int], limit: int = 10, offset_id: int = 0
     ) -> List[MessageInfo]:
@@ -387,6 +393,7 @@ class UserTelegramClient:
             self.logger.error(f"Failed to get messages from {entity}: {e}")
             return []
 
+    @honor_deadline
     async def interact_with_bot(
         self,
         bot_username: str,
@@ -401,11 +408,13 @@ class UserTelegramClient:
             bot_username: Bot username (without @)
             command: Command to send (e.g., "/start")
             wait_for_response: Whether to wait for bot response
-            timeout: Timeout for waiting response
+            timeout: Timeout for waiting response (shrunk to the remaining
+                budget inside a deadline block)
 
         Returns:
             Bot response message or None
         """
+        timeout = effective_timeout(timeout)
         try:
             sent_message = await self.send_message(bot_username, command)
             self.logger.info(f"Sent command '{command}' to @{bot_username}")
@@ -429,6 +438,7 @@ class UserTelegramClient:
             self.logger.error(f"Failed to interact with bot @{bot_username}: {e}")
             raise
 
+    @honor_deadline
     async def get_mini_app_from_bot(
         self, bot_username: str, start_param: Optional[str] = None
     ) -> Optional[UiClient]:
@@ -546,6 +556,7 @@ class UserTelegramClient:
             raise ValueError("User not authorized. Call get_me() first.")
         return user_info_to_tma_data(self._me)
 
+    @honor_deadline
     async def generate_init_data(
         self,
         config: Config,
@@ -0,0 +1,520 @@
+"""
+Connection setup reuse for ApiClient.
+
+CachingNetworkBackend is an httpcore network backend that resolves host
+names through an in-process DNS cache and resumes TLS sessions through a
+shared SSL context. One backend can be shared by many short-lived clients,
+so only the first connection to a host pays for DNS lookup and a full TLS
+handshake:
+
+    backend = CachingNetworkBackend(dns_ttl=60)
+    async with ApiClient(url, config, network_backend=backend) as api:
+        ...
+    backend.stats  # ConnectionStats(tcp_connects=..., tls_resumptions=...)
+
+Session resumption and the custom backend rely on CPython and httpx
+internals (``SSLObject._create`` and ``AsyncHTTPTransport._pool``). Both
+are checked before use; when they change, the backend falls back to full
+handshakes and create_transport() to the plain httpx connection pool.
+
+classify_error() maps transport exceptions raised by httpx to an
+ErrorCategory stored on failed ApiResults.
+"""
+
+# Python imports
+from asyncio import get_running_loop
+from inspect import signature
+from ipaddress import ip_address
+from re import match
+from socket import SOCK_STREAM, gaierror
+from ssl import SSLContext, SSLError, SSLObject, SSLSession
+from time import monotonic
+from typing import Optional, Dict, Any, List, Iterable, Tuple, cast
+import httpcore
+import httpx
+import msgspec
+from httpx import AsyncHTTPTransport, Limits, create_ssl_context
+from loguru import logger
+
+# Local imports
+from .models import ErrorCategory
+
+# Signature of the private SSLObject._create classmethod (CPython 3.7+)
+_SSL_CREATE_PARAMETERS = (
+    "incoming",
+    "outgoing",
+    "server_side",
+    "server_hostname",
+    "session",
+    "context",
+)
+
+# httpx versions known to keep the httpcore pool in AsyncHTTPTransport._pool
+_HTTPX_POOL_VERSIONS = ((0, 24), (1, 0))
+
+# Timeout phases, checked on the raised exception itself
+_TIMEOUT_CATEGORIES: Tuple[Tuple[Tuple[type, ...], ErrorCategory], ...] = (
+    ((httpx.ConnectTimeout, httpcore.ConnectTimeout), ErrorCategory.CONNECT_TIMEOUT),
+    ((httpx.ReadTimeout, httpcore.ReadTimeout), ErrorCategory.READ_TIMEOUT),
+    ((httpx.WriteTimeout, httpcore.WriteTimeout), ErrorCategory.WRITE_TIMEOUT),
+    ((httpx.PoolTimeout, httpcore.PoolTimeout), ErrorCategory.POOL_TIMEOUT),
+    (
+        (httpx.TimeoutException, httpcore.TimeoutException, TimeoutError),
+        ErrorCategory.READ_TIMEOUT,
+    ),
+)
+
+# Operating system errors found in the exception chain
+_CAUSE_CATEGORIES: Tuple[Tuple[Tuple[type, ...], ErrorCategory], ...] = (
+    ((gaierror,), ErrorCategory.DNS),
+    ((SSLError,), ErrorCategory.TLS),
+    ((ConnectionRefusedError,), ErrorCategory.CONNECT_ERROR),
+    (
+        (ConnectionResetError, ConnectionAbortedError, BrokenPipeError),
+        ErrorCategory.CONNECTION_RESET,
+    ),
+)
+
+# Wrapper exceptions classified when the chain has no known cause
+_FALLBACK_CATEGORIES: Tuple[Tuple[Tuple[type, ...], ErrorCategory], ...] = (
+    ((httpx.ConnectError, httpcore.ConnectError), ErrorCategory.CONNECT_ERROR),
+    (
+        (httpx.ReadError, httpx.WriteError, httpcore.ReadError, httpcore.WriteError),
+        ErrorCategory.CONNECTION_RESET,
+    ),
+    ((httpx.ProtocolError, httpcore.ProtocolError), ErrorCategory.PROTOCOL),
+)
+
+
+def _ssl_session_hook_supported() -> bool:
+    """Check SSLObject._create can be overridden to inject TLS sessions."""
+    create = getattr(SSLObject, "_create", None)
+    if create is None:
+        return False
+    try:
+        parameters = tuple(signature(create).parameters)
+    except (TypeError, ValueError):
+        return False
+    return parameters == _SSL_CREATE_PARAMETERS
+
+
+def _transport_pool_supported(transport: AsyncHTTPTransport) -> bool:
+    """Check the connection pool of transport can be replaced."""
+    version = match(r"(\d+)\.(\d+)", httpx.__version__)
+    if version is None:
+        return False
+    lowest, highest = _HTTPX_POOL_VERSIONS
+    if not lowest <= (int(version[1]), int(version[2])) < highest:
+        return False
+    return isinstance(getattr(transport, "_pool", None), httpcore.AsyncConnectionPool)
+
+
+def _copy_ssl_context(context: SSLContext) -> SSLContext:
+    """
+    Create SSL context with the client settings of context.
+
+    Copies protocol, options, TLS versions, ciphers, certificate and host
+    name verification and the loaded CA certificates. Client certificates,
+    callbacks and CA directories (capath) cannot be read back from a
+    context and are not copied.
+    """
+    copy = SSLContext(context.protocol)
+    copy.options = context.options
+    copy.minimum_version = context.minimum_version
+    copy.maximum_version = context.maximum_version
+    copy.set_ciphers(":".join(cipher["name"] for cipher in context.get_ciphers()))
+    # check_hostname must be off before verify_mode can be relaxed
+    copy.check_hostname = False
+    copy.verify_mode = context.verify_mode
+    copy.check_hostname = context.check_hostname
+    copy.verify_flags = context.verify_flags
+    copy.hostname_checks_common_name = context.hostname_checks_common_name
+    copy.post_handshake_auth = context.post_handshake_auth
+    ca_certs = context.get_ca_certs(binary_form=True)
+    if ca_certs:
+        copy.load_verify_locations(cadata=b"".join(ca_certs))
+    return copy
+
+
+class ConnectionStats(msgspec.Struct):
+    """
+    Connection setup counters of a CachingNetworkBackend.
+
+    ``tcp_connects`` also counts Unix domain socket connections.
+    """
+
+    tcp_connects: int = 0
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0
+    tls_handshakes: int = 0
+    tls_resumptions: int = 0
+
+
+class DNSCache:
+    """
+    In-process DNS cache with TTL.
+
+    Resolved addresses are reused until ``ttl`` seconds pass. IP literals
+    are returned as-is without lookup.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024) -> None:
+        """
+        Initialize DNS cache.
+
+        Args:
+            ttl: Seconds a resolved address list stays valid
+            max_entries: Maximum number of cached hosts
+
+        Raises:
+            ValueError: If ttl is negative or max_entries is less than 1
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must be non-negative, got {ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """
+        Resolve host name to IP addresses.
+
+        Args:
+            host: Host name or IP literal
+            port: TCP port
+
+        Returns:
+            List of IP addresses in resolver order
+
+        Raises:
+            OSError: If host cannot be resolved
+        """
+        try:
+            ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+        key = (host, port)
+        entry = self._entries.get(key)
+        now = monotonic()
+        if entry is not None and entry[0] > now:
+            self.hits += 1
+            return entry[1]
+        self.lookups += 1
+        infos = await get_running_loop().getaddrinfo(host, port, type=SOCK_STREAM)
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        if len(self._entries) >= self.max_entries and key not in self._entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """
+        Drop cached addresses.
+
+        Args:
+            host: Host to drop (None drops all entries)
+        """
+        if host is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[0] == host]:
+                del self._entries[key]
+
+
+class TLSSessionCache:
+    """
+    TLS sessions shared between connections made with one SSL context.
+
+    The SSL context creates SSL objects that start from the last session
+    negotiated with the same server name, so reconnects use abbreviated
+    (resumed) handshakes when the server supports session tickets.
+
+    The cache owns its SSL context: a given context is copied (see
+    _copy_ssl_context()) rather than modified, so it can still be used
+    elsewhere unchanged.
+
+    Resumption relies on the private ``SSLObject._create`` hook; without it
+    ``resumption_enabled`` is False and every connection does a full
+    handshake.
+    """
+
+    def __init__(self, ssl_context: Optional[SSLContext] = None) -> None:
+        """
+        Initialize TLS session cache.
+
+        Args:
+            ssl_context: Client SSL context whose settings are copied
+                (default: httpx verified context)
+        """
+        self.ssl_context = (
+            _copy_ssl_context(ssl_context)
+            if ssl_context is not None
+            else create_ssl_context()
+        )
+        self._sessions: Dict[str, SSLSession] = {}
+        self.resumption_enabled = _ssl_session_hook_supported()
+        if not self.resumption_enabled:
+            logger.warning(
+                "ssl.SSLObject._create is not supported, TLS sessions are not resumed"
+            )
+            return
+        cache = self
+
+        class _ResumingSSLObject(SSLObject):
+            @classmethod
+            def _create(
+                cls,
+                incoming: Any,
+                outgoing: Any,
+                server_side: bool = False,
+                server_hostname: Optional[str] = None,
+                session: Optional[SSLSession] = None,
+                context: Optional[SSLContext] = None,
+            ) -> SSLObject:
+                if session is None and not server_side and server_hostname:
+                    session = cache.get(server_hostname)
+                create = getattr(super(), "_create")
+                return cast(
+                    SSLObject,
+                    create(
+                        incoming,
+                        outgoing,
+                        server_side=server_side,
+                        server_hostname=server_hostname,
+                        session=session,
+                        context=context,
+                    ),
+                )
+
+        self.ssl_context.sslobject_class = _ResumingSSLObject
+
+    def get(self, server_hostname: str) -> Optional[SSLSession]:
+        """Get resumable session for server name."""
+        return self._sessions.get(server_hostname)
+
+    def store(self, server_hostname: str, ssl_object: Optional[SSLObject]) -> None:
+        """
+        Remember session of an established TLS connection.
+
+        Args:
+            server_hostname: Server name used for SNI
+            ssl_object: SSL object of the connection
+        """
+        if ssl_object is None:
+            return
+        session = ssl_object.session
+        if session is not None and session.has_ticket:
+            self._sessions[server_hostname] = session
+
+    def clear(self) -> None:
+        """Drop all stored sessions."""
+        self._sessions.clear()
+
+
+class _TrackingStream(httpcore.AsyncNetworkStream):
+    """Network stream recording TLS setup in backend statistics."""
+
+    def __init__(
+        self,
+        stream: httpcore.AsyncNetworkStream,
+        backend: "CachingNetworkBackend",
+        server_hostname: Optional[str] = None,
+    ) -> None:
+        self._stream = stream
+        self._backend = backend
+        self._server_hostname = server_hostname
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        return await self._stream.read(max_bytes, timeout)
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        await self._stream.write(buffer, timeout)
+
+    async def aclose(self) -> None:
+        # TLS 1.3 session tickets arrive after the handshake, store them on close
+        if self._server_hostname is not None:
+            self._backend.tls_sessions.store(
+                self._server_hostname, self._stream.get_extra_info("ssl_object")
+            )
+        await self._stream.aclose()
+
+    async def start_tls(
+        self,
+        ssl_context: SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        tls_stream = await self._stream.start_tls(ssl_context, server_hostname, timeout)
+        stats = self._backend.stats
+        stats.tls_handshakes += 1
+        ssl_object = tls_stream.get_extra_info("ssl_object")
+        if ssl_object is not None and ssl_object.session_reused:
+            stats.tls_resumptions += 1
+        if server_hostname is not None:
+            self._backend.tls_sessions.store(server_hostname, ssl_object)
+        return _TrackingStream(tls_stream, self._backend, server_hostname)
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore network backend with DNS cache and TLS session resumption.
+
+    Share one instance between ApiClient instances to reuse resolved
+    addresses and TLS sessions across clients.
+    """
+
+    def __init__(
+        self,
+        dns_ttl: Optional[float] = 60.0,
+        ssl_context: Optional[SSLContext] = None,
+        backend: Optional[httpcore.AsyncNetworkBackend] = None,
+    ) -> None:
+        """
+        Initialize network backend.
+
+        Args:
+            dns_ttl: DNS cache TTL in seconds (None disables DNS caching)
+            ssl_context: Client SSL context whose settings are copied into
+                the context shared by all connections
+            backend: Underlying backend (default: httpcore.AnyIOBackend)
+        """
+        self.dns_cache = DNSCache(ttl=dns_ttl) if dns_ttl is not None else None
+        self.tls_sessions = TLSSessionCache(ssl_context)
+        self.stats = ConnectionStats()
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    @property
+    def ssl_context(self) -> SSLContext:
+        """SSL context shared by all connections of this backend."""
+        return self.tls_sessions.ssl_context
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = [host]
+        if self.dns_cache is not None:
+            hits, lookups = self.dns_cache.hits, self.dns_cache.lookups
+            addresses = await self.dns_cache.resolve(host, port)
+            self.stats.dns_cache_hits += self.dns_cache.hits - hits
+            self.stats.dns_lookups += self.dns_cache.lookups - lookups
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                stream = await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+                continue
+            self.stats.tcp_connects += 1
+            return _TrackingStream(stream, self)
+        if self.dns_cache is not None:
+            self.dns_cache.invalidate(host)
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        stream = await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+        self.stats.tcp_connects += 1
+        return _TrackingStream(stream, self)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def create_transport(
+    network_backend: CachingNetworkBackend,
+    limits: Limits,
+    uds: Optional[str] = None,
+    http2: bool = False,
+) -> AsyncHTTPTransport:
+    """
+    Create httpx transport whose connection pool uses network_backend.
+
+    Args:
+        network_backend: Backend used for all connections
+        limits: Connection pool limits
+        uds: Unix domain socket path to connect to instead of TCP
+        http2: Whether to negotiate HTTP/2 (requires the h2 package)
+
+    Returns:
+        AsyncHTTPTransport for ``httpx.AsyncClient(transport=...)``. With an
+        unsupported httpx version the transport keeps its own connection
+        pool and network_backend is not used.
+    """
+    transport = AsyncHTTPTransport(
+        verify=network_backend.ssl_context, limits=limits, uds=uds, http2=http2
+    )
+    if not _transport_pool_supported(transport):
+        logger.warning(
+            "httpx {} connection pool cannot be replaced, using default network backend",
+            httpx.__version__,
+        )
+        return transport
+    # httpx has no public hook for the network backend, replace the pool instead
+    transport._pool = httpcore.AsyncConnectionPool(
+        ssl_context=network_backend.ssl_context,
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=limits.keepalive_expiry,
+        uds=uds,
+        http2=http2,
+        network_backend=network_backend,
+    )
+    return transport
+
+
+def classify_error(error: BaseException) -> ErrorCategory:
+    """
+    Get category of a request failure.
+
+    Timeouts are classified by phase first (a TLS handshake that times out
+    is a connect timeout). Otherwise the exception chain is searched for
+    the underlying OS error: DNS failure, TLS error, refused or reset
+    connection. httpx wrappers without a known cause fall back to their
+    own type, e.g. RemoteProtocolError is a protocol error.
+
+    Args:
+        error: Exception raised while sending request
+
+    Returns:
+        ErrorCategory (OTHER if unknown)
+    """
+    for types, category in _TIMEOUT_CATEGORIES:
+        if isinstance(error, types):
+            return category
+    cause: Optional[BaseException] = error
+    seen = set()
+    while cause is not None and id(cause) not in seen:
+        seen.add(id(cause))
+        for types, category in _CAUSE_CATEGORIES:
+            if isinstance(cause, types):
+                return category
+        cause = cause.__cause__ or cause.__context__
+    for types, category in _FALLBACK_CATEGORIES:
+        if isinstance(error, types):
+            return category
+    return ErrorCategory.OTHER
@@ -0,0 +1,373 @@
+"""
+Streaming (Server-Sent Events and WebSocket) clients for ApiClient.
+
+Streams are created by ApiClient.stream_events() and ApiClient.websocket(),
+authenticate with the client's token and record message statistics:
+
+    stats = StreamStats()
+    async for message in api.stream_events("v1/updates/", stats=stats):
+        ...
+    stats.message_rate, stats.reconnects, stats.percentile(95)
+"""
+
+# Python imports
+from asyncio import sleep
+from time import monotonic, time
+from typing import Optional, Dict, Any, List, Callable, AsyncIterator, Union
+import msgspec
+from httpx import AsyncClient, HTTPError, HTTPStatusError, Timeout
+from loguru import logger
+
+# Local imports
+from ..stats import percentile
+
+
+class StreamMessage(msgspec.Struct, frozen=True):
+    """Single message received from an SSE or WebSocket stream."""
+
+    data: Union[str, bytes]
+    event: str = "message"
+    id: Optional[str] = None
+    received_at: float = 0.0
+    latency: Optional[float] = None
+
+    def json(self) -> Any:
+        """
+        Decode message data as JSON.
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+        try:
+            return msgspec.json.decode(self.data)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid JSON in stream message: {e}") from e
+
+
+LatencyFunc = Callable[[StreamMessage], Optional[float]]
+
+
+def timestamp_latency(field: str = "ts", scale: float = 1.0) -> LatencyFunc:
+    """
+    Measure message latency from a send timestamp in the JSON payload.
+
+    Args:
+        field: Payload field with Unix send time
+        scale: Multiplier converting the field to seconds (0.001 for milliseconds)
+
+    Returns:
+        Function returning latency in seconds, or None if field is missing
+    """
+
+    def measure(message: StreamMessage) -> Optional[float]:
+        try:
+            sent_at = message.json()[field]
+            return message.received_at - float(sent_at) * scale
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    return measure
+
+
+class StreamStats(msgspec.Struct):
+    """Message, latency and reconnect statistics of one or more streams."""
+
+    messages: int = 0
+    reconnects: int = 0
+    errors: int = 0
+    latencies: List[float] = msgspec.field(default_factory=list)
+    first_at: Optional[float] = None
+    last_at: Optional[float] = None
+
+    def record_message(self, latency: Optional[float], timestamp: float) -> None:
+        """
+        Record received message.
+
+        Args:
+            latency: Message latency in seconds (None if not measured)
+            timestamp: Monotonic receive time
+        """
+        self.messages += 1
+        if latency is not None:
+            self.latencies.append(latency)
+        if self.first_at is None:
+            self.first_at = timestamp
+        self.last_at = timestamp
+
+    def merge(self, other: "StreamStats") -> None:
+        """Merge statistics of another stream (e.g. another subscriber)."""
+        self.messages += other.messages
+        self.reconnects += other.reconnects
+        self.errors += other.errors
+        self.latencies.extend(other.latencies)
+        if other.first_at is not None and (
+            self.first_at is None or other.first_at < self.first_at
+        ):
+            self.first_at = other.first_at
+        if other.last_at is not None and (
+            self.last_at is None or other.last_at > self.last_at
+        ):
+            self.last_at = other.last_at
+
+    @property
+    def message_rate(self) -> float:
+        """Messages per second between the first and the last message."""
+        if self.first_at is None or self.last_at is None:
+            return 0.0
+        duration = self.last_at - self.first_at
+        return (self.messages - 1) / duration if duration > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Message latency percentile in seconds."""
+        self.latencies.sort()
+        return percentile(self.latencies, q)
+
+
+class SSEParser:
+    """Incremental text/event-stream parser fed line by line."""
+
+    def __init__(self) -> None:
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[float] = None
+        self._event = "message"
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[StreamMessage]:
+        """
+        Process one line of the event stream.
+
+        Args:
+            line: Line without trailing newline
+
+        Returns:
+            StreamMessage when an event is complete (blank line), otherwise None
+        """
+        if not line:
+            if not self._data:
+                self._event = "message"
+                return None
+            message = StreamMessage(
+                data="\n".join(self._data),
+                event=self._event,
+                id=self.last_event_id,
+                received_at=time(),
+            )
+            self._event = "message"
+            self._data = []
+            return message
+        if line.startswith(":"):
+            return None
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value or "message"
+        elif field == "id" and "\0" not in value:
+            self.last_event_id = value
+        elif field == "retry" and value.isascii() and value.isdigit():
+            self.retry = int(value) / 1000
+        return None
+
+
+class _Stream:
+    """Reconnect and statistics handling shared by SSE and WebSocket streams."""
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        stats: Optional[StreamStats],
+        latency_func: Optional[LatencyFunc],
+        reconnect: bool,
+        max_reconnects: int,
+        retry_delay: float,
+    ) -> None:
+        if max_reconnects < 0:
+            raise ValueError(
+                f"max_reconnects must be non-negative, got {max_reconnects}"
+            )
+        self.url = url
+        self.headers = headers
+        self.stats = stats if stats is not None else StreamStats()
+        self.latency_func = latency_func
+        self.reconnect = reconnect
+        self.max_reconnects = max_reconnects
+        self.retry_delay = retry_delay
+        self.logger = logger.bind(name=self.__class__.__name__)
+        self._reconnects = 0
+
+    def _record(self, message: StreamMessage) -> StreamMessage:
+        """Measure latency and record message in statistics."""
+        # A received message means the connection recovered
+        self._reconnects = 0
+        if self.latency_func is not None:
+            message = msgspec.structs.replace(
+                message, latency=self.latency_func(message)
+            )
+        self.stats.record_message(message.latency, monotonic())
+        return message
+
+    async def _should_reconnect(self, error: Optional[Exception]) -> bool:
+        """Count the disconnect and wait before reconnecting if allowed."""
+        if error is not None:
+            self.stats.errors += 1
+        if not self.reconnect or self._reconnects >= self.max_reconnects:
+            if error is not None:
+                self.logger.error("Stream {} failed: {}", self.url, error)
+            return False
+        self._reconnects += 1
+        self.stats.reconnects += 1
+        self.logger.warning(
+            "Stream {} disconnected ({}), reconnect {}/{}",
+            self.url,
+            error or "closed by server",
+            self._reconnects,
+            self.max_reconnects,
+        )
+        await sleep(self.retry_delay)
+        return True
+
+
+class SSEStream(_Stream):
+    """
+    Server-Sent Events subscription.
+
+    Iterate with ``async for``; the stream reconnects with ``Last-Event-ID``
+    when the connection drops, honoring the server's ``retry`` interval.
+    The client's read timeout does not apply: a quiet stream stays open
+    unless ``idle_timeout`` is set, then it reconnects after that many
+    seconds without data.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        url: str,
+        idle_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(url, **kwargs)
+        self._client = client
+        self._parser = SSEParser()
+        self.timeout = Timeout(
+            connect=client.timeout.connect,
+            read=idle_timeout,
+            write=client.timeout.write,
+            pool=client.timeout.pool,
+        )
+
+    async def __aiter__(self) -> AsyncIterator[StreamMessage]:
+        while True:
+            headers = {**self.headers, "Accept": "text/event-stream"}
+            if self._parser.last_event_id is not None:
+                headers["Last-Event-ID"] = self._parser.last_event_id
+            error: Optional[Exception] = None
+            try:
+                async with self._client.stream(
+                    "GET", self.url, headers=headers, timeout=self.timeout
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        message = self._parser.feed(line.rstrip("\r\n"))
+                        if message is not None:
+                            yield self._record(message)
+            except HTTPStatusError as e:
+                if e.response.is_client_error:
+                    # Rejected subscription (e.g. 401) is not retried
+                    self.stats.errors += 1
+                    raise
+                error = e
+            except HTTPError as e:
+                error = e
+            if self._parser.retry is not None:
+                self.retry_delay = self._parser.retry
+            if not await self._should_reconnect(error):
+                if error is not None:
+                    raise error
+                return
+
+
+class WebSocketStream(_Stream):
+    """
+    WebSocket connection with message statistics.
+
+    Use as async context manager; iterate with ``async for`` to receive
+    messages and call send() to publish. Abnormal disconnects are retried,
+    a normal close ends iteration. Requires the ``websockets`` library.
+    """
+
+    def __init__(self, url: str, uds: Optional[str] = None, **kwargs: Any) -> None:
+        super().__init__(url, **kwargs)
+        self.uds = uds
+        self._connection: Any = None
+
+    async def connect(self) -> "WebSocketStream":
+        """
+        Open WebSocket connection.
+
+        Raises:
+            ImportError: If websockets library is not installed
+        """
+        try:
+            from websockets.asyncio.client import connect, unix_connect
+        except ImportError as e:
+            raise ImportError(
+                "WebSocket streams require 'websockets' library. "
+                "Install it with: uv add websockets"
+            ) from e
+        if self.uds is not None:
+            self._connection = await unix_connect(
+                self.uds, self.url, additional_headers=self.headers
+            )
+        else:
+            self._connection = await connect(self.url, additional_headers=self.headers)
+        return self
+
+    async def send(self, message: Union[str, bytes, Dict[str, Any], List[Any]]) -> None:
+        """
+        Send message; dicts and lists are encoded as JSON text.
+
+        Raises:
+            RuntimeError: If stream is not connected
+        """
+        if self._connection is None:
+            raise RuntimeError("WebSocket is not connected, call connect() first")
+        if isinstance(message, (dict, list)):
+            message = msgspec.json.encode(message).decode()
+        await self._connection.send(message)
+
+    async def close(self) -> None:
+        """Close WebSocket connection."""
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def __aenter__(self) -> "WebSocketStream":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    async def __aiter__(self) -> AsyncIterator[StreamMessage]:
+        from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+
+        if self._connection is None:
+            await self.connect()
+        while True:
+            try:
+                async for data in self._connection:
+                    yield self._record(StreamMessage(data=data, received_at=time()))
+                return
+            except ConnectionClosedOK:
+                return
+            except (ConnectionClosed, OSError) as e:
+                error = e
+            if self._connection is None or not await self._should_reconnect(error):
+                raise error
+            try:
+                await self.connect()
+            except OSError:
+                self.stats.errors += 1
+                raise
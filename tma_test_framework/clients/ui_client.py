@@ -75,9 +75,9 @@ class UiClient(BaseClient):
 
             # Navigate to the Mini App URL
             try:
-                self.logger.debug(f"Navigating to {self.url}")
+                self.logger.debug("Navigating to {}", self.url)
                 await self.page.goto(self.url, wait_until="networkidle")
-                self.logger.info(f"Successfully navigated to {self.url}")
+                self.logger.info("Successfully navigated to {}", self.url)
             except Exception as e:
                 error_msg = f"Failed to navigate to {self.url}: {e}"
                 self.logger.error(error_msg)
@@ -96,7 +96,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.click(selector)
-            self.logger.debug(f"Clicked element: {selector}")
+            self.logger.debug("Clicked element: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to click element {selector}: {e}")
 
@@ -113,7 +113,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.fill(selector, text)
-            self.logger.debug(f"Filled input {selector} with: {text}")
+            self.logger.debug("Filled input {} with: {}", selector, text)
         except Exception as e:
             self.logger.error(f"Failed to fill input {selector}: {e}")
 
@@ -130,7 +130,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.wait_for_selector(selector, timeout=timeout)
-            self.logger.debug(f"Element appeared: {selector}")
+            self.logger.debug("Element appeared: {}", selector)
         except Exception as e:
             self.logger.error(f"Element {selector} did not appear: {e}")
 
@@ -146,7 +146,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.screenshot(path=path)
-            self.logger.debug(f"Screenshot saved: {path}")
+            self.logger.debug("Screenshot saved: {}", path)
         except Exception as e:
             self.logger.error(f"Screenshot failed: {e}")
 
@@ -167,7 +167,7 @@ class UiClient(BaseClient):
             element = await self.page.query_selector(selector)
             if element:
                 text = await element.text_content()
-                self.logger.debug(f"Element text ({selector}): {text}")
+                self.logger.debug("Element text ({}): {}", selector, text)
                 return str(text) if text is not None else None
             return None
         except Exception as e:
@@ -195,7 +195,7 @@ class UiClient(BaseClient):
             if element:
                 value = await element.get_attribute(attribute)
                 self.logger.debug(
-                    f"Element attribute ({selector}.{attribute}): {value}"
+                    "Element attribute ({}.{}): {}", selector, attribute, value
                 )
                 return str(value) if value is not None else None
             return None
@@ -217,7 +217,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.locator(selector).scroll_into_view_if_needed()
-            self.logger.debug(f"Scrolled to element: {selector}")
+            self.logger.debug("Scrolled to element: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to scroll to element {selector}: {e}")
 
@@ -252,7 +252,7 @@ class UiClient(BaseClient):
             return None
         try:
             result = await self.page.evaluate(script)
-            self.logger.debug(f"Script executed, result: {result}")
+            self.logger.debug("Script executed, result: {}", result)
             return result
         except Exception as e:
             self.logger.error(f"Script execution failed: {e}")
@@ -270,7 +270,7 @@ class UiClient(BaseClient):
             return ""
         try:
             title = await self.page.title()
-            self.logger.debug(f"Page title: {title}")
+            self.logger.debug("Page title: {}", title)
             return str(title)
         except Exception as e:
             self.logger.error(f"Failed to get page title: {e}")
@@ -288,7 +288,7 @@ class UiClient(BaseClient):
             return ""
         try:
             url = self.page.url
-            self.logger.debug(f"Page URL: {url}")
+            self.logger.debug("Page URL: {}", url)
             return str(url)
         except Exception as e:
             self.logger.error(f"Failed to get page URL: {e}")
@@ -306,7 +306,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.hover(selector)
-            self.logger.debug(f"Hovered over element: {selector}")
+            self.logger.debug("Hovered over element: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to hover over element {selector}: {e}")
 
@@ -322,7 +322,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.dblclick(selector)
-            self.logger.debug(f"Double clicked element: {selector}")
+            self.logger.debug("Double clicked element: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to double click element {selector}: {e}")
 
@@ -338,7 +338,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.click(selector, button="right")
-            self.logger.debug(f"Right clicked element: {selector}")
+            self.logger.debug("Right clicked element: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to right click element {selector}: {e}")
 
@@ -355,7 +355,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.select_option(selector, value)
-            self.logger.debug(f"Selected option {value} in {selector}")
+            self.logger.debug("Selected option {} in {}", value, selector)
         except Exception as e:
             self.logger.error(f"Failed to select option {value} in {selector}: {e}")
 
@@ -371,7 +371,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.check(selector)
-            self.logger.debug(f"Checked checkbox: {selector}")
+            self.logger.debug("Checked checkbox: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to check checkbox {selector}: {e}")
 
@@ -387,7 +387,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.uncheck(selector)
-            self.logger.debug(f"Unchecked checkbox: {selector}")
+            self.logger.debug("Unchecked checkbox: {}", selector)
         except Exception as e:
             self.logger.error(f"Failed to uncheck checkbox {selector}: {e}")
 
@@ -404,7 +404,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.set_input_files(selector, file_path)
-            self.logger.debug(f"Uploaded file {file_path} to {selector}")
+            self.logger.debug("Uploaded file {} to {}", file_path, selector)
         except Exception as e:
             self.logger.error(f"Failed to upload file {file_path} to {selector}: {e}")
 
@@ -420,7 +420,7 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.keyboard.press(key)
-            self.logger.debug(f"Pressed key: {key}")
+            self.logger.debug("Pressed key: {}", key)
         except Exception as e:
             self.logger.error(f"Failed to press key {key}: {e}")
 
@@ -436,6 +436,6 @@ class UiClient(BaseClient):
             return
         try:
             await self.page.keyboard.type(text)
-            self.logger.debug(f"Typed text: {text}")
+            self.logger.debug("Typed text: {}", text)
         except Exception as e:
             self.logger.error(f"Failed to type text: {e}")
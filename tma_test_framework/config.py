@@ -3,13 +3,67 @@ Configuration management for TMA Framework.
 """
 
 # Python imports
+from copy import deepcopy
+from functools import lru_cache
 from os import getenv
 from pathlib import Path
-from typing import Optional, TypeVar, Callable
-from msgspec import Struct
-from yaml import load, SafeLoader
+from typing import Optional, TypeVar, Callable, Tuple, Any, Union
+from msgspec import Struct, convert, field
+from yaml import load
 
-T = TypeVar("T", int, float)
+try:
+    # libyaml bindings parse several times faster than the pure-Python loader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+T = TypeVar("T", int, float, bool)
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off")
+
+# Parsed YAML documents kept by load_yaml(); stale signatures of changed
+# files are evicted like any other least recently used entry
+_YAML_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=_YAML_CACHE_SIZE)
+def _parse_yaml(path: Path, signature: Tuple[int, int, int]) -> Any:
+    """Parse YAML file with the given (mtime, size, inode) signature."""
+    with path.open("rb") as file:
+        return load(file, Loader=YamlLoader)
+
+
+def load_yaml(yaml_path: Union[str, Path]) -> Any:
+    """
+    Load YAML file, reusing the parsed document while the file is unchanged.
+
+    Files are parsed with the libyaml CSafeLoader when available. The
+    parsed document is cached per process by path (up to 64 files, least
+    recently used first out) and re-read when the file's mtime, size or
+    inode change, so loading the same configuration from many fixtures
+    costs a stat() call and a copy. Every call returns a deep copy, so
+    callers may modify it.
+
+    Args:
+        yaml_path: Path to YAML file
+
+    Returns:
+        Parsed YAML document
+
+    Raises:
+        FileNotFoundError: If file does not exist
+        yaml.YAMLError: If file is not valid YAML
+    """
+    path = Path(yaml_path).resolve()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    return deepcopy(_parse_yaml(path, signature))
+
+
+def clear_yaml_cache() -> None:
+    """Drop all parsed YAML documents cached by load_yaml()."""
+    _parse_yaml.cache_clear()
 
 
 def _convert_env_var(
@@ -24,7 +78,7 @@ def _convert_env_var(
     Args:
         env_var_name: Name of the environment variable for error messages
         value: String value from environment variable
-        converter: Function to convert string to target type (int or float)
+        converter: Function to convert string to target type (int, float or boolean)
         default: Default value if value is None
 
     Returns:
@@ -46,6 +100,103 @@ def _convert_env_var(
         ) from e
 
 
+def boolean(value: str) -> bool:
+    """
+    Convert environment variable value to bool.
+
+    Raises:
+        ValueError: If value is not one of 1/0, true/false, yes/no, on/off
+    """
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean: {value}")
+
+
+class PerformanceConfig(Struct, frozen=True, forbid_unknown_fields=True):
+    """
+    Performance tuning of TMA Framework clients.
+
+    ``http2`` requires the ``h2`` package (``tma-test-framework[http2]``).
+    """
+
+    http_max_connections: int = 10
+    http_max_keepalive_connections: int = 5
+    http_keepalive_expiry: float = 5.0
+    http2: bool = False
+    max_concurrency: int = 20
+    log_sample_rate: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate performance settings after initialization."""
+        if self.http_max_connections < 1 or self.http_max_connections > 10000:
+            raise ValueError(
+                f"http_max_connections must be between 1 and 10000, got {self.http_max_connections}"
+            )
+        if (
+            self.http_max_keepalive_connections < 0
+            or self.http_max_keepalive_connections > self.http_max_connections
+        ):
+            raise ValueError(
+                f"http_max_keepalive_connections must be between 0 and http_max_connections "
+                f"({self.http_max_connections}), got {self.http_max_keepalive_connections}"
+            )
+        if self.http_keepalive_expiry < 0 or self.http_keepalive_expiry > 3600:
+            raise ValueError(
+                f"http_keepalive_expiry must be between 0 and 3600 seconds, got {self.http_keepalive_expiry}"
+            )
+        if self.max_concurrency < 1 or self.max_concurrency > 10000:
+            raise ValueError(
+                f"max_concurrency must be between 1 and 10000, got {self.max_concurrency}"
+            )
+        if self.log_sample_rate < 1:
+            raise ValueError(
+                f"log_sample_rate must be at least 1, got {self.log_sample_rate}"
+            )
+
+    @classmethod
+    def from_env(cls) -> "PerformanceConfig":
+        """Create performance settings from environment variables."""
+        defaults = cls()
+        return cls(
+            http_max_connections=_convert_env_var(
+                "TMA_HTTP_MAX_CONNECTIONS",
+                getenv("TMA_HTTP_MAX_CONNECTIONS"),
+                int,
+                default=defaults.http_max_connections,
+            ),
+            http_max_keepalive_connections=_convert_env_var(
+                "TMA_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                getenv("TMA_HTTP_MAX_KEEPALIVE_CONNECTIONS"),
+                int,
+                default=defaults.http_max_keepalive_connections,
+            ),
+            http_keepalive_expiry=_convert_env_var(
+                "TMA_HTTP_KEEPALIVE_EXPIRY",
+                getenv("TMA_HTTP_KEEPALIVE_EXPIRY"),
+                float,
+                default=defaults.http_keepalive_expiry,
+            ),
+            http2=_convert_env_var(
+                "TMA_HTTP2", getenv("TMA_HTTP2"), boolean, default=defaults.http2
+            ),
+            max_concurrency=_convert_env_var(
+                "TMA_MAX_CONCURRENCY",
+                getenv("TMA_MAX_CONCURRENCY"),
+                int,
+                default=defaults.max_concurrency,
+            ),
+            log_sample_rate=_convert_env_var(
+                "TMA_LOG_SAMPLE_RATE",
+                getenv("TMA_LOG_SAMPLE_RATE"),
+                int,
+                default=defaults.log_sample_rate,
+            ),
+        )
+
+
 class Config(Struct, frozen=True):
     """Configuration for TMA Framework MTProto client."""
 
@@ -61,6 +212,7 @@ class Config(Struct, frozen=True):
     log_level: str = "INFO"
     bot_token: Optional[str] = None
     language_code: str = "ru"
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -107,7 +259,12 @@ class Config(Struct, frozen=True):
 
     @classmethod
     def from_env(cls) -> "Config":
-        """Create config from environment variables."""
+        """
+        Create config from environment variables.
+
+        Performance settings are read by PerformanceConfig.from_env()
+        (TMA_HTTP_MAX_CONNECTIONS, TMA_HTTP2, TMA_MAX_CONCURRENCY, ...).
+        """
         api_id = _convert_env_var("TMA_API_ID", getenv("TMA_API_ID"), int)
         api_hash = getenv("TMA_API_HASH")
         if not api_hash:
@@ -135,6 +292,7 @@ class Config(Struct, frozen=True):
             log_level=getenv("TMA_LOG_LEVEL", "INFO"),
             bot_token=getenv("TELEGRAM_BOT_TOKEN"),
             language_code=getenv("TMA_LANGUAGE_CODE", "ru"),
+            performance=PerformanceConfig.from_env(),
         )
 
     @classmethod
@@ -148,6 +306,10 @@ class Config(Struct, frozen=True):
         - TMA_SESSION_STRING overrides session_string
         - TMA_SESSION_FILE overrides session_file
 
+        An optional ``performance`` mapping is loaded into PerformanceConfig
+        with strict types: quoted numbers or ``"no"`` for a boolean are
+        rejected rather than coerced.
+
         Args:
             yaml_path: Path to YAML configuration file
 
@@ -155,8 +317,13 @@ class Config(Struct, frozen=True):
             Config instance loaded from YAML with optional env var overrides
         """
         try:
-            with Path(yaml_path).open("r") as file:
-                config_data = load(file, Loader=SafeLoader)
+            config_data = load_yaml(yaml_path)
+            if config_data.get("performance") is not None:
+                config_data["performance"] = convert(
+                    config_data["performance"], PerformanceConfig
+                )
+            else:
+                config_data.pop("performance", None)
 
             # Override sensitive fields with environment variables if present
             if getenv("TMA_API_HASH"):
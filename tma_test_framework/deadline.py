@@ -0,0 +1,156 @@
+"""
+Scenario-wide deadline budgets for TMA Framework.
+
+A deadline sets the total time budget of a block. Client calls made inside
+the block (ApiClient, DBClient, UserTelegramClient) shrink their own timeout
+to the remaining budget, so a multi-step flow fails once the budget is spent
+instead of after ``steps * Config.timeout``:
+
+    async with deadline(10):
+        await api.make_request("v1/login/", method="POST", data=credentials)
+        await db.execute_query("SELECT ...")
+"""
+
+# Python imports
+from asyncio import timeout as async_timeout
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import monotonic
+from typing import Optional, Any, AsyncIterator, Awaitable, Callable, TypeVar
+import msgspec
+
+T = TypeVar("T")
+
+_current_deadline: ContextVar[Optional["Deadline"]] = ContextVar(
+    "tma_deadline", default=None
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the time budget of a deadline block is spent."""
+
+
+class Deadline(msgspec.Struct, frozen=True):
+    """Active time budget."""
+
+    seconds: float
+    expires_at: float
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (never negative)."""
+        return max(self.expires_at - monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is spent."""
+        return monotonic() >= self.expires_at
+
+    def error(self) -> DeadlineExceeded:
+        """Create DeadlineExceeded describing this deadline."""
+        return DeadlineExceeded(f"Deadline of {self.seconds:g}s exceeded")
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the innermost active deadline (None outside deadline blocks)."""
+    return _current_deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left in the active deadline, or None without deadline."""
+    active = _current_deadline.get()
+    return active.remaining() if active is not None else None
+
+
+def effective_timeout(timeout: Optional[float]) -> Optional[float]:
+    """
+    Shrink a per-call timeout to the remaining deadline budget.
+
+    Args:
+        timeout: Per-call timeout in seconds (None for no timeout)
+
+    Returns:
+        The smaller of timeout and the remaining budget
+
+    Raises:
+        DeadlineExceeded: If the active deadline has already expired
+    """
+    active = _current_deadline.get()
+    if active is None:
+        return timeout
+    if active.expired:
+        raise active.error()
+    remaining = active.remaining()
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+@asynccontextmanager
+async def deadline(seconds: float) -> AsyncIterator[Deadline]:
+    """
+    Run a block with a total time budget.
+
+    Nested deadlines never extend the outer one. The block is cancelled
+    when the budget is spent.
+
+    Args:
+        seconds: Time budget in seconds
+
+    Yields:
+        Active Deadline
+
+    Raises:
+        ValueError: If seconds is not positive
+        DeadlineExceeded: If the block does not finish in time
+    """
+    if seconds <= 0:
+        raise ValueError(f"Deadline must be positive, got {seconds}")
+    expires_at = monotonic() + seconds
+    parent = _current_deadline.get()
+    if parent is not None:
+        expires_at = min(expires_at, parent.expires_at)
+    active = Deadline(seconds=seconds, expires_at=expires_at)
+    token = _current_deadline.set(active)
+    try:
+        async with async_timeout(active.remaining()):
+            yield active
+    except DeadlineExceeded:
+        raise
+    except TimeoutError as e:
+        if active.expired:
+            raise active.error() from e
+        raise
+    finally:
+        _current_deadline.reset(token)
+
+
+def honor_deadline(
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """
+    Bound an async client call by the remaining deadline budget.
+
+    Outside deadline blocks the call runs unchanged.
+
+    Raises:
+        DeadlineExceeded: If the budget is spent before or during the call
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        active = _current_deadline.get()
+        if active is None:
+            return await func(*args, **kwargs)
+        if active.expired:
+            raise active.error()
+        try:
+            async with async_timeout(active.remaining()):
+                return await func(*args, **kwargs)
+        except DeadlineExceeded:
+            raise
+        except TimeoutError as e:
+            if active.expired:
+                raise active.error() from e
+            raise
+
+    wrapper.__honors_deadline__ = True  # type: ignore[attr-defined]
+    return wrapper
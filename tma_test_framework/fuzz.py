@@ -0,0 +1,434 @@
+"""
+initData mutation fuzzing for backend authentication.
+
+generate_mutations() lazily produces malformed and adversarial initData
+variants (bad hashes, reordered keys, expired ``auth_date``, oversized
+``user`` JSON, duplicate parameters, ...), each tagged with its mutation
+class and the outcome a correct validator should produce. InitDataFuzzer
+sends them concurrently through ApiClient and tallies accept/reject
+behavior and latency per mutation class:
+
+    fuzzer = InitDataFuzzer(api, "v1/me/", bot_token=config.bot_token)
+    report = await fuzzer.run(limit=10_000)
+    print(report.report())
+    report.assert_expected()
+"""
+
+# Python imports
+from asyncio import gather
+from itertools import count, cycle
+from random import Random
+from time import monotonic, time
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+from urllib.parse import urlencode
+import msgspec
+
+# Local imports
+from .init_data import InitDataUser, get_signer, to_init_data_user
+from .stats import EndpointStats
+
+if TYPE_CHECKING:
+    from .clients.api_client import ApiClient
+    from .clients.models import ApiResult
+
+
+class Mutation(msgspec.Struct, frozen=True):
+    """
+    Mutated initData variant.
+
+    ``expect_valid`` is the outcome of a correct validator: True (accept),
+    False (reject) or None (either is acceptable, e.g. oversized payloads).
+    """
+
+    name: str
+    init_data: str
+    expect_valid: Optional[bool]
+
+
+class _MutationContext:
+    """Per-generator state shared by mutation functions."""
+
+    def __init__(
+        self, bot_token: str, rng: Random, max_age: float, oversized_bytes: int
+    ) -> None:
+        self.bot_token = bot_token
+        self.rng = rng
+        self.max_age = max_age
+        self.oversized_bytes = oversized_bytes
+        self.signer = get_signer(bot_token)
+
+    def fields(
+        self, user: InitDataUser, auth_date: Optional[Any] = None
+    ) -> Dict[str, str]:
+        """Build unsigned initData fields."""
+        return {
+            "user": msgspec.json.encode(user).decode(),
+            "auth_date": str(int(time()) if auth_date is None else auth_date),
+        }
+
+    def signed(
+        self, fields: Dict[str, str], bot_token: Optional[str] = None
+    ) -> List[Tuple[str, str]]:
+        """Sign fields and return query pairs with ``hash`` last."""
+        signer = self.signer if bot_token is None else get_signer(bot_token)
+        return [*fields.items(), ("hash", signer.sign_fields(fields))]
+
+
+MutationFunc = Callable[[_MutationContext, InitDataUser], str]
+
+
+def _valid(ctx: _MutationContext, user: InitDataUser) -> str:
+    return urlencode(ctx.signed(ctx.fields(user)))
+
+
+def _reordered_keys(ctx: _MutationContext, user: InitDataUser) -> str:
+    pairs = ctx.signed(ctx.fields(user))
+    ctx.rng.shuffle(pairs)
+    return urlencode(pairs)
+
+
+def _bad_hash(ctx: _MutationContext, user: InitDataUser) -> str:
+    pairs = ctx.signed(ctx.fields(user))
+    signature = pairs[-1][1]
+    position = ctx.rng.randrange(len(signature))
+    flipped = "0" if signature[position] != "0" else "1"
+    pairs[-1] = ("hash", signature[:position] + flipped + signature[position + 1 :])
+    return urlencode(pairs)
+
+
+def _missing_hash(ctx: _MutationContext, user: InitDataUser) -> str:
+    return urlencode(ctx.fields(user))
+
+
+def _empty_hash(ctx: _MutationContext, user: InitDataUser) -> str:
+    return urlencode(ctx.fields(user)) + "&hash="
+
+
+def _wrong_bot_token(ctx: _MutationContext, user: InitDataUser) -> str:
+    return urlencode(ctx.signed(ctx.fields(user), bot_token=ctx.bot_token + "x"))
+
+
+def _tampered_user(ctx: _MutationContext, user: InitDataUser) -> str:
+    pairs = ctx.signed(ctx.fields(user))
+    forged = msgspec.structs.replace(user, id=user.id + 1)
+    pairs[0] = ("user", msgspec.json.encode(forged).decode())
+    return urlencode(pairs)
+
+
+def _unsigned_field(ctx: _MutationContext, user: InitDataUser) -> str:
+    pairs = ctx.signed(ctx.fields(user))
+    pairs.insert(0, ("query_id", f"AAE{ctx.rng.getrandbits(32):08x}"))
+    return urlencode(pairs)
+
+
+def _duplicate_params(ctx: _MutationContext, user: InitDataUser) -> str:
+    # parse_qs-style validators keep the first value, which is the forged one
+    forged = msgspec.structs.replace(user, id=user.id + 1)
+    pairs = ctx.signed(ctx.fields(user))
+    return urlencode([("user", msgspec.json.encode(forged).decode()), *pairs])
+
+
+def _expired_auth_date(ctx: _MutationContext, user: InitDataUser) -> str:
+    auth_date = int(time() - ctx.max_age - 3600)
+    return urlencode(ctx.signed(ctx.fields(user, auth_date=auth_date)))
+
+
+def _future_auth_date(ctx: _MutationContext, user: InitDataUser) -> str:
+    return urlencode(ctx.signed(ctx.fields(user, auth_date=int(time()) + 86400)))
+
+
+def _non_numeric_auth_date(ctx: _MutationContext, user: InitDataUser) -> str:
+    return urlencode(ctx.signed(ctx.fields(user, auth_date="yesterday")))
+
+
+def _oversized_user(ctx: _MutationContext, user: InitDataUser) -> str:
+    padded = msgspec.structs.replace(
+        user, last_name="x" * max(ctx.oversized_bytes - 128, 0)
+    )
+    return urlencode(ctx.signed(ctx.fields(padded)))
+
+
+def _malformed_encoding(ctx: _MutationContext, user: InitDataUser) -> str:
+    init_data = urlencode(ctx.signed(ctx.fields(user)))
+    return init_data.replace("%22", "%2", 1).replace("%7D", "%G", 1)
+
+
+def _empty(ctx: _MutationContext, user: InitDataUser) -> str:
+    return ""
+
+
+# Mutation class name -> (mutation function, expected validity)
+MUTATIONS: Dict[str, Tuple[MutationFunc, Optional[bool]]] = {
+    "valid": (_valid, True),
+    "reordered_keys": (_reordered_keys, True),
+    "bad_hash": (_bad_hash, False),
+    "missing_hash": (_missing_hash, False),
+    "empty_hash": (_empty_hash, False),
+    "wrong_bot_token": (_wrong_bot_token, False),
+    "tampered_user": (_tampered_user, False),
+    "unsigned_field": (_unsigned_field, False),
+    "duplicate_params": (_duplicate_params, False),
+    "expired_auth_date": (_expired_auth_date, False),
+    "future_auth_date": (_future_auth_date, None),
+    "non_numeric_auth_date": (_non_numeric_auth_date, False),
+    "oversized_user": (_oversized_user, None),
+    "malformed_encoding": (_malformed_encoding, False),
+    "empty": (_empty, False),
+}
+
+
+def generate_mutations(
+    bot_token: str,
+    users: Optional[Iterable[Any]] = None,
+    mutations: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    seed: Optional[int] = None,
+    max_age: float = 86400,
+    oversized_bytes: int = 64 * 1024,
+) -> Iterator[Mutation]:
+    """
+    Lazily generate mutated initData variants.
+
+    Mutation classes are applied round-robin; each variant uses the next
+    user, so the stream can be consumed at any rate and length.
+
+    Args:
+        bot_token: Bot token the backend validates with
+        users: Users (see init_data.to_init_data_user; default: IDs 1, 2, ...)
+        mutations: Mutation class names (default: all of MUTATIONS)
+        limit: Number of variants (None for endless stream)
+        seed: Random seed for reproducible variants
+        max_age: ``auth_date`` age limit of the backend (for ``expired_auth_date``)
+        oversized_bytes: Size of the ``user`` JSON in ``oversized_user``
+
+    Returns:
+        Iterator of Mutation
+
+    Raises:
+        ValueError: If a mutation class is unknown
+    """
+    names = list(MUTATIONS) if mutations is None else list(mutations)
+    unknown = [name for name in names if name not in MUTATIONS]
+    if unknown or not names:
+        raise ValueError(
+            f"Unknown mutation classes: {unknown}, expected some of {list(MUTATIONS)}"
+        )
+    ctx = _MutationContext(bot_token, Random(seed), max_age, oversized_bytes)
+    return _mutate(ctx, names, count(1) if users is None else users, limit)
+
+
+def _mutate(
+    ctx: _MutationContext, names: List[str], users: Iterable[Any], limit: Optional[int]
+) -> Iterator[Mutation]:
+    """Apply mutation classes round-robin to users."""
+    for index, (name, user) in enumerate(zip(cycle(names), users)):
+        if limit is not None and index >= limit:
+            return
+        func, expect_valid = MUTATIONS[name]
+        yield Mutation(
+            name=name,
+            init_data=func(ctx, to_init_data_user(user)),
+            expect_valid=expect_valid,
+        )
+
+
+class MutationStats(msgspec.Struct):
+    """
+    Backend behavior for one mutation class.
+
+    Accepted means 2xx/3xx, rejected 4xx; 5xx responses and transport
+    failures are counted as failed. ``latency`` counts unexpected outcomes
+    as errors.
+    """
+
+    name: str
+    expect_valid: Optional[bool]
+    accepted: int = 0
+    rejected: int = 0
+    failed: int = 0
+    status_codes: Dict[int, int] = {}
+    latency: Optional[EndpointStats] = None
+
+    def record(self, result: "ApiResult") -> None:
+        """Record backend response to a variant of this class."""
+        status = result.status_code
+        self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        if status == 0 or result.server_error:
+            self.failed += 1
+            outcome: Optional[bool] = None
+        elif result.client_error:
+            self.rejected += 1
+            outcome = False
+        else:
+            self.accepted += 1
+            outcome = True
+        if self.latency is None:
+            self.latency = EndpointStats(key=self.name)
+        self.latency.record(
+            result.response_time if status else None,
+            outcome is None
+            or (self.expect_valid is not None and outcome != self.expect_valid),
+            monotonic(),
+        )
+
+    @property
+    def sent(self) -> int:
+        """Number of variants sent."""
+        return self.accepted + self.rejected + self.failed
+
+    @property
+    def unexpected(self) -> int:
+        """Failed requests plus accept/reject decisions contradicting expect_valid."""
+        if self.expect_valid is None:
+            return self.failed
+        return self.failed + (self.rejected if self.expect_valid else self.accepted)
+
+
+class FuzzReport(msgspec.Struct):
+    """Backend behavior per mutation class."""
+
+    mutations: Dict[str, MutationStats] = {}
+
+    @property
+    def sent(self) -> int:
+        """Number of variants sent."""
+        return sum(stats.sent for stats in self.mutations.values())
+
+    @property
+    def unexpected(self) -> int:
+        """Number of unexpected outcomes over all classes."""
+        return sum(stats.unexpected for stats in self.mutations.values())
+
+    def report(self) -> str:
+        """Render per-class outcome and latency table."""
+        lines = [
+            f"{'mutation':<22} {'expect':>6} {'sent':>7} {'accept':>7} "
+            f"{'reject':>7} {'failed':>7} {'unexp':>6} {'p50 ms':>8} {'p95 ms':>8}"
+        ]
+        for name, stats in self.mutations.items():
+            expect = {True: "accept", False: "reject", None: "any"}[stats.expect_valid]
+            latency = stats.latency
+            p50 = latency.percentile(50) * 1000 if latency else 0.0
+            p95 = latency.percentile(95) * 1000 if latency else 0.0
+            lines.append(
+                f"{name:<22} {expect:>6} {stats.sent:>7} {stats.accepted:>7} "
+                f"{stats.rejected:>7} {stats.failed:>7} {stats.unexpected:>6} "
+                f"{p50:>8.1f} {p95:>8.1f}"
+            )
+        return "\n".join(lines)
+
+    def assert_expected(self) -> None:
+        """
+        Assert that the backend behaved as a correct validator.
+
+        Raises:
+            AssertionError: If any mutation class had unexpected outcomes
+        """
+        failures = [
+            f"{name}: {stats.unexpected} unexpected of {stats.sent} "
+            f"(status codes {dict(sorted(stats.status_codes.items()))})"
+            for name, stats in self.mutations.items()
+            if stats.unexpected
+        ]
+        if failures:
+            raise AssertionError(
+                "Backend initData validation misbehaved:\n" + "\n".join(failures)
+            )
+
+
+class InitDataFuzzer:
+    """Concurrent runner sending mutated initData to an endpoint."""
+
+    def __init__(
+        self,
+        api: "ApiClient",
+        endpoint: str,
+        bot_token: str,
+        method: str = "GET",
+        data: Optional[Dict[str, Any]] = None,
+        auth_scheme: str = "tma",
+        concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize fuzzer.
+
+        Args:
+            api: ApiClient used for requests
+            endpoint: Endpoint that authenticates with initData
+            bot_token: Bot token the backend validates with
+            method: HTTP method
+            data: JSON body sent with every request
+            auth_scheme: Authorization scheme (``Authorization: <scheme> <initData>``)
+            concurrency: Number of requests in flight
+                (default: api.config.performance.max_concurrency)
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency is None:
+            concurrency = api.config.performance.max_concurrency
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self.api = api
+        self.endpoint = endpoint
+        self.bot_token = bot_token
+        self.method = method
+        self.data = data
+        self.auth_scheme = auth_scheme
+        self.concurrency = concurrency
+
+    async def run(
+        self,
+        mutations: Optional[Iterable[Mutation]] = None,
+        limit: Optional[int] = 1000,
+        **generator_kwargs: Any,
+    ) -> FuzzReport:
+        """
+        Send mutated initData variants and tally backend behavior.
+
+        Args:
+            mutations: Variants to send (default: generate_mutations())
+            limit: Number of generated variants when mutations is not given
+            **generator_kwargs: Further generate_mutations() arguments
+
+        Returns:
+            FuzzReport with per-class statistics
+        """
+        if mutations is None:
+            mutations = generate_mutations(
+                self.bot_token, limit=limit, **generator_kwargs
+            )
+        variants = iter(mutations)
+        report = FuzzReport()
+
+        async def worker() -> None:
+            # Workers share one iterator, so variants are generated on demand
+            for mutation in variants:
+                result = await self.api.make_request(
+                    self.endpoint,
+                    method=self.method,
+                    data=self.data,
+                    headers={
+                        "Authorization": f"{self.auth_scheme} {mutation.init_data}"
+                    },
+                )
+                stats = report.mutations.get(mutation.name)
+                if stats is None:
+                    stats = report.mutations[mutation.name] = MutationStats(
+                        name=mutation.name, expect_valid=mutation.expect_valid
+                    )
+                stats.record(result)
+
+        await gather(*(worker() for _ in range(self.concurrency)))
+        return report
@@ -0,0 +1,191 @@
+"""
+On-disk cache of Telegram identities resolved from MTProto sessions.
+
+Resolving the current user requires connecting a UserTelegramClient and
+calling get_me(), which takes seconds. IdentityCache stores the resulting
+UserInfo keyed by a hash of the session, so later processes and xdist
+workers can build initData without touching MTProto.
+"""
+
+# Python imports
+import os
+import re
+import time
+from hashlib import sha256
+from pathlib import Path
+from tempfile import mkstemp
+from typing import Callable, Optional, Union
+from msgspec import DecodeError, Struct, ValidationError, json
+
+# Local imports
+from .clients.mtproto_client import UserInfo
+from .config import Config
+
+DEFAULT_IDENTITY_TTL = 24 * 60 * 60
+
+
+class _CachedIdentity(Struct, frozen=True):
+    """Cache entry stored on disk."""
+
+    user: UserInfo
+    cached_at: float
+
+
+_encoder = json.Encoder()
+_decoder = json.Decoder(_CachedIdentity)
+
+# Entry file names are session_key() digests
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}\.json")
+
+
+def session_key(config: Config) -> str:
+    """
+    Get cache key identifying the session of a config.
+
+    The key is a SHA-256 digest of api_id and the session string, or of
+    api_id and the resolved session file path. File contents are not
+    hashed, since Telethon rewrites the SQLite session on every connect;
+    call IdentityCache.invalidate() after logging another account into
+    the same file. The session itself is never written to the cache.
+
+    Args:
+        config: Configuration with session_string or session_file
+
+    Returns:
+        Hex digest identifying the session
+    """
+    digest = sha256(str(config.api_id).encode())
+    if config.session_string is not None:
+        digest.update(b"string:" + config.session_string.encode())
+    else:
+        # Telethon appends .session to file names without it
+        name = str(config.session_file)
+        if not name.endswith(".session"):
+            name += ".session"
+        digest.update(b"path:" + str(Path(name).resolve()).encode())
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """
+    Get default identity cache directory.
+
+    Uses ``TMA_IDENTITY_CACHE_DIR`` if set, otherwise
+    ``$XDG_CACHE_HOME/tma_test_framework/identities`` (``~/.cache`` by default).
+    """
+    override = os.getenv("TMA_IDENTITY_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "tma_test_framework" / "identities"
+
+
+class IdentityCache:
+    """
+    Persistent cache of UserInfo keyed by session hash.
+
+    Entries are one JSON file per session, written atomically, so the cache
+    can be shared by concurrent processes such as pytest-xdist workers.
+    Expired, unreadable and corrupted entries are treated as misses.
+
+    Example:
+        >>> cache = IdentityCache(ttl=3600)
+        >>> await api.setup_tma_auth(config=config, identity_cache=cache)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        ttl: Optional[float] = DEFAULT_IDENTITY_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize identity cache.
+
+        Args:
+            directory: Cache directory (default: default_cache_dir())
+            ttl: Seconds an entry stays valid (None: never expires)
+            clock: Wall clock function, overridable in tests
+
+        Raises:
+            ValueError: If ttl is not positive
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.directory = (
+            Path(directory) if directory is not None else default_cache_dir()
+        )
+        self.ttl = ttl
+        self._clock = clock
+
+    def _path(self, config: Config) -> Path:
+        """Get entry path for config session."""
+        return self.directory / f"{session_key(config)}.json"
+
+    def get(self, config: Config) -> Optional[UserInfo]:
+        """
+        Get cached UserInfo for config session.
+
+        Args:
+            config: Configuration identifying the session
+
+        Returns:
+            Cached UserInfo, or None if missing or expired
+        """
+        path = self._path(config)
+        try:
+            entry = _decoder.decode(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, DecodeError, ValidationError):
+            path.unlink(missing_ok=True)
+            return None
+        if self.ttl is not None and self._clock() - entry.cached_at > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return entry.user
+
+    def put(self, config: Config, user_info: UserInfo) -> None:
+        """
+        Store UserInfo for config session.
+
+        Args:
+            config: Configuration identifying the session
+            user_info: User resolved from the session
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = _encoder.encode(_CachedIdentity(user_info, self._clock()))
+        fd, tmp = mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(payload)
+            os.replace(tmp, self._path(config))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def invalidate(self, config: Optional[Config] = None) -> int:
+        """
+        Remove cached identities.
+
+        Args:
+            config: Configuration whose entry is removed (None: remove all
+                entries; other files in the directory are kept)
+
+        Returns:
+            Number of removed entries
+        """
+        if config is not None:
+            path = self._path(config)
+            if not path.exists():
+                return 0
+            path.unlink(missing_ok=True)
+            return 1
+        if not self.directory.is_dir():
+            return 0
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            if _ENTRY_NAME.fullmatch(path.name):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
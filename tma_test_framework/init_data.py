@@ -0,0 +1,799 @@
+"""
+Telegram Mini App initData signing and validation.
+
+The initData signature is ``HMAC_SHA256(data_check_string, secret)`` where
+``secret = HMAC_SHA256(bot_token, "WebAppData")``. InitDataSigner derives
+the secret once per bot token and keeps a keyed HMAC state that is copied
+for every signature, so signing and validating many initData strings costs
+one HMAC update each.
+
+For third-party validation Telegram also signs initData with Ed25519 (the
+``signature`` field) over ``"<bot_id>:WebAppData\n" + data_check_string``
+without ``hash`` and ``signature``; it can be checked with Telegram's public
+key and without the bot token.
+"""
+
+# Python imports
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import sha256
+from hmac import compare_digest, new
+from itertools import islice
+from time import time
+from typing import (
+    Optional,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Union,
+)
+from urllib.parse import quote_plus, unquote_plus
+import msgspec
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+# Public keys Telegram signs third-party initData with (hex)
+TELEGRAM_PUBLIC_KEY = "e7bf03a2fa4602af4580703d88dda5bb59f32ed8b02a56c187fe7d34caed242d"
+TELEGRAM_TEST_PUBLIC_KEY = (
+    "40055058a4ee38156a06562e52eece92a771bcd8346a8c4615cb7376eddf72ec"
+)
+
+
+def build_data_check_string(params: Mapping[str, str]) -> str:
+    """
+    Build data check string from initData fields.
+
+    Args:
+        params: initData fields without ``hash``
+
+    Returns:
+        ``key=value`` pairs sorted by key and joined with newlines
+    """
+    return "\n".join(f"{key}={params[key]}" for key in sorted(params))
+
+
+class InitDataSigner:
+    """
+    initData signer and verifier for one bot token.
+
+    Example:
+        >>> signer = get_signer(bot_token)
+        >>> signature = signer.sign(build_data_check_string(fields))
+        >>> signer.verify(build_data_check_string(fields), signature)
+        True
+    """
+
+    __slots__ = ("_mac",)
+
+    def __init__(self, bot_token: str) -> None:
+        """
+        Derive secret key for bot token.
+
+        Args:
+            bot_token: Telegram bot token
+        """
+        secret = new(b"WebAppData", bot_token.encode(), sha256).digest()
+        self._mac = new(secret, digestmod=sha256)
+
+    def sign(self, data_check_string: Union[str, bytes]) -> str:
+        """
+        Compute initData hash.
+
+        Args:
+            data_check_string: Data check string (see build_data_check_string)
+
+        Returns:
+            Hex-encoded HMAC-SHA256 signature
+        """
+        mac = self._mac.copy()
+        mac.update(
+            data_check_string.encode()
+            if isinstance(data_check_string, str)
+            else data_check_string
+        )
+        return mac.hexdigest()
+
+    def sign_fields(self, fields: Mapping[str, str]) -> str:
+        """Compute initData hash of fields (without ``hash``)."""
+        return self.sign(build_data_check_string(fields))
+
+    def verify(self, data_check_string: Union[str, bytes], received_hash: str) -> bool:
+        """
+        Check initData hash in constant time.
+
+        Args:
+            data_check_string: Data check string
+            received_hash: Hash received in initData
+
+        Returns:
+            True if hash matches
+        """
+        return compare_digest(received_hash, self.sign(data_check_string))
+
+
+@lru_cache(maxsize=64)
+def get_signer(bot_token: str) -> InitDataSigner:
+    """
+    Get cached InitDataSigner for bot token.
+
+    Signers of the 64 most recently used bot tokens are kept.
+
+    Args:
+        bot_token: Telegram bot token
+
+    Returns:
+        Shared InitDataSigner
+    """
+    return InitDataSigner(bot_token)
+
+
+def parse_init_data(init_data: str) -> Dict[str, str]:
+    """
+    Parse initData query string in one pass.
+
+    Matches ``parse_qs`` semantics used by Telegram validators: the first
+    value of a repeated key wins and pairs without value are skipped. Only
+    values containing ``%`` or ``+`` are unquoted.
+
+    Args:
+        init_data: Raw initData string
+
+    Returns:
+        Field name to decoded value
+    """
+    fields: Dict[str, str] = {}
+    for pair in init_data.split("&"):
+        key, _, value = pair.partition("=")
+        if not value:
+            continue
+        if "%" in key or "+" in key:
+            key = unquote_plus(key)
+        if key in fields:
+            continue
+        if "%" in value or "+" in value:
+            value = unquote_plus(value)
+        fields[key] = value
+    return fields
+
+
+class InitDataValidation(msgspec.Struct, frozen=True):
+    """
+    Result of initData validation.
+
+    ``reason`` is None for valid initData, otherwise one of ``empty``,
+    ``missing_hash``, ``invalid_hash``, ``missing_signature``,
+    ``invalid_signature``, ``missing_auth_date`` or ``expired``.
+    """
+
+    valid: bool
+    reason: Optional[str] = None
+    fields: Dict[str, str] = {}
+    auth_date: Optional[int] = None
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+class BaseInitDataValidator:
+    """
+    Base class of synchronous initData validators.
+
+    Parses initData and checks ``auth_date`` freshness; subclasses implement
+    the signature check in _verify().
+    """
+
+    def __init__(
+        self,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        """
+        Initialize validator.
+
+        Args:
+            max_age: Maximum age of ``auth_date`` in seconds (None skips check)
+            clock: Function returning current Unix time
+
+        Raises:
+            ValueError: If max_age is negative
+        """
+        if max_age is not None and max_age < 0:
+            raise ValueError(f"max_age must be non-negative, got {max_age}")
+        self.max_age = max_age
+        self.clock = clock
+
+    def validate(self, init_data: str) -> InitDataValidation:
+        """
+        Validate initData signature and freshness.
+
+        Args:
+            init_data: Raw initData string
+
+        Returns:
+            InitDataValidation with parsed fields (without signature fields)
+        """
+        if not init_data:
+            return InitDataValidation(valid=False, reason="empty")
+        fields = parse_init_data(init_data)
+        auth_date_text = fields.get("auth_date")
+        # isdigit() alone accepts non-ASCII digits such as "²" or Arabic-Indic
+        auth_date = (
+            int(auth_date_text)
+            if auth_date_text is not None
+            and auth_date_text.isascii()
+            and auth_date_text.isdigit()
+            else None
+        )
+        reason = self._verify(fields)
+        if reason is not None:
+            return InitDataValidation(
+                valid=False, reason=reason, fields=fields, auth_date=auth_date
+            )
+        if self.max_age is not None:
+            if auth_date is None:
+                return InitDataValidation(
+                    valid=False, reason="missing_auth_date", fields=fields
+                )
+            if self.clock() - auth_date > self.max_age:
+                return InitDataValidation(
+                    valid=False, reason="expired", fields=fields, auth_date=auth_date
+                )
+        return InitDataValidation(valid=True, fields=fields, auth_date=auth_date)
+
+    def _verify(self, fields: Dict[str, str]) -> Optional[str]:
+        """
+        Check signature and remove signature fields.
+
+        Args:
+            fields: Parsed initData fields, modified in place
+
+        Returns:
+            Failure reason, or None if the signature is valid
+        """
+        raise NotImplementedError
+
+    def validate_many(self, init_data: Iterable[str]) -> Iterator[InitDataValidation]:
+        """Validate initData strings lazily, in input order."""
+        validate = self.validate
+        return (validate(item) for item in init_data)
+
+
+class InitDataValidator(BaseInitDataValidator):
+    """
+    Synchronous initData validator for one bot token.
+
+    Example:
+        >>> validator = InitDataValidator(bot_token, max_age=86400)
+        >>> invalid = [r for r in validator.validate_many(corpus) if not r.valid]
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        """
+        Initialize validator.
+
+        Args:
+            bot_token: Telegram bot token
+            max_age: Maximum age of ``auth_date`` in seconds (None skips check)
+            clock: Function returning current Unix time
+
+        Raises:
+            ValueError: If max_age is negative
+        """
+        super().__init__(max_age, clock)
+        self.signer = get_signer(bot_token)
+
+    def _verify(self, fields: Dict[str, str]) -> Optional[str]:
+        received_hash = fields.pop("hash", None)
+        if received_hash is None:
+            return "missing_hash"
+        if not self.signer.verify(build_data_check_string(fields), received_hash):
+            return "invalid_hash"
+        return None
+
+
+def check_init_data(
+    init_data: str, bot_token: str, max_age: Optional[float] = None
+) -> InitDataValidation:
+    """
+    Validate one initData string.
+
+    Args:
+        init_data: Raw initData string
+        bot_token: Telegram bot token
+        max_age: Maximum age of ``auth_date`` in seconds (None skips check)
+
+    Returns:
+        InitDataValidation
+    """
+    return InitDataValidator(bot_token, max_age=max_age).validate(init_data)
+
+
+def build_third_party_check_string(bot_id: int, fields: Mapping[str, str]) -> str:
+    """
+    Build data check string of the Ed25519 (third-party) scheme.
+
+    Args:
+        bot_id: Bot ID (the part of the bot token before ``:``)
+        fields: initData fields; ``hash`` and ``signature`` are ignored
+
+    Returns:
+        ``"<bot_id>:WebAppData"`` followed by sorted ``key=value`` lines
+    """
+    lines = [f"{bot_id}:WebAppData"]
+    lines.extend(
+        f"{key}={fields[key]}"
+        for key in sorted(fields)
+        if key != "hash" and key != "signature"
+    )
+    return "\n".join(lines)
+
+
+def bot_id_from_token(bot_token: str) -> int:
+    """
+    Extract bot ID from bot token.
+
+    Raises:
+        ValueError: If bot token does not start with a numeric bot ID
+    """
+    bot_id, _, _ = bot_token.partition(":")
+    if not (bot_id.isascii() and bot_id.isdigit()):
+        raise ValueError("bot_token must start with numeric bot ID")
+    return int(bot_id)
+
+
+@lru_cache(maxsize=16)
+def get_public_key(public_key: Union[str, bytes]) -> Ed25519PublicKey:
+    """
+    Parse and cache Ed25519 public key.
+
+    Args:
+        public_key: Hex string or raw 32-byte key
+
+    Returns:
+        Ed25519PublicKey
+
+    Raises:
+        ValueError: If key is not a valid Ed25519 public key
+    """
+    raw = bytes.fromhex(public_key) if isinstance(public_key, str) else public_key
+    return Ed25519PublicKey.from_public_bytes(raw)
+
+
+def _decode_signature(signature: str) -> bytes:
+    """Decode base64url signature with or without padding."""
+    return urlsafe_b64decode(signature + "=" * (-len(signature) % 4))
+
+
+class Ed25519InitDataSigner:
+    """
+    Ed25519 initData signer acting as Telegram for test backends.
+
+    Backends under test must trust ``public_key_hex`` instead of Telegram's
+    public key.
+
+    Example:
+        >>> signer = Ed25519InitDataSigner()
+        >>> init_data = generate_telegram_init_data(bot_token=token, ed25519_signer=signer)
+    """
+
+    __slots__ = ("private_key", "public_key")
+
+    def __init__(
+        self, private_key: Union[Ed25519PrivateKey, bytes, None] = None
+    ) -> None:
+        """
+        Initialize signer.
+
+        Args:
+            private_key: Private key or raw 32-byte seed (default: new random key)
+
+        Raises:
+            ValueError: If raw key is not 32 bytes
+        """
+        if private_key is None:
+            private_key = Ed25519PrivateKey.generate()
+        elif isinstance(private_key, bytes):
+            private_key = Ed25519PrivateKey.from_private_bytes(private_key)
+        self.private_key = private_key
+        self.public_key = private_key.public_key()
+
+    @property
+    def seed(self) -> bytes:
+        """Raw 32-byte private key (to recreate the signer in other processes)."""
+        return self.private_key.private_bytes(
+            Encoding.Raw, PrivateFormat.Raw, NoEncryption()
+        )
+
+    @property
+    def public_key_hex(self) -> str:
+        """Public key as hex string (format of TELEGRAM_PUBLIC_KEY)."""
+        return self.public_key.public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
+
+    def sign(self, check_string: Union[str, bytes]) -> str:
+        """
+        Sign third-party data check string.
+
+        Returns:
+            base64url signature without padding
+        """
+        if isinstance(check_string, str):
+            check_string = check_string.encode()
+        signature = self.private_key.sign(check_string)
+        return urlsafe_b64encode(signature).rstrip(b"=").decode()
+
+    def sign_fields(self, bot_id: int, fields: Mapping[str, str]) -> str:
+        """Sign initData fields (``hash`` and ``signature`` are ignored)."""
+        return self.sign(build_third_party_check_string(bot_id, fields))
+
+
+class Ed25519InitDataValidator(BaseInitDataValidator):
+    """
+    Synchronous validator of third-party (Ed25519) initData signatures.
+
+    Needs only the bot ID and the public key, not the bot token. Results use
+    reasons ``missing_signature`` and ``invalid_signature`` instead of the
+    hash reasons.
+    """
+
+    def __init__(
+        self,
+        bot_id: int,
+        public_key: Union[str, bytes, Ed25519PublicKey] = TELEGRAM_PUBLIC_KEY,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        """
+        Initialize validator.
+
+        Args:
+            bot_id: Bot ID the initData was issued for
+            public_key: Ed25519 public key (hex, raw bytes or key object;
+                default: Telegram production key)
+            max_age: Maximum age of ``auth_date`` in seconds (None skips check)
+            clock: Function returning current Unix time
+
+        Raises:
+            ValueError: If public key is invalid or max_age is negative
+        """
+        super().__init__(max_age, clock)
+        self.bot_id = bot_id
+        self.public_key = (
+            public_key
+            if isinstance(public_key, Ed25519PublicKey)
+            else get_public_key(public_key)
+        )
+
+    def _verify(self, fields: Dict[str, str]) -> Optional[str]:
+        fields.pop("hash", None)
+        signature = fields.pop("signature", None)
+        if signature is None:
+            return "missing_signature"
+        try:
+            self.public_key.verify(
+                _decode_signature(signature),
+                build_third_party_check_string(self.bot_id, fields).encode(),
+            )
+        except (InvalidSignature, BinasciiError, ValueError):
+            return "invalid_signature"
+        return None
+
+
+def check_init_data_signature(
+    init_data: str,
+    bot_id: int,
+    public_key: Union[str, bytes, Ed25519PublicKey] = TELEGRAM_PUBLIC_KEY,
+    max_age: Optional[float] = None,
+) -> InitDataValidation:
+    """
+    Validate third-party (Ed25519) signature of one initData string.
+
+    Args:
+        init_data: Raw initData string
+        bot_id: Bot ID the initData was issued for
+        public_key: Ed25519 public key (default: Telegram production key)
+        max_age: Maximum age of ``auth_date`` in seconds (None skips check)
+
+    Returns:
+        InitDataValidation
+
+    Raises:
+        ValueError: If public key is invalid
+    """
+    return Ed25519InitDataValidator(bot_id, public_key, max_age=max_age).validate(
+        init_data
+    )
+
+
+class InitDataUser(msgspec.Struct):
+    """User object embedded in initData (``user`` field)."""
+
+    id: int
+    first_name: str
+    last_name: str = ""
+    username: str = ""
+    language_code: str = "en"
+    is_premium: bool = False
+    allows_write_to_pm: bool = True
+
+
+_user_encoder = msgspec.json.Encoder()
+
+# quote_plus() as a per-byte translation table for latin-1 decoded UTF-8
+_QUOTE_PLUS_TABLE = [
+    chr(byte)
+    if chr(byte).isascii() and (chr(byte).isalnum() or chr(byte) in "_.-~")
+    else "+"
+    if byte == 0x20
+    else f"%{byte:02X}"
+    for byte in range(256)
+]
+
+
+class InitDataTemplate:
+    """
+    Per-user initData template re-signed cheaply with a fresh ``auth_date``.
+
+    The ``user`` JSON is encoded and URL-quoted once; sign() only formats
+    ``auth_date`` (and optional ``query_id``/``start_param``) and computes
+    the signature(s).
+
+    Example:
+        >>> template = InitDataTemplate(user, bot_token)
+        >>> api.set_auth_token(template.sign(), token_type="tma")
+    """
+
+    __slots__ = (
+        "user",
+        "query_id",
+        "start_param",
+        "_signer",
+        "_ed25519_signer",
+        "_bot_id",
+        "_user_tail",
+        "_user_quoted",
+    )
+
+    def __init__(
+        self,
+        user: Any,
+        bot_token: str,
+        query_id: Optional[str] = None,
+        start_param: Optional[str] = None,
+        ed25519_signer: Optional["Ed25519InitDataSigner"] = None,
+    ) -> None:
+        """
+        Initialize template.
+
+        Args:
+            user: User (see to_init_data_user)
+            bot_token: Bot token for signatures
+            query_id: Default ``query_id`` field
+            start_param: Default ``start_param`` field
+            ed25519_signer: Also add third-party ``signature`` field
+
+        Raises:
+            ValueError: If user cannot be converted or ed25519_signer is
+                given with a bot token without bot ID
+        """
+        self.user = to_init_data_user(user)
+        self.query_id = query_id
+        self.start_param = start_param
+        self._signer = get_signer(bot_token)
+        self._ed25519_signer = ed25519_signer
+        self._bot_id = bot_id_from_token(bot_token) if ed25519_signer is not None else 0
+        user_json = _user_encoder.encode(self.user)
+        self._user_tail = b"\nuser=" + user_json
+        self._user_quoted = user_json.decode("latin-1").translate(_QUOTE_PLUS_TABLE)
+
+    def sign(
+        self,
+        auth_date: Optional[int] = None,
+        query_id: Optional[str] = None,
+        start_param: Optional[str] = None,
+    ) -> str:
+        """
+        Produce signed initData string.
+
+        Args:
+            auth_date: Unix time of authentication (default: now)
+            query_id: Override of the template ``query_id``
+            start_param: Override of the template ``start_param``
+
+        Returns:
+            initData string
+        """
+        auth_date = int(time()) if auth_date is None else auth_date
+        query_id = self.query_id if query_id is None else query_id
+        start_param = self.start_param if start_param is None else start_param
+        # Fields in data check string order: auth_date, query_id, signature,
+        # start_param, user
+        head = b"auth_date=%d" % auth_date
+        if query_id is not None:
+            head += b"\nquery_id=" + query_id.encode()
+        tail = self._user_tail
+        if start_param is not None:
+            tail = b"\nstart_param=" + start_param.encode() + tail
+        parts = [f"user={self._user_quoted}", f"auth_date={auth_date}"]
+        if query_id is not None:
+            parts.insert(0, f"query_id={quote_plus(query_id)}")
+        if start_param is not None:
+            parts.append(f"start_param={quote_plus(start_param)}")
+        if self._ed25519_signer is not None:
+            signature = self._ed25519_signer.sign(
+                b"%d:WebAppData\n%s%s" % (self._bot_id, head, tail)
+            )
+            head += b"\nsignature=" + signature.encode()
+            parts.append(f"signature={signature}")
+        parts.append(f"hash={self._signer.sign(head + tail)}")
+        return "&".join(parts)
+
+
+def to_init_data_user(user: Any) -> InitDataUser:
+    """
+    Convert user description to InitDataUser.
+
+    Args:
+        user: InitDataUser, UserInfo, mapping with InitDataUser fields, or
+            integer user ID (synthetic user with generated names)
+
+    Returns:
+        InitDataUser instance
+
+    Raises:
+        ValueError: If user cannot be converted
+    """
+    if isinstance(user, InitDataUser):
+        return user
+    if isinstance(user, int):
+        return InitDataUser(id=user, first_name=f"User{user}", username=f"user_{user}")
+    if isinstance(user, Mapping):
+        try:
+            return msgspec.convert(user, InitDataUser)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid initData user: {e}") from e
+    if hasattr(user, "id") and hasattr(user, "first_name"):
+        return InitDataUser(
+            id=user.id,
+            first_name=user.first_name or "",
+            last_name=getattr(user, "last_name", None) or "",
+            username=getattr(user, "username", None) or "",
+            is_premium=bool(getattr(user, "is_premium", False)),
+        )
+    raise ValueError(f"Unsupported initData user: {type(user).__name__}")
+
+
+def _sign_users(
+    bot_token: str, auth_date: int, users: List[Any], ed25519_seed: Optional[bytes]
+) -> List[str]:
+    """Sign initData for a chunk of users (runs in worker processes too)."""
+    signer = get_signer(bot_token)
+    auth_text = f"auth_date={auth_date}"
+    auth_field = auth_text.encode()
+    ed25519_signer = (
+        Ed25519InitDataSigner(ed25519_seed) if ed25519_seed is not None else None
+    )
+    third_party_prefix = b"%d:WebAppData\n%s\nuser=" % (
+        bot_id_from_token(bot_token) if ed25519_signer is not None else 0,
+        auth_field,
+    )
+    results = []
+    for user in users:
+        user_json = _user_encoder.encode(to_init_data_user(user))
+        quoted = user_json.decode("latin-1").translate(_QUOTE_PLUS_TABLE)
+        if ed25519_signer is None:
+            signature = signer.sign(b"%s\nuser=%s" % (auth_field, user_json))
+            results.append(f"user={quoted}&{auth_text}&hash={signature}")
+            continue
+        # Telegram's hash covers the Ed25519 signature field
+        ed25519_signature = ed25519_signer.sign(third_party_prefix + user_json)
+        signature = signer.sign(
+            b"%s\nsignature=%s\nuser=%s"
+            % (auth_field, ed25519_signature.encode(), user_json)
+        )
+        results.append(
+            f"user={quoted}&{auth_text}&signature={ed25519_signature}&hash={signature}"
+        )
+    return results
+
+
+def _chunks(users: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split users into lists of at most size users."""
+    iterator = iter(users)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def generate_init_data_batch(
+    users: Iterable[Any],
+    bot_token: str,
+    auth_date: Optional[int] = None,
+    processes: Optional[int] = None,
+    chunk_size: int = 5000,
+    ed25519_signer: Optional[Ed25519InitDataSigner] = None,
+) -> Iterator[str]:
+    """
+    Generate signed initData strings for many users.
+
+    All strings share one ``auth_date`` and one derived key; user objects
+    are encoded with msgspec. With ``processes`` chunks of users are signed
+    in a process pool (worth it from roughly 100k users).
+
+    Args:
+        users: Users (see to_init_data_user), consumed lazily
+        bot_token: Bot token for signatures
+        auth_date: Unix time of authentication (default: now)
+        processes: Worker processes (None signs in the current process)
+        chunk_size: Users per chunk (and per worker task)
+        ed25519_signer: Also add third-party ``signature`` field
+
+    Returns:
+        Iterator of initData strings in input order
+
+    Raises:
+        ValueError: If chunk_size or processes is not positive, a user
+            cannot be converted or ed25519_signer is given with a bot token
+            without bot ID
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    if processes is not None and processes < 1:
+        raise ValueError(f"processes must be at least 1, got {processes}")
+    get_signer(bot_token)
+    ed25519_seed = None
+    if ed25519_signer is not None:
+        bot_id_from_token(bot_token)
+        ed25519_seed = ed25519_signer.seed
+    auth_date = int(time()) if auth_date is None else auth_date
+    if processes is None:
+        return (
+            init_data
+            for chunk in _chunks(users, chunk_size)
+            for init_data in _sign_users(bot_token, auth_date, chunk, ed25519_seed)
+        )
+    return _sign_in_pool(
+        users, bot_token, auth_date, processes, chunk_size, ed25519_seed
+    )
+
+
+def _sign_in_pool(
+    users: Iterable[Any],
+    bot_token: str,
+    auth_date: int,
+    processes: int,
+    chunk_size: int,
+    ed25519_seed: Optional[bytes],
+) -> Iterator[str]:
+    """Sign chunks of users in a process pool, preserving order."""
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        # Keep a bounded number of chunks in flight so users are consumed lazily
+        pending: Deque[Future] = deque()
+        for chunk in _chunks(users, chunk_size):
+            pending.append(
+                executor.submit(_sign_users, bot_token, auth_date, chunk, ed25519_seed)
+            )
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
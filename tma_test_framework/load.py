@@ -0,0 +1,505 @@
+"""
+Multi-process load generation for TMA Framework.
+
+LoadRunner spawns worker processes, each running ApiClient-based virtual
+users on its own event loop. Workers periodically send compact latency
+histograms and counters to the coordinator, which merges them into one
+LoadReport:
+
+    runner = LoadRunner(url, config, scenario=Scenario.from_yaml("flow.yaml"),
+                        processes=8, users_per_process=50, duration=60)
+    report = runner.run()
+    assert_slos(report, "p95 < 300ms", "error_rate < 1%")
+"""
+
+# Python imports
+from asyncio import gather, run as run_async
+from math import ceil, floor, log
+from multiprocessing import get_context
+from multiprocessing.context import SpawnContext
+from os import cpu_count
+from queue import Empty
+from time import monotonic, time
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Union, Iterator, cast
+import msgspec
+
+# Local imports
+from .config import Config
+from .records import ResultRecord, ResultRecorder
+from .stats import REPORT_PERCENTILES, default_endpoint_key, default_error_predicate
+
+# Relative bucket width of latency histograms (1% precision)
+HISTOGRAM_GROWTH = 1.01
+_LOG_GROWTH = log(HISTOGRAM_GROWTH)
+
+VirtualUser = Callable[[Any, int], Awaitable[None]]
+
+
+class LatencyHistogram(msgspec.Struct, array_like=True):
+    """
+    Mergeable log-bucketed latency histogram.
+
+    Latencies are kept in microsecond buckets growing by HISTOGRAM_GROWTH,
+    so percentiles are accurate to about 1% with a few hundred buckets per
+    endpoint, independent of the number of samples.
+    """
+
+    buckets: Dict[int, int] = msgspec.field(default_factory=dict)
+    count: int = 0
+    total: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record latency in seconds."""
+        micros = latency * 1_000_000
+        index = floor(log(micros) / _LOG_GROWTH) if micros >= 1 else -1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if self.count == 0 or latency < self.min:
+            self.min = latency
+        if latency > self.max:
+            self.max = latency
+        self.count += 1
+        self.total += latency
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add counts of another histogram."""
+        if not other.count:
+            return
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Latency percentile in seconds (bucket midpoint, clamped to min/max).
+
+        Args:
+            q: Percentile in range 0-100
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"percentile must be between 0 and 100, got {q}")
+        if not self.count:
+            return 0.0
+        rank = max(ceil(self.count * q / 100), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                if index < 0:
+                    return self.min
+                value: float = HISTOGRAM_GROWTH ** (index + 0.5) / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class EndpointLoadStats(msgspec.Struct, array_like=True):
+    """Counters and latency histogram of one endpoint in a load run."""
+
+    key: str
+    count: int = 0
+    errors: int = 0
+    histogram: LatencyHistogram = msgspec.field(default_factory=LatencyHistogram)
+    first_at: Optional[float] = None
+    last_at: Optional[float] = None
+
+    def record(self, response_time: Optional[float], error: bool, at: float) -> None:
+        """Record one request outcome (``at`` is wall-clock finish time)."""
+        self.count += 1
+        if error:
+            self.errors += 1
+        started = at
+        if response_time is not None:
+            self.histogram.record(response_time)
+            started = at - response_time
+        if self.first_at is None or started < self.first_at:
+            self.first_at = started
+        if self.last_at is None or at > self.last_at:
+            self.last_at = at
+
+    def merge(self, other: "EndpointLoadStats") -> None:
+        """Merge statistics of the same endpoint from another worker."""
+        self.count += other.count
+        self.errors += other.errors
+        self.histogram.merge(other.histogram)
+        if other.first_at is not None and (
+            self.first_at is None or other.first_at < self.first_at
+        ):
+            self.first_at = other.first_at
+        if other.last_at is not None and (
+            self.last_at is None or other.last_at > self.last_at
+        ):
+            self.last_at = other.last_at
+
+    @property
+    def duration(self) -> float:
+        """Time between the first request start and the last request end."""
+        if self.first_at is None or self.last_at is None:
+            return 0.0
+        return max(self.last_at - self.first_at, 0.0)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of requests counted as errors (0.0-1.0)."""
+        return self.errors / self.count if self.count else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second over the observed duration."""
+        duration = self.duration
+        return self.count / duration if duration > 0 else 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.histogram.mean
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile in seconds."""
+        return self.histogram.percentile(q)
+
+    def report(self) -> str:
+        """Render one-line summary with latency percentiles."""
+        line = (
+            f"{self.key}: count={self.count} errors={self.errors} "
+            f"({self.error_rate:.2%}) throughput={self.throughput:.1f} rps"
+        )
+        if self.histogram.count:
+            percentiles = " ".join(
+                f"p{q:g}={self.percentile(q) * 1000:.1f}" for q in REPORT_PERCENTILES
+            )
+            line += (
+                f"\n  latency ms: min={self.histogram.min * 1000:.1f} "
+                f"mean={self.mean * 1000:.1f} {percentiles} "
+                f"max={self.histogram.max * 1000:.1f}"
+            )
+        return line
+
+
+class LoadSnapshot(msgspec.Struct, array_like=True):
+    """Statistics delta sent by a worker to the coordinator."""
+
+    worker: int
+    endpoints: Dict[str, EndpointLoadStats]
+    user_failures: int = 0
+    iterations: int = 0
+    final: bool = False
+    records: List[ResultRecord] = msgspec.field(default_factory=list)
+
+
+_snapshot_encoder = msgspec.msgpack.Encoder()
+_snapshot_decoder = msgspec.msgpack.Decoder(LoadSnapshot)
+
+
+class LoadReport:
+    """
+    Merged statistics of a load run.
+
+    Provides the same interface as RequestStats (``endpoints``, ``total()``,
+    indexing, ``report()``), so SLOs can be checked with assert_slos().
+    Per-request ResultRecords are collected in ``records`` when the run
+    was started with ``record_results=True``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty report."""
+        self.endpoints: Dict[str, EndpointLoadStats] = {}
+        self.records: List[ResultRecord] = []
+        self.user_failures = 0
+        self.iterations = 0
+        self.workers = 0
+        self.duration = 0.0
+
+    def merge(self, snapshot: LoadSnapshot) -> None:
+        """Merge worker snapshot."""
+        for key, endpoint in snapshot.endpoints.items():
+            if key in self.endpoints:
+                self.endpoints[key].merge(endpoint)
+            else:
+                self.endpoints[key] = endpoint
+        self.user_failures += snapshot.user_failures
+        self.iterations += snapshot.iterations
+        self.records.extend(snapshot.records)
+
+    def __getitem__(self, key: str) -> EndpointLoadStats:
+        """
+        Get statistics of one endpoint.
+
+        Raises:
+            KeyError: If no requests were recorded for endpoint
+        """
+        return self.endpoints[key]
+
+    def total(self) -> EndpointLoadStats:
+        """Statistics aggregated over all endpoints."""
+        total = EndpointLoadStats(key="ALL")
+        for endpoint in self.endpoints.values():
+            total.merge(endpoint)
+        return total
+
+    def report(self) -> str:
+        """Render report of the run and every endpoint."""
+        total = self.total()
+        lines = [
+            f"Load run: {self.workers} workers, {self.duration:.1f}s, "
+            f"{total.count} requests, {self.iterations} iterations, "
+            f"{self.user_failures} failed iterations"
+        ]
+        lines.extend(self.endpoints[key].report() for key in sorted(self.endpoints))
+        return "\n".join(lines)
+
+
+class _SnapshotRecorder:
+    """ApiClient result listener accumulating a worker's snapshot delta."""
+
+    def __init__(self, worker: int, record_results: bool = False) -> None:
+        self.worker = worker
+        self.endpoints: Dict[str, EndpointLoadStats] = {}
+        self.user_failures = 0
+        self.iterations = 0
+        self.results = ResultRecorder() if record_results else None
+
+    def record(self, result: Any) -> None:
+        if self.results is not None:
+            self.results.record(result)
+        key = default_endpoint_key(result)
+        endpoint = self.endpoints.get(key)
+        if endpoint is None:
+            endpoint = self.endpoints[key] = EndpointLoadStats(key=key)
+        endpoint.record(
+            result.response_time if result.status_code else None,
+            default_error_predicate(result),
+            time(),
+        )
+
+    def flush(self, final: bool = False) -> bytes:
+        """Encode accumulated delta and start a new one."""
+        snapshot = LoadSnapshot(
+            worker=self.worker,
+            endpoints=self.endpoints,
+            user_failures=self.user_failures,
+            iterations=self.iterations,
+            final=final,
+            records=self.results.drain() if self.results is not None else [],
+        )
+        self.endpoints = {}
+        self.user_failures = 0
+        self.iterations = 0
+        return _snapshot_encoder.encode(snapshot)
+
+
+async def _run_worker(
+    worker: int,
+    url: str,
+    config: Config,
+    target: Union[VirtualUser, Any],
+    users: int,
+    duration: Optional[float],
+    iterations: int,
+    queue: Any,
+    report_interval: float,
+    record_results: bool = False,
+) -> None:
+    """Run virtual users of one worker process and stream snapshots."""
+    from .clients.api_client import ApiClient
+    from .scenario import Scenario, ScenarioRunner, _CompiledStep
+
+    recorder = _SnapshotRecorder(worker, record_results)
+    async with ApiClient(url, config) as api:
+        api.set_log_sampling(max(1000, config.performance.log_sample_rate))
+        api.add_result_listener(recorder.record)
+        if isinstance(target, Scenario):
+            runner = ScenarioRunner(api)
+            steps = [_CompiledStep(i, step) for i, step in enumerate(target.steps)]
+
+            async def iteration(user: int) -> bool:
+                result = await runner._run_instance(target, steps, user)
+                return result.passed
+
+        else:
+
+            async def iteration(user: int) -> bool:
+                await target(api, user)
+                return True
+
+        deadline_at = monotonic() + duration if duration is not None else None
+        next_report = monotonic() + report_interval
+
+        async def virtual_user(user: int) -> None:
+            nonlocal next_report
+            done = 0
+            while (deadline_at is None and done < iterations) or (
+                deadline_at is not None and monotonic() < deadline_at
+            ):
+                try:
+                    passed = await iteration(user)
+                except Exception:
+                    passed = False
+                done += 1
+                recorder.iterations += 1
+                if not passed:
+                    recorder.user_failures += 1
+                if monotonic() >= next_report:
+                    next_report = monotonic() + report_interval
+                    queue.put(recorder.flush())
+
+        await gather(*(virtual_user(worker * users + user) for user in range(users)))
+    queue.put(recorder.flush(final=True))
+
+
+def _worker_main(*args: Any) -> None:
+    """Worker process entry point."""
+    run_async(_run_worker(*args))
+
+
+class LoadRunner:
+    """
+    Load generator distributing virtual users over worker processes.
+
+    A virtual user is either a Scenario (executed step by step per
+    iteration) or an async function ``user(api, user_index)`` defined at
+    module level, so it can be imported by worker processes.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        config: Config,
+        scenario: Optional[Any] = None,
+        user: Optional[VirtualUser] = None,
+        processes: Optional[int] = None,
+        users_per_process: int = 10,
+        duration: Optional[float] = None,
+        iterations: int = 1,
+        report_interval: float = 1.0,
+        mp_context: str = "spawn",
+        record_results: bool = False,
+    ) -> None:
+        """
+        Initialize load runner.
+
+        Args:
+            url: Mini App API base URL
+            config: Configuration used by every worker's ApiClient
+            scenario: Scenario executed by virtual users
+            user: Async virtual user function (alternative to scenario)
+            processes: Worker processes (default: CPU count)
+            users_per_process: Concurrent virtual users per process
+            duration: Run for this many seconds (overrides iterations)
+            iterations: Iterations per virtual user without duration
+            report_interval: Seconds between worker snapshots
+            mp_context: Multiprocessing start method
+            record_results: Collect a compact ResultRecord per request in
+                LoadReport.records (without headers and bodies)
+
+        Raises:
+            ValueError: If not exactly one of scenario and user is given,
+                or counts or intervals are not positive
+        """
+        if (scenario is None) == (user is None):
+            raise ValueError("Exactly one of scenario or user must be provided")
+        if processes is None:
+            processes = cpu_count() or 1
+        if processes < 1 or users_per_process < 1 or iterations < 1:
+            raise ValueError(
+                "processes, users_per_process and iterations must be at least 1"
+            )
+        if duration is not None and duration <= 0:
+            raise ValueError(f"duration must be positive, got {duration}")
+        if report_interval <= 0:
+            raise ValueError(f"report_interval must be positive, got {report_interval}")
+        self.url = url
+        self.config = config
+        self.target = scenario if scenario is not None else user
+        self.processes = processes
+        self.users_per_process = users_per_process
+        self.duration = duration
+        self.iterations = iterations
+        self.report_interval = report_interval
+        self.mp_context = mp_context
+        self.record_results = record_results
+
+    def run(
+        self, on_snapshot: Optional[Callable[[LoadReport], None]] = None
+    ) -> LoadReport:
+        """
+        Run load and merge worker statistics.
+
+        Args:
+            on_snapshot: Called with the partial report after each worker snapshot
+
+        Returns:
+            Merged LoadReport
+
+        Raises:
+            RuntimeError: If a worker process exits without final snapshot
+        """
+        # Every start method has the Process/Queue API of SpawnContext
+        context = cast(SpawnContext, get_context(self.mp_context))
+        queue = context.Queue()
+        workers = [
+            context.Process(
+                target=_worker_main,
+                args=(
+                    index,
+                    self.url,
+                    self.config,
+                    self.target,
+                    self.users_per_process,
+                    self.duration,
+                    self.iterations,
+                    queue,
+                    self.report_interval,
+                    self.record_results,
+                ),
+                daemon=True,
+            )
+            for index in range(self.processes)
+        ]
+        report = LoadReport()
+        report.workers = self.processes
+        started = monotonic()
+        for process in workers:
+            process.start()
+        try:
+            for snapshot in self._snapshots(queue, workers):
+                report.merge(snapshot)
+                if on_snapshot is not None:
+                    on_snapshot(report)
+        finally:
+            for process in workers:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        report.duration = monotonic() - started
+        return report
+
+    def _snapshots(self, queue: Any, workers: List[Any]) -> Iterator[LoadSnapshot]:
+        """Yield decoded snapshots until every worker sent its final one."""
+        pending = set(range(len(workers)))
+        while pending:
+            try:
+                snapshot = _snapshot_decoder.decode(queue.get(timeout=1.0))
+            except Empty:
+                # Exited workers flush their queue first, so a missing final
+                # snapshot means the worker crashed
+                crashed = [
+                    index for index in pending if workers[index].exitcode is not None
+                ]
+                if crashed:
+                    raise RuntimeError(
+                        f"Load worker(s) {sorted(crashed)} exited with code "
+                        f"{workers[crashed[0]].exitcode} without final snapshot"
+                    )
+                continue
+            if snapshot.final:
+                pending.discard(snapshot.worker)
+            yield snapshot
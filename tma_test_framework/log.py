@@ -0,0 +1,49 @@
+"""
+Logging setup for TMA Framework.
+"""
+
+# Python imports
+import sys
+from typing import Any, Optional
+from loguru import logger
+
+# Local imports
+from .config import Config
+
+DEFAULT_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name} | {message}"
+
+
+def configure_logging(
+    config: Config,
+    sink: Any = sys.stderr,
+    enqueue: bool = True,
+    log_format: Optional[str] = None,
+    replace_existing: bool = True,
+) -> int:
+    """
+    Configure loguru sink using Config.log_level.
+
+    With ``enqueue=True`` records are handed to a background thread, so
+    clients do not block on sink I/O. Records below ``config.log_level``
+    are dropped before message formatting takes place.
+
+    Args:
+        config: Configuration object with log_level
+        sink: Loguru sink (stream, file path, callable)
+        enqueue: Whether to write records from a background thread
+        log_format: Loguru format string (default: DEFAULT_LOG_FORMAT)
+        replace_existing: Whether to remove previously added handlers
+
+    Returns:
+        Handler id, usable with ``logger.remove(handler_id)``
+    """
+    if replace_existing:
+        logger.remove()
+    return logger.add(
+        sink,
+        level=config.log_level,
+        format=log_format or DEFAULT_LOG_FORMAT,
+        enqueue=enqueue,
+        backtrace=False,
+        diagnose=False,
+    )
@@ -0,0 +1,695 @@
+"""
+Compact per-request result records for long runs.
+
+ApiResult keeps headers, body and several derived flags, which makes
+retaining millions of them impractical. ResultRecord keeps only what
+post-run analysis needs in an array-like, GC-untracked Struct; bodies and
+headers are kept only for sampled or failed requests:
+
+    recorder = ResultRecorder(payload_on_error=True)
+    api.add_result_listener(recorder.record)
+
+For analysis of large runs, ResultSet keeps the same data in typed
+columns and aggregates it without creating per-request objects. The
+aggregations are plain Python loops over the columns, not numpy-style
+vectorized operations:
+
+    results = ResultSet.from_records(report.records)
+    assert_slos(results, "p95 < 300ms")
+    results.to_csv("run.csv")
+"""
+
+# Python imports
+import csv
+from array import array
+from io import StringIO
+from itertools import islice
+from pathlib import Path
+from time import time
+from typing import (
+    Optional,
+    Dict,
+    List,
+    Iterable,
+    Iterator,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+    Any,
+    TYPE_CHECKING,
+)
+import msgspec
+
+# Local imports
+from .clients.models import ErrorCategory
+from .stats import REPORT_PERCENTILES, EndpointStats, percentile
+
+if TYPE_CHECKING:
+    from .clients.models import ApiResult
+
+# Codes of the ResultSet error category column (0: no transport failure)
+_CATEGORIES: Tuple[Optional[ErrorCategory], ...] = (None, *ErrorCategory)
+_CATEGORY_CODES: Dict[Optional[ErrorCategory], int] = {
+    category: code for code, category in enumerate(_CATEGORIES)
+}
+
+
+class ResultRecord(msgspec.Struct, array_like=True, gc=False, frozen=True):
+    """
+    Compact record of one API request.
+
+    Encoded as a plain array (``array_like``) and not tracked by the cyclic
+    garbage collector (``gc=False``), so millions of records stay cheap to
+    keep, serialize and collect.
+    """
+
+    started_at: float
+    endpoint: str
+    method: str
+    status_code: int
+    response_time: float
+    size: int = 0
+    error: Optional[str] = None
+    headers: Optional[Dict[str, str]] = None
+    body: Optional[bytes] = None
+    error_category: Optional[ErrorCategory] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the response status is 2xx."""
+        return 200 <= self.status_code < 300
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request failed (transport error, 4xx or 5xx)."""
+        return self.status_code == 0 or self.status_code >= 400
+
+    @classmethod
+    def from_result(
+        cls,
+        result: "ApiResult",
+        started_at: Optional[float] = None,
+        keep_payload: bool = False,
+    ) -> "ResultRecord":
+        """
+        Create record from ApiResult.
+
+        Args:
+            result: Result returned by ApiClient.make_request
+            started_at: Wall-clock start time (default: now minus response time)
+            keep_payload: Whether to keep response headers and body
+
+        Returns:
+            ResultRecord
+        """
+        if started_at is None:
+            started_at = time() - result.response_time
+        return cls(
+            started_at=started_at,
+            endpoint=result.endpoint,
+            method=result.method,
+            status_code=result.status_code,
+            response_time=result.response_time,
+            size=len(result.body),
+            error=result.error_message,
+            headers=result.headers if keep_payload else None,
+            body=result.body if keep_payload else None,
+            error_category=result.error_category,
+        )
+
+
+class ResultRecorder:
+    """
+    ApiClient result listener keeping compact ResultRecords.
+
+    Endpoint and method strings are interned, so records of the same
+    endpoint share one string object.
+    """
+
+    def __init__(self, payload_every: int = 0, payload_on_error: bool = False) -> None:
+        """
+        Initialize recorder.
+
+        Args:
+            payload_every: Keep headers and body of every N-th result (0: never)
+            payload_on_error: Keep headers and body of failed results
+
+        Raises:
+            ValueError: If payload_every is negative
+        """
+        if payload_every < 0:
+            raise ValueError(f"payload_every must be >= 0, got {payload_every}")
+        self.payload_every = payload_every
+        self.payload_on_error = payload_on_error
+        self.records: List[ResultRecord] = []
+        self._seen = 0
+        self._strings: Dict[str, str] = {}
+
+    def record(self, result: "ApiResult") -> None:
+        """
+        Record ApiResult.
+
+        Args:
+            result: Result returned by ApiClient.make_request
+        """
+        self._seen += 1
+        keep_payload = (
+            self.payload_every > 0 and self._seen % self.payload_every == 0
+        ) or (
+            self.payload_on_error
+            and (result.status_code == 0 or result.status_code >= 400)
+        )
+        strings = self._strings
+        endpoint = strings.setdefault(result.endpoint, result.endpoint)
+        method = strings.setdefault(result.method, result.method)
+        self.records.append(
+            ResultRecord(
+                time() - result.response_time,
+                endpoint,
+                method,
+                result.status_code,
+                result.response_time,
+                len(result.body),
+                result.error_message,
+                result.headers if keep_payload else None,
+                result.body if keep_payload else None,
+                result.error_category,
+            )
+        )
+
+    def drain(self) -> List[ResultRecord]:
+        """Return collected records and start a new list."""
+        records, self.records = self.records, []
+        return records
+
+    def clear(self) -> None:
+        """Drop all collected records."""
+        self.records = []
+        self._seen = 0
+
+    def __len__(self) -> int:
+        """Number of collected records."""
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        """Iterate over collected records."""
+        return iter(self.records)
+
+
+def error_breakdown(
+    results: Union["ResultSet", Iterable[Union[ResultRecord, "ApiResult"]]],
+) -> Dict[ErrorCategory, int]:
+    """
+    Count transport failures by category.
+
+    Args:
+        results: ResultSet, ResultRecords or ApiResults
+
+    Returns:
+        Failure count per ErrorCategory, most frequent first
+    """
+    if isinstance(results, ResultSet):
+        return results.error_breakdown()
+    counts: Dict[ErrorCategory, int] = {}
+    for result in results:
+        category = result.error_category
+        if category is not None:
+            counts[category] = counts.get(category, 0) + 1
+    return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+
+def _sorted_breakdown(counts: List[int]) -> Dict[ErrorCategory, int]:
+    """Map per-code failure counts to categories, most frequent first."""
+    breakdown = {
+        category: count
+        for category, count in zip(_CATEGORIES, counts)
+        if category is not None and count
+    }
+    return dict(sorted(breakdown.items(), key=lambda item: -item[1]))
+
+
+def _csv_field(value: str) -> str:
+    """Format one CSV field, quoted if it contains separators or newlines."""
+    # The writer quotes fields containing lineterminator characters, so
+    # keep the default terminator and strip it afterwards
+    buffer = StringIO()
+    csv.writer(buffer, lineterminator="\r\n").writerow([value])
+    return buffer.getvalue()[:-2]
+
+
+class TimeBucket(msgspec.Struct, frozen=True):
+    """Requests started within one time bucket of a ResultSet."""
+
+    start: float
+    count: int
+    errors: int
+    mean: float
+    max: float
+
+    @property
+    def error_rate(self) -> float:
+        """Share of requests counted as errors (0.0-1.0)."""
+        return self.errors / self.count if self.count else 0.0
+
+
+def _is_error(status_code: int) -> bool:
+    """Match default_error_predicate on a bare status code."""
+    return status_code == 0 or 400 <= status_code < 600
+
+
+class ResultSet:
+    """
+    Columnar store of request results.
+
+    Every request adds one row to typed arrays (start time, latency, status
+    code, body size, error category code) and an endpoint code referring to
+    ``endpoint_keys`` (dictionary encoding), i.e. about 31 bytes per request. Aggregations
+    are interpreted loops over the columns, one pass each (roughly a second
+    per million rows), and the set provides the RequestStats interface
+    (``endpoints``, ``total()``, indexing, ``report()``), so it works with
+    assert_slos().
+
+    Usable as ApiClient result listener (``api.add_result_listener(results.record)``).
+    """
+
+    COLUMNS = (
+        "started_at",
+        "endpoint",
+        "status_code",
+        "response_time",
+        "size",
+        "error_category",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty result set."""
+        self.started_at = array("d")
+        self.response_time = array("d")
+        self.status_code = array("H")
+        self.size = array("Q")
+        self.endpoint_codes = array("I")
+        self.error_codes = array("B")
+        self.endpoint_keys: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._groups: Optional[Dict[str, EndpointStats]] = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[ResultRecord]) -> "ResultSet":
+        """
+        Create result set from ResultRecords.
+
+        Args:
+            records: Records, e.g. ``ResultRecorder.records`` or ``LoadReport.records``
+
+        Returns:
+            ResultSet
+        """
+        results = cls()
+        results.extend(records)
+        return results
+
+    def _code(self, method: str, endpoint: str) -> int:
+        """Get dictionary code of endpoint key."""
+        key = f"{method.upper()} {endpoint}"
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.endpoint_keys)
+            self.endpoint_keys.append(key)
+        return code
+
+    def append(
+        self,
+        started_at: float,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        response_time: float,
+        size: int = 0,
+        error_category: Optional[ErrorCategory] = None,
+    ) -> None:
+        """
+        Append one request.
+
+        Args:
+            started_at: Wall-clock start time
+            method: HTTP method
+            endpoint: API endpoint
+            status_code: Response status (0 for transport failures)
+            response_time: Response time in seconds
+            size: Response body size in bytes
+            error_category: Category of a transport failure
+        """
+        self.started_at.append(started_at)
+        self.endpoint_codes.append(self._code(method, endpoint))
+        self.status_code.append(status_code)
+        self.response_time.append(response_time)
+        self.size.append(size)
+        self.error_codes.append(_CATEGORY_CODES[error_category])
+        self._groups = None
+
+    def record(self, result: "ApiResult") -> None:
+        """
+        Record ApiResult.
+
+        Args:
+            result: Result returned by ApiClient.make_request
+        """
+        self.append(
+            time() - result.response_time,
+            result.method,
+            result.endpoint,
+            result.status_code,
+            result.response_time,
+            len(result.body),
+            result.error_category,
+        )
+
+    def extend(self, records: Iterable[ResultRecord]) -> None:
+        """
+        Append ResultRecords.
+
+        Args:
+            records: Records to append
+        """
+        code = self._code
+        codes = self.endpoint_codes
+        started_at = self.started_at
+        status_code = self.status_code
+        response_time = self.response_time
+        size = self.size
+        error_codes = self.error_codes
+        category_codes = _CATEGORY_CODES
+        for record in records:
+            started_at.append(record.started_at)
+            codes.append(code(record.method, record.endpoint))
+            status_code.append(record.status_code)
+            response_time.append(record.response_time)
+            size.append(record.size)
+            error_codes.append(category_codes[record.error_category])
+        self._groups = None
+
+    def __len__(self) -> int:
+        """Number of requests."""
+        return len(self.started_at)
+
+    def group_by_endpoint(self) -> Dict[str, EndpointStats]:
+        """
+        Aggregate rows per endpoint key in one pass.
+
+        Returns:
+            Mapping of endpoint key ("METHOD endpoint") to EndpointStats
+            with sorted latencies
+        """
+        if self._groups is not None:
+            return self._groups
+        keys = self.endpoint_keys
+        groups = [EndpointStats(key=key) for key in keys]
+        latencies: List[List[float]] = [group.latencies for group in groups]
+        counts = [0] * len(keys)
+        errors = [0] * len(keys)
+        first: List[Optional[float]] = [None] * len(keys)
+        last: List[Optional[float]] = [None] * len(keys)
+        for code, started, status, elapsed in zip(
+            self.endpoint_codes, self.started_at, self.status_code, self.response_time
+        ):
+            counts[code] += 1
+            if status:
+                latencies[code].append(elapsed)
+                if 400 <= status < 600:
+                    errors[code] += 1
+            else:
+                errors[code] += 1
+            first_at = first[code]
+            if first_at is None or started < first_at:
+                first[code] = started
+            finished = started + elapsed
+            last_at = last[code]
+            if last_at is None or finished > last_at:
+                last[code] = finished
+        for code, group in enumerate(groups):
+            group.count = counts[code]
+            group.errors = errors[code]
+            group.first_at = first[code]
+            group.last_at = last[code]
+            group.latencies.sort()
+        self._groups = {group.key: group for group in groups if group.count}
+        return self._groups
+
+    @property
+    def endpoints(self) -> Dict[str, EndpointStats]:
+        """Per-endpoint statistics (see group_by_endpoint())."""
+        return self.group_by_endpoint()
+
+    def __getitem__(self, key: str) -> EndpointStats:
+        """
+        Get statistics of one endpoint.
+
+        Raises:
+            KeyError: If no requests were recorded for endpoint
+        """
+        return self.group_by_endpoint()[key]
+
+    def total(self) -> EndpointStats:
+        """Statistics aggregated over all endpoints."""
+        total = EndpointStats(key="ALL")
+        for endpoint in self.group_by_endpoint().values():
+            total.merge(endpoint)
+        return total
+
+    def report(self) -> str:
+        """Render distribution report of all endpoints."""
+        groups = self.group_by_endpoint()
+        return "\n".join(groups[key].report() for key in sorted(groups))
+
+    def error_breakdown(
+        self, endpoint: Optional[str] = None
+    ) -> Dict[ErrorCategory, int]:
+        """
+        Count transport failures by category.
+
+        Args:
+            endpoint: Endpoint key ("METHOD endpoint"), or None for all requests
+
+        Returns:
+            Failure count per ErrorCategory, most frequent first
+
+        Raises:
+            KeyError: If no requests were recorded for endpoint
+        """
+        if endpoint is None:
+            # array.count() scans the column in C, once per category
+            counts = [self.error_codes.count(code) for code in range(len(_CATEGORIES))]
+        else:
+            only_code = self._codes[endpoint]
+            counts = [0] * len(_CATEGORIES)
+            for code, error_code in zip(self.endpoint_codes, self.error_codes):
+                if code == only_code:
+                    counts[error_code] += 1
+        return _sorted_breakdown(counts)
+
+    def error_breakdown_by_endpoint(self) -> Dict[str, Dict[ErrorCategory, int]]:
+        """
+        Count transport failures by endpoint and category in one pass.
+
+        Returns:
+            Mapping of endpoint key to its error_breakdown(); endpoints
+            without transport failures are left out
+        """
+        counts = [[0] * len(_CATEGORIES) for _ in self.endpoint_keys]
+        for code, error_code in zip(self.endpoint_codes, self.error_codes):
+            if error_code:
+                counts[code][error_code] += 1
+        return {
+            key: _sorted_breakdown(endpoint_counts)
+            for key, endpoint_counts in zip(self.endpoint_keys, counts)
+            if any(endpoint_counts)
+        }
+
+    def percentiles(
+        self, qs: Sequence[float] = REPORT_PERCENTILES, endpoint: Optional[str] = None
+    ) -> Dict[float, float]:
+        """
+        Latency percentiles of requests that got a response.
+
+        Args:
+            qs: Percentiles in range 0-100
+            endpoint: Endpoint key ("METHOD endpoint"), or None for all requests
+
+        Returns:
+            Mapping of percentile to latency in seconds
+
+        Raises:
+            KeyError: If no requests were recorded for endpoint
+        """
+        if endpoint is not None:
+            values = self[endpoint].latencies
+        else:
+            values = sorted(
+                elapsed
+                for elapsed, status in zip(self.response_time, self.status_code)
+                if status
+            )
+        return {q: percentile(values, q) for q in qs}
+
+    def time_buckets(
+        self, width: float = 1.0, endpoint: Optional[str] = None
+    ) -> List[TimeBucket]:
+        """
+        Aggregate requests by start time.
+
+        Args:
+            width: Bucket width in seconds
+            endpoint: Endpoint key ("METHOD endpoint"), or None for all requests
+
+        Returns:
+            Buckets from the first to the last request (empty ones included)
+
+        Raises:
+            ValueError: If width is not positive
+            KeyError: If no requests were recorded for endpoint
+        """
+        if width <= 0:
+            raise ValueError(f"width must be positive, got {width}")
+        if not self.started_at:
+            return []
+        only_code = self._codes[endpoint] if endpoint is not None else None
+        origin = min(self.started_at)
+        slots = int((max(self.started_at) - origin) // width) + 1
+        counts = [0] * slots
+        errors = [0] * slots
+        sums = [0.0] * slots
+        answered = [0] * slots
+        maxima = [0.0] * slots
+        for code, started, status, elapsed in zip(
+            self.endpoint_codes, self.started_at, self.status_code, self.response_time
+        ):
+            if only_code is not None and code != only_code:
+                continue
+            slot = int((started - origin) // width)
+            counts[slot] += 1
+            if _is_error(status):
+                errors[slot] += 1
+            if status:
+                answered[slot] += 1
+                sums[slot] += elapsed
+                if elapsed > maxima[slot]:
+                    maxima[slot] = elapsed
+        return [
+            TimeBucket(
+                start=origin + slot * width,
+                count=counts[slot],
+                errors=errors[slot],
+                mean=sums[slot] / answered[slot] if answered[slot] else 0.0,
+                max=maxima[slot],
+            )
+            for slot in range(slots)
+        ]
+
+    def rows(self) -> Iterator[tuple]:
+        """Iterate over rows in COLUMNS order."""
+        return zip(
+            self.started_at,
+            map(self.endpoint_keys.__getitem__, self.endpoint_codes),
+            self.status_code,
+            self.response_time,
+            self.size,
+            map(_CATEGORIES.__getitem__, self.error_codes),
+        )
+
+    def to_csv(
+        self, destination: Union[str, Path, TextIO], chunk_size: int = 65536
+    ) -> None:
+        """
+        Stream rows to CSV with a header line.
+
+        Each endpoint key is quoted once per dictionary entry, so rows are
+        formatted without per-field quoting checks.
+
+        Args:
+            destination: File path or text stream
+            chunk_size: Rows written per batch
+        """
+        if isinstance(destination, (str, Path)):
+            with open(destination, "w", newline="", encoding="utf-8") as file:
+                self.to_csv(file, chunk_size)
+            return
+        keys = [_csv_field(key) for key in self.endpoint_keys]
+        categories = [category.value if category else "" for category in _CATEGORIES]
+        destination.write(",".join(self.COLUMNS) + "\r\n")
+        lines = map(
+            "{},{},{},{},{},{}\r\n".format,
+            self.started_at,
+            map(keys.__getitem__, self.endpoint_codes),
+            self.status_code,
+            self.response_time,
+            self.size,
+            map(categories.__getitem__, self.error_codes),
+        )
+        while chunk := "".join(islice(lines, chunk_size)):
+            destination.write(chunk)
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to a pyarrow Table.
+
+        Numeric columns are copied with one memcpy each, so the result set
+        stays appendable while the table is alive (exporting a live
+        ``array`` buffer would make record() raise BufferError). The
+        endpoint and error_category columns are dictionary arrays.
+
+        Returns:
+            pyarrow.Table
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                "Arrow export requires 'pyarrow' library. "
+                "Install it with: uv add pyarrow"
+            ) from e
+
+        def column(values: array, data_type: Any) -> Any:
+            return pyarrow.Array.from_buffers(
+                data_type, len(values), [None, pyarrow.py_buffer(values.tobytes())]
+            )
+
+        endpoint = pyarrow.DictionaryArray.from_arrays(
+            column(self.endpoint_codes, pyarrow.uint32()),
+            pyarrow.array(self.endpoint_keys, pyarrow.string()),
+        )
+        return pyarrow.table(
+            {
+                "started_at": column(self.started_at, pyarrow.float64()),
+                "endpoint": endpoint,
+                "status_code": column(self.status_code, pyarrow.uint16()),
+                "response_time": column(self.response_time, pyarrow.float64()),
+                "size": column(self.size, pyarrow.uint64()),
+                "error_category": pyarrow.DictionaryArray.from_arrays(
+                    column(self.error_codes, pyarrow.uint8()),
+                    pyarrow.array(
+                        [category and category.value for category in _CATEGORIES],
+                        pyarrow.string(),
+                    ),
+                ),
+            }
+        )
+
+    def to_parquet(self, path: Union[str, Path], **kwargs: Any) -> None:
+        """
+        Write to a Parquet file.
+
+        Args:
+            path: Output file path
+            **kwargs: Options passed to pyarrow.parquet.write_table()
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, str(path), **kwargs)
@@ -0,0 +1,411 @@
+"""
+Declarative YAML scenarios for TMA Framework.
+
+A scenario describes a sequence of HTTP requests, values extracted from
+responses, assertions and how many instances should run concurrently.
+Scenarios are executed by ScenarioRunner on a shared ApiClient.
+"""
+
+# Python imports
+from asyncio import Semaphore, gather
+from re import compile as re_compile
+from time import perf_counter
+from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
+import msgspec
+
+# Local imports
+from .config import load_yaml
+
+if TYPE_CHECKING:
+    from .clients.api_client import ApiClient
+    from .clients.models import ApiResult
+
+_PLACEHOLDER = re_compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+class ScenarioRequest(msgspec.Struct, frozen=True):
+    """HTTP request performed by a scenario step."""
+
+    endpoint: str
+    method: str = "GET"
+    data: Optional[Dict[str, Any]] = None
+    params: Optional[Dict[str, Any]] = None
+    headers: Optional[Dict[str, str]] = None
+
+
+class ScenarioAssertion(msgspec.Struct, frozen=True):
+    """Assertions applied to the response of a scenario step."""
+
+    status: Optional[int] = None
+    fields: List[str] = msgspec.field(default_factory=list)
+    max_response_time: Optional[float] = None
+
+
+class ScenarioStep(msgspec.Struct, frozen=True):
+    """
+    Single scenario step.
+
+    Values listed in ``extract`` are read from the JSON response using
+    dotted paths (e.g. ``results.0.id``) and become available to later
+    steps as ``${name}`` placeholders.
+    """
+
+    request: ScenarioRequest
+    name: Optional[str] = None
+    extract: Dict[str, str] = msgspec.field(default_factory=dict)
+    assertion: ScenarioAssertion = msgspec.field(
+        default_factory=ScenarioAssertion, name="assert"
+    )
+
+
+class Scenario(msgspec.Struct, frozen=True):
+    """Declarative request sequence executed by ScenarioRunner."""
+
+    name: str
+    steps: List[ScenarioStep]
+    variables: Dict[str, Any] = msgspec.field(default_factory=dict)
+    instances: int = 1
+    concurrency: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate scenario after initialization."""
+        if not self.steps:
+            raise ValueError(f"Scenario '{self.name}' must contain at least one step")
+        if self.instances < 1:
+            raise ValueError(f"instances must be at least 1, got {self.instances}")
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {self.concurrency}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Scenario":
+        """
+        Create scenario from a plain dictionary.
+
+        Args:
+            data: Scenario definition (same layout as the YAML file)
+
+        Returns:
+            Scenario instance
+
+        Raises:
+            ValueError: If the definition is invalid
+        """
+        try:
+            return msgspec.convert(data, type=cls)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid scenario definition: {e}") from e
+
+    @classmethod
+    def from_yaml(cls, yaml_path: str) -> "Scenario":
+        """
+        Create scenario from YAML file.
+
+        Args:
+            yaml_path: Path to YAML scenario file
+
+        Returns:
+            Scenario instance loaded from YAML
+        """
+        try:
+            return cls.from_dict(load_yaml(yaml_path))
+        except FileNotFoundError:
+            raise ValueError(f"Scenario file not found: {yaml_path}")
+        except Exception as e:
+            raise ValueError(f"Failed to load scenario from {yaml_path}: {e}") from e
+
+
+class StepResult(msgspec.Struct, frozen=True):
+    """Outcome of a single executed scenario step."""
+
+    name: str
+    method: str
+    endpoint: str
+    status_code: int
+    response_time: float
+    passed: bool
+    error_message: Optional[str] = None
+
+
+class InstanceResult(msgspec.Struct, frozen=True):
+    """Outcome of a single scenario instance."""
+
+    instance: int
+    passed: bool
+    duration: float
+    steps: List[StepResult] = msgspec.field(default_factory=list)
+    error_message: Optional[str] = None
+
+
+class ScenarioRunResult(msgspec.Struct, frozen=True):
+    """Aggregated outcome of all instances of a scenario run."""
+
+    scenario: str
+    duration: float
+    instances: List[InstanceResult]
+
+    @property
+    def passed(self) -> int:
+        """Number of instances that passed."""
+        return sum(1 for instance in self.instances if instance.passed)
+
+    @property
+    def failed(self) -> int:
+        """Number of instances that failed."""
+        return len(self.instances) - self.passed
+
+    def assert_all_passed(self) -> None:
+        """
+        Assert that every scenario instance passed.
+
+        Raises:
+            AssertionError: If any instance failed
+        """
+        failures = [instance for instance in self.instances if not instance.passed]
+        if failures:
+            details = "; ".join(
+                f"#{instance.instance}: {instance.error_message}"
+                for instance in failures[:5]
+            )
+            raise AssertionError(
+                f"Scenario '{self.scenario}': {len(failures)} of "
+                f"{len(self.instances)} instances failed. {details}"
+            )
+
+
+def _compile_template(value: Any) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile a template value into a render function.
+
+    Values without placeholders are returned as-is without per-call work.
+    A string consisting of a single placeholder keeps the variable's type.
+
+    Args:
+        value: String, list, dict or scalar from the scenario definition
+
+    Returns:
+        Function rendering the value against a variables mapping
+    """
+    if isinstance(value, str):
+        whole = _PLACEHOLDER.fullmatch(value)
+        if whole:
+            name = whole.group(1)
+            return lambda variables: _lookup_variable(variables, name)
+        if _PLACEHOLDER.search(value):
+            return lambda variables: _PLACEHOLDER.sub(
+                lambda match: str(_lookup_variable(variables, match.group(1))),
+                value,
+            )
+    elif isinstance(value, dict):
+        compiled_items = {key: _compile_template(item) for key, item in value.items()}
+        return lambda variables: {
+            key: render(variables) for key, render in compiled_items.items()
+        }
+    elif isinstance(value, list):
+        compiled_list = [_compile_template(item) for item in value]
+        return lambda variables: [render(variables) for render in compiled_list]
+    return lambda variables: value
+
+
+def _lookup_variable(variables: Dict[str, Any], name: str) -> Any:
+    """
+    Get scenario variable by name.
+
+    Raises:
+        KeyError: If variable is not defined
+    """
+    if name not in variables:
+        raise KeyError(f"Undefined scenario variable: {name}")
+    return variables[name]
+
+
+def extract_path(data: Any, path: str) -> Any:
+    """
+    Extract value from decoded JSON using a dotted path.
+
+    Args:
+        data: Decoded JSON data
+        path: Dotted path, list indexes are numbers (e.g. ``results.0.id``)
+
+    Returns:
+        Extracted value
+
+    Raises:
+        KeyError: If path does not exist in data
+    """
+    current = data
+    for part in path.split("."):
+        try:
+            if isinstance(current, list):
+                current = current[int(part)]
+            else:
+                current = current[part]
+        except (KeyError, IndexError, ValueError, TypeError) as e:
+            raise KeyError(f"Path '{path}' not found in response") from e
+    return current
+
+
+class _CompiledStep:
+    """Scenario step with templates compiled once per run."""
+
+    def __init__(self, index: int, step: ScenarioStep) -> None:
+        self.step = step
+        self.name = step.name or f"step_{index + 1}"
+        self.method = step.request.method.upper()
+        self.endpoint = _compile_template(step.request.endpoint)
+        self.data = _compile_template(step.request.data)
+        self.params = _compile_template(step.request.params)
+        self.headers = _compile_template(step.request.headers)
+
+
+class ScenarioRunner:
+    """
+    Executes scenario instances concurrently on a shared ApiClient.
+
+    Authentication set on the client (set_auth_token, setup_tma_auth) applies
+    to every request of every instance.
+    """
+
+    def __init__(self, client: "ApiClient") -> None:
+        """
+        Initialize scenario runner.
+
+        Args:
+            client: ApiClient used for all scenario requests
+        """
+        self.client = client
+        self.logger = client.logger
+
+    async def run(
+        self,
+        scenario: Scenario,
+        instances: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> ScenarioRunResult:
+        """
+        Run scenario instances.
+
+        Args:
+            scenario: Scenario to execute
+            instances: Override for scenario.instances
+            concurrency: Override for scenario.concurrency
+
+        Returns:
+            ScenarioRunResult with per-instance outcomes
+        """
+        total = instances if instances is not None else scenario.instances
+        limit = concurrency if concurrency is not None else scenario.concurrency
+        if total < 1 or limit < 1:
+            raise ValueError("instances and concurrency must be at least 1")
+
+        compiled_steps = [
+            _CompiledStep(index, step) for index, step in enumerate(scenario.steps)
+        ]
+        semaphore = Semaphore(min(limit, total))
+
+        async def run_bounded(instance: int) -> InstanceResult:
+            async with semaphore:
+                return await self._run_instance(scenario, compiled_steps, instance)
+
+        self.logger.info(
+            f"Running scenario '{scenario.name}': {total} instances, concurrency {limit}"
+        )
+        started = perf_counter()
+        results = await gather(*(run_bounded(index) for index in range(total)))
+        run_result = ScenarioRunResult(
+            scenario=scenario.name,
+            duration=perf_counter() - started,
+            instances=list(results),
+        )
+        self.logger.info(
+            f"Scenario '{scenario.name}' finished: {run_result.passed} passed, "
+            f"{run_result.failed} failed in {run_result.duration:.3f}s"
+        )
+        return run_result
+
+    async def _run_instance(
+        self, scenario: Scenario, steps: List[_CompiledStep], instance: int
+    ) -> InstanceResult:
+        """Execute all steps of one scenario instance."""
+        variables: Dict[str, Any] = {**scenario.variables, "instance": instance}
+        step_results: List[StepResult] = []
+        started = perf_counter()
+        for step in steps:
+            try:
+                endpoint = str(step.endpoint(variables))
+                result = await self.client.make_request(
+                    endpoint,
+                    method=step.method,
+                    data=step.data(variables),
+                    params=step.params(variables),
+                    headers=step.headers(variables),
+                )
+            except KeyError as e:
+                return InstanceResult(
+                    instance=instance,
+                    passed=False,
+                    duration=perf_counter() - started,
+                    steps=step_results,
+                    error_message=f"{step.name}: {e.args[0]}",
+                )
+            error = self._check_step(step.step, result, variables)
+            step_results.append(
+                StepResult(
+                    name=step.name,
+                    method=step.method,
+                    endpoint=endpoint,
+                    status_code=result.status_code,
+                    response_time=result.response_time,
+                    passed=error is None,
+                    error_message=error,
+                )
+            )
+            if error is not None:
+                return InstanceResult(
+                    instance=instance,
+                    passed=False,
+                    duration=perf_counter() - started,
+                    steps=step_results,
+                    error_message=f"{step.name}: {error}",
+                )
+        return InstanceResult(
+            instance=instance,
+            passed=True,
+            duration=perf_counter() - started,
+            steps=step_results,
+        )
+
+    @staticmethod
+    def _check_step(
+        step: ScenarioStep, result: "ApiResult", variables: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Apply step assertions and extractions.
+
+        Returns:
+            Error message, or None if the step passed
+        """
+        if result.error_message is not None and result.status_code == 0:
+            return result.error_message
+        assertion = step.assertion
+        try:
+            if assertion.status is not None:
+                result.assert_status_code(assertion.status)
+            if (
+                assertion.max_response_time is not None
+                and result.response_time > assertion.max_response_time
+            ):
+                return (
+                    f"Response time {result.response_time:.3f}s exceeds "
+                    f"{assertion.max_response_time:.3f}s"
+                )
+            if assertion.fields:
+                result.assert_has_fields(*assertion.fields)
+            if step.extract:
+                data = result.json()
+                for name, path in step.extract.items():
+                    variables[name] = extract_path(data, path)
+        except (AssertionError, ValueError) as e:
+            return str(e)
+        except KeyError as e:
+            return str(e.args[0])
+        return None
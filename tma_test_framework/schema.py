@@ -0,0 +1,205 @@
+"""
+Compiled response schema validation.
+
+Schemas are compiled once into cached msgspec JSON decoders, so nested
+structure, types and constraints are validated in the same pass as decoding.
+A schema is either a type understood by msgspec (Struct classes, typing
+generics such as List[Item]) or a JSON-Schema subset given as a dictionary.
+"""
+
+# Python imports
+from functools import lru_cache
+from itertools import count
+from keyword import iskeyword
+from re import compile as re_compile
+from typing import Any, Dict, List, Literal, Tuple, Union, Annotated
+import msgspec
+
+SchemaType = Union[type, Dict[str, Any], Any]
+
+_JSON_SCHEMA_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "null": type(None),
+}
+_NUMBER_CONSTRAINTS = {
+    "minimum": "ge",
+    "maximum": "le",
+    "exclusiveMinimum": "gt",
+    "exclusiveMaximum": "lt",
+    "multipleOf": "multiple_of",
+}
+_STRING_CONSTRAINTS = {
+    "minLength": "min_length",
+    "maxLength": "max_length",
+    "pattern": "pattern",
+}
+_ARRAY_CONSTRAINTS = {"minItems": "min_length", "maxItems": "max_length"}
+_struct_ids = count(1)
+_NON_IDENTIFIER = re_compile(r"\W")
+
+
+def _is_attribute_name(key: str) -> bool:
+    """Whether a JSON property key can be used as Struct attribute as-is."""
+    return key.isidentifier() and not key.startswith("__") and not iskeyword(key)
+
+
+def _attribute_name(key: str, taken: set) -> str:
+    """Get unique Python attribute name for a JSON property key."""
+    name = _NON_IDENTIFIER.sub("_", key)
+    if not _is_attribute_name(name):
+        name = f"f_{name}"
+    base, suffix = name, 2
+    while name in taken:
+        name = f"{base}_{suffix}"
+        suffix += 1
+    taken.add(name)
+    return name
+
+
+def _constrained(
+    python_type: Any, schema: Dict[str, Any], keywords: Dict[str, str]
+) -> Any:
+    """Wrap type in msgspec.Meta constraints present in schema."""
+    meta_kwargs = {
+        meta_name: schema[keyword]
+        for keyword, meta_name in keywords.items()
+        if keyword in schema
+    }
+    if not meta_kwargs:
+        return python_type
+    return Annotated[python_type, msgspec.Meta(**meta_kwargs)]
+
+
+def _json_schema_to_type(schema: Dict[str, Any], name: str) -> Any:
+    """
+    Convert a JSON-Schema subset into a msgspec-compatible type.
+
+    Supported keywords: type (single or list), properties, required, items,
+    enum, minimum, maximum, exclusiveMinimum, exclusiveMaximum, multipleOf,
+    minLength, maxLength, pattern, minItems, maxItems.
+
+    Raises:
+        ValueError: If schema uses an unsupported type
+    """
+    if "enum" in schema:
+        return Literal[tuple(schema["enum"])]
+
+    schema_type = schema.get("type")
+    if schema_type is None:
+        return Any
+    if isinstance(schema_type, list):
+        members = tuple(
+            _json_schema_to_type({**schema, "type": member}, name)
+            for member in schema_type
+        )
+        return Union[members]
+
+    if schema_type == "object":
+        properties: Dict[str, Any] = schema.get("properties", {})
+        if not properties:
+            return Dict[str, Any]
+        required = set(schema.get("required", []))
+        fields: List[Tuple[Any, ...]] = []
+        # Keys such as "first-name" are stored under a safe attribute name
+        taken = {key for key in properties if _is_attribute_name(key)}
+        for field_name, field_schema in properties.items():
+            attribute = (
+                field_name
+                if _is_attribute_name(field_name)
+                else _attribute_name(field_name, taken)
+            )
+            field_type = _json_schema_to_type(field_schema, f"{name}_{attribute}")
+            if attribute == field_name:
+                default = msgspec.NODEFAULT if field_name in required else None
+            elif field_name in required:
+                default = msgspec.field(name=field_name)
+            else:
+                default = msgspec.field(default=None, name=field_name)
+            if default is msgspec.NODEFAULT:
+                fields.append((attribute, field_type))
+            else:
+                fields.append((attribute, field_type, default))
+        return msgspec.defstruct(f"{name}_{next(_struct_ids)}", fields, kw_only=True)
+    if schema_type == "array":
+        items = schema.get("items")
+        item_type = _json_schema_to_type(items, f"{name}_item") if items else Any
+        return _constrained(List[item_type], schema, _ARRAY_CONSTRAINTS)  # type: ignore[valid-type]
+    if schema_type in ("integer", "number"):
+        return _constrained(
+            _JSON_SCHEMA_TYPES[schema_type], schema, _NUMBER_CONSTRAINTS
+        )
+    if schema_type == "string":
+        return _constrained(str, schema, _STRING_CONSTRAINTS)
+    if schema_type in _JSON_SCHEMA_TYPES:
+        return _JSON_SCHEMA_TYPES[schema_type]
+    raise ValueError(f"Unsupported JSON-Schema type: {schema_type}")
+
+
+@lru_cache(maxsize=256)
+def _decoder_for_type(schema: Any) -> msgspec.json.Decoder:
+    """Build and cache decoder for a msgspec-compatible type."""
+    return msgspec.json.Decoder(schema)
+
+
+@lru_cache(maxsize=256)
+def _decoder_for_json_schema(canonical_schema: bytes) -> msgspec.json.Decoder:
+    """Build and cache decoder for a canonical JSON-Schema document."""
+    schema = msgspec.json.decode(canonical_schema)
+    return msgspec.json.Decoder(_json_schema_to_type(schema, "Schema"))
+
+
+def compile_schema(schema: SchemaType) -> msgspec.json.Decoder:
+    """
+    Compile schema into a cached msgspec JSON decoder.
+
+    Args:
+        schema: msgspec-compatible type or JSON-Schema dictionary
+
+    Returns:
+        Decoder validating structure, types and constraints while decoding
+
+    Raises:
+        ValueError: If schema cannot be compiled
+
+    Example:
+        >>> class Item(msgspec.Struct):
+        ...     id: Annotated[int, msgspec.Meta(ge=1)]
+        ...     name: str
+        >>> decoder = compile_schema(List[Item])
+        >>> decoder.decode(b'[{"id": 1, "name": "a"}]')
+    """
+    try:
+        if isinstance(schema, dict):
+            return _decoder_for_json_schema(msgspec.json.encode(schema, order="sorted"))
+        return _decoder_for_type(schema)
+    except (TypeError, msgspec.ValidationError) as e:
+        raise ValueError(f"Invalid schema: {e}") from e
+
+
+def validate_schema(body: bytes, schema: SchemaType) -> Any:
+    """
+    Decode and validate JSON body against schema in a single pass.
+
+    Args:
+        body: Response body as bytes
+        schema: msgspec-compatible type or JSON-Schema dictionary
+
+    Returns:
+        Decoded data (Struct instances for Struct/object schemas)
+
+    Raises:
+        ValueError: If body does not match schema or is not valid JSON
+    """
+    try:
+        return compile_schema(schema).decode(body)
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Schema validation failed: {e}") from e
+
+
+def clear_schema_cache() -> None:
+    """Drop all compiled schema decoders."""
+    _decoder_for_type.cache_clear()
+    _decoder_for_json_schema.cache_clear()
@@ -0,0 +1,287 @@
+"""
+Binary msgpack serialization of framework models.
+
+ApiResult, ResultRecord, UserInfo, ChatInfo, MessageInfo and the other
+msgspec Structs encode to msgpack without intermediate dictionaries.
+MessageWriter and MessageReader frame messages with a 4-byte big-endian
+length prefix, so results can be streamed from workers to a collector
+through files, pipes or sockets:
+
+    with MessageWriter(open("results.bin", "wb")) as writer:
+        api.add_result_listener(writer.write)
+        ...
+
+    for result in MessageReader(open("results.bin", "rb"), ApiResult):
+        stats.record(result)
+"""
+
+# Python imports
+from functools import lru_cache
+from struct import Struct as BinaryStruct
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    cast,
+)
+from asyncio import IncompleteReadError, StreamReader
+import msgspec
+
+T = TypeVar("T")
+
+_PREFIX = BinaryStruct(">I")
+PREFIX_SIZE = _PREFIX.size
+MAX_MESSAGE_SIZE = 2**32 - 1
+
+_encoder = msgspec.msgpack.Encoder()
+
+
+@lru_cache(maxsize=64)
+def _cached_decoder(type: Hashable) -> "msgspec.msgpack.Decoder[Any]":
+    """Build and cache msgpack decoder for a type."""
+    return msgspec.msgpack.Decoder(type)
+
+
+def _decoder(type: Type[T]) -> "msgspec.msgpack.Decoder[T]":
+    """Get cached msgpack decoder for a type."""
+    # Types are hashable at runtime, typing only lacks the Hashable bound
+    return cast("msgspec.msgpack.Decoder[T]", _cached_decoder(cast(Hashable, type)))
+
+
+def encode(obj: Any) -> bytes:
+    """
+    Encode object to msgpack.
+
+    Args:
+        obj: msgspec Struct or any msgpack-compatible value
+
+    Returns:
+        Encoded bytes
+    """
+    return _encoder.encode(obj)
+
+
+def decode(data: bytes, type: Type[T]) -> T:
+    """
+    Decode msgpack data into type.
+
+    Args:
+        data: Encoded bytes
+        type: Target type (e.g. ApiResult, List[UserInfo])
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If data is not valid msgpack for type
+    """
+    try:
+        return _decoder(type).decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Failed to decode {type!r}: {e}") from e
+
+
+class MessageWriter:
+    """
+    Writer of length-prefixed msgpack messages.
+
+    Messages are encoded into an internal buffer and written to the stream
+    once ``buffer_size`` bytes are pending (and on flush/close), so the
+    write() method is cheap enough to be used as ApiClient result listener.
+    """
+
+    def __init__(self, stream: BinaryIO, buffer_size: int = 64 * 1024) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            stream: Binary stream (file, pipe, socket.makefile("wb"))
+            buffer_size: Bytes buffered before writing to stream (0: write through)
+
+        Raises:
+            ValueError: If buffer_size is negative
+        """
+        if buffer_size < 0:
+            raise ValueError(f"buffer_size must be >= 0, got {buffer_size}")
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._buffer = bytearray()
+
+    def write(self, obj: Any) -> None:
+        """
+        Append one message.
+
+        Args:
+            obj: msgspec Struct or any msgpack-compatible value
+
+        Raises:
+            ValueError: If encoded message exceeds MAX_MESSAGE_SIZE
+        """
+        buffer = self._buffer
+        start = len(buffer)
+        # Encode after a placeholder prefix, then fill in the length
+        _encoder.encode_into(obj, buffer, start + PREFIX_SIZE)
+        size = len(buffer) - start - PREFIX_SIZE
+        if size > MAX_MESSAGE_SIZE:
+            del buffer[start:]
+            raise ValueError(f"Message of {size} bytes exceeds {MAX_MESSAGE_SIZE}")
+        _PREFIX.pack_into(buffer, start, size)
+        self.count += 1
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, objs: Iterable[Any]) -> None:
+        """Append messages."""
+        for obj in objs:
+            self.write(obj)
+
+    def flush(self) -> None:
+        """Write buffered messages to stream and flush it."""
+        if self._buffer:
+            self.stream.write(self._buffer)
+            self._buffer = bytearray()
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Flush and close stream."""
+        self.flush()
+        self.stream.close()
+
+    def __enter__(self) -> "MessageWriter":
+        """Return writer."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close writer."""
+        self.close()
+
+
+class MessageReader(Iterator[T]):
+    """
+    Reader of length-prefixed msgpack messages written by MessageWriter.
+
+    The stream is read in chunks of ``chunk_size`` bytes and messages are
+    decoded from the buffered chunk. Iterating yields decoded messages until
+    the end of the stream.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, type: Type[T], chunk_size: int = 64 * 1024
+    ) -> None:
+        """
+        Initialize reader.
+
+        Args:
+            stream: Binary stream positioned at a message boundary
+            type: Type of every message (e.g. ApiResult)
+            chunk_size: Bytes requested from stream per read
+        """
+        self.stream = stream
+        self.type = type
+        self.chunk_size = chunk_size
+        self._decoder = _decoder(type)
+        self._buffer = b""
+        self._offset = 0
+
+    def _fill(self, size: int) -> bool:
+        """Buffer at least size unread bytes; False if stream ends first."""
+        available = len(self._buffer) - self._offset
+        if available >= size:
+            return True
+        parts = [self._buffer[self._offset :]]
+        while available < size:
+            data = self.stream.read(max(self.chunk_size, size - available))
+            if not data:
+                break
+            parts.append(data)
+            available += len(data)
+        self._buffer = b"".join(parts)
+        self._offset = 0
+        return available >= size
+
+    def read(self) -> Optional[T]:
+        """
+        Read next message.
+
+        Returns:
+            Decoded message, or None at end of stream
+
+        Raises:
+            ValueError: If stream ends inside a message or message is invalid
+        """
+        if not self._fill(PREFIX_SIZE):
+            if self._offset < len(self._buffer):
+                raise ValueError("Truncated message stream: incomplete length prefix")
+            return None
+        (size,) = _PREFIX.unpack_from(self._buffer, self._offset)
+        if not self._fill(PREFIX_SIZE + size):
+            received = len(self._buffer) - self._offset - PREFIX_SIZE
+            raise ValueError(
+                f"Truncated message stream: expected {size} bytes, got {received}"
+            )
+        start = self._offset + PREFIX_SIZE
+        self._offset = start + size
+        try:
+            return self._decoder.decode(memoryview(self._buffer)[start : self._offset])
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Failed to decode {self.type!r}: {e}") from e
+
+    def read_all(self) -> List[T]:
+        """Read all remaining messages."""
+        return list(self)
+
+    def __iter__(self) -> "MessageReader[T]":
+        """Return reader."""
+        return self
+
+    def __next__(self) -> T:
+        """Read next message or stop at end of stream."""
+        message = self.read()
+        if message is None:
+            raise StopIteration
+        return message
+
+
+async def read_messages(reader: StreamReader, type: Type[T]) -> AsyncIterator[T]:
+    """
+    Yield length-prefixed msgpack messages from an asyncio stream.
+
+    Args:
+        reader: asyncio StreamReader (e.g. from asyncio.open_connection)
+        type: Type of every message
+
+    Yields:
+        Decoded messages until the stream ends
+
+    Raises:
+        ValueError: If stream ends inside a message or message is invalid
+    """
+    decoder = _decoder(type)
+    while True:
+        try:
+            prefix = await reader.readexactly(PREFIX_SIZE)
+        except IncompleteReadError as e:
+            if e.partial:
+                raise ValueError(
+                    "Truncated message stream: incomplete length prefix"
+                ) from e
+            return
+        (size,) = _PREFIX.unpack(prefix)
+        try:
+            payload = await reader.readexactly(size)
+        except IncompleteReadError as e:
+            raise ValueError(
+                f"Truncated message stream: expected {size} bytes, got {len(e.partial)}"
+            ) from e
+        try:
+            yield decoder.decode(payload)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Failed to decode {type!r}: {e}") from e
@@ -0,0 +1,222 @@
+"""
+Service level objective (SLO) assertions over aggregated request statistics.
+
+SLOs are checked against RequestStats rather than individual ApiResults:
+
+    assert_slos(
+        stats,
+        "p95 of GET v1/items/ < 300ms",
+        "error_rate < 0.5%",
+        "throughput > 200rps",
+    )
+"""
+
+# Python imports
+from re import compile as re_compile, IGNORECASE
+from typing import Optional, List, Union, TYPE_CHECKING
+import msgspec
+
+# Local imports
+from .stats import EndpointStats, RequestStats
+
+if TYPE_CHECKING:
+    from .load import EndpointLoadStats, LoadReport
+
+_SLO_PATTERN = re_compile(
+    r"^\s*(?P<metric>p\d+(?:\.\d+)?|mean|max|error[_ ]rate|throughput)"
+    r"(?:\s+of\s+(?P<endpoint>.+?))?"
+    r"\s*(?P<op><=|>=|<|>)\s*"
+    r"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>ms|s|%|rps)?\s*$",
+    IGNORECASE,
+)
+_UNIT_SCALE = {"ms": 0.001, "s": 1.0, "%": 0.01, "rps": 1.0, None: 1.0}
+_COMPARISONS = {
+    "<": lambda actual, threshold: actual < threshold,
+    "<=": lambda actual, threshold: actual <= threshold,
+    ">": lambda actual, threshold: actual > threshold,
+    ">=": lambda actual, threshold: actual >= threshold,
+}
+
+
+class SLO(msgspec.Struct, frozen=True):
+    """
+    Service level objective.
+
+    Metrics: ``pNN`` (latency percentile, seconds), ``mean``, ``max``,
+    ``error_rate`` (0.0-1.0) and ``throughput`` (requests per second).
+    ``endpoint`` is an endpoint key such as ``"GET v1/items/"``; None means
+    all endpoints aggregated.
+    """
+
+    metric: str
+    threshold: float
+    comparison: str = "<"
+    endpoint: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate SLO after initialization."""
+        if self.comparison not in _COMPARISONS:
+            raise ValueError(
+                f"Invalid comparison: {self.comparison}. Must be one of: <, <=, >, >="
+            )
+        if self.metric not in ("mean", "max", "error_rate", "throughput"):
+            if not self.metric.startswith("p"):
+                raise ValueError(f"Unsupported SLO metric: {self.metric}")
+            try:
+                value = float(self.metric[1:])
+            except ValueError as e:
+                raise ValueError(f"Unsupported SLO metric: {self.metric}") from e
+            if not 0 <= value <= 100:
+                raise ValueError(f"Percentile must be between 0 and 100: {self.metric}")
+
+    @classmethod
+    def parse(cls, expression: str) -> "SLO":
+        """
+        Parse SLO expression.
+
+        Examples: ``"p95 of GET v1/items/ < 300ms"``, ``"error rate < 0.5%"``,
+        ``"throughput > 200 rps"``, ``"max < 2s"``.
+
+        Args:
+            expression: SLO expression
+
+        Returns:
+            SLO instance
+
+        Raises:
+            ValueError: If expression cannot be parsed
+        """
+        match = _SLO_PATTERN.match(expression)
+        if not match:
+            raise ValueError(f"Invalid SLO expression: {expression!r}")
+        metric = match.group("metric").lower().replace(" ", "_")
+        unit = match.group("unit")
+        threshold = (
+            float(match.group("value")) * _UNIT_SCALE[unit.lower() if unit else None]
+        )
+        return cls(
+            metric=metric,
+            threshold=threshold,
+            comparison=match.group("op"),
+            endpoint=match.group("endpoint"),
+        )
+
+    def measure(self, stats: Union[EndpointStats, "EndpointLoadStats"]) -> float:
+        """
+        Measure SLO metric on endpoint statistics.
+
+        Args:
+            stats: Endpoint statistics
+
+        Returns:
+            Measured value (seconds, ratio or requests per second)
+        """
+        if self.metric == "error_rate":
+            return stats.error_rate
+        if self.metric == "throughput":
+            return stats.throughput
+        if self.metric == "mean":
+            return stats.mean
+        if self.metric == "max":
+            return stats.percentile(100)
+        return stats.percentile(float(self.metric[1:]))
+
+    def describe(self, value: Optional[float] = None) -> str:
+        """Render SLO (or a measured value) in the expression's units."""
+        amount = self.threshold if value is None else value
+        if self.metric == "error_rate":
+            formatted = f"{amount:.3%}"
+        elif self.metric == "throughput":
+            formatted = f"{amount:.1f}rps"
+        else:
+            formatted = f"{amount * 1000:.1f}ms"
+        if value is not None:
+            return formatted
+        scope = f" of {self.endpoint}" if self.endpoint else ""
+        return f"{self.metric}{scope} {self.comparison} {formatted}"
+
+
+class SLOResult(msgspec.Struct, frozen=True):
+    """Outcome of checking one SLO."""
+
+    slo: SLO
+    passed: bool
+    actual: Optional[float]
+    report: str
+
+
+def check_slo(
+    stats: Union[RequestStats, "LoadReport"], slo: Union[SLO, str]
+) -> SLOResult:
+    """
+    Check one SLO against collected statistics.
+
+    Args:
+        stats: Collected request statistics (RequestStats or LoadReport)
+        slo: SLO or SLO expression
+
+    Returns:
+        SLOResult with measured value and distribution report
+    """
+    if isinstance(slo, str):
+        slo = SLO.parse(slo)
+    if slo.endpoint is None:
+        endpoint_stats = stats.total()
+    elif slo.endpoint in stats.endpoints:
+        endpoint_stats = stats[slo.endpoint]
+    else:
+        known = ", ".join(sorted(stats.endpoints)) or "none"
+        return SLOResult(
+            slo=slo,
+            passed=False,
+            actual=None,
+            report=f"No requests recorded for {slo.endpoint} (recorded: {known})",
+        )
+    if endpoint_stats.count == 0:
+        return SLOResult(
+            slo=slo, passed=False, actual=None, report="No requests recorded"
+        )
+    actual = slo.measure(endpoint_stats)
+    return SLOResult(
+        slo=slo,
+        passed=_COMPARISONS[slo.comparison](actual, slo.threshold),
+        actual=actual,
+        report=endpoint_stats.report(),
+    )
+
+
+def assert_slos(
+    stats: Union[RequestStats, "LoadReport"], *slos: Union[SLO, str]
+) -> List[SLOResult]:
+    """
+    Assert that all SLOs hold for collected statistics.
+
+    Args:
+        stats: Collected request statistics (RequestStats or LoadReport)
+        *slos: SLOs or SLO expressions
+
+    Returns:
+        List of SLOResult (all passed)
+
+    Raises:
+        AssertionError: If any SLO is violated, with distribution reports
+    """
+    results = [check_slo(stats, slo) for slo in slos]
+    failures = [result for result in results if not result.passed]
+    if failures:
+        sections = []
+        for failure in failures:
+            actual = (
+                failure.slo.describe(failure.actual)
+                if failure.actual is not None
+                else "n/a"
+            )
+            sections.append(
+                f"SLO violated: {failure.slo.describe()} (actual: {actual})\n"
+                f"{failure.report}"
+            )
+        raise AssertionError(
+            f"{len(failures)} of {len(results)} SLOs violated:\n\n"
+            + "\n\n".join(sections)
+        )
+    return results
@@ -0,0 +1,283 @@
+"""
+Aggregated request statistics for TMA Framework.
+
+RequestStats collects per-endpoint latency and outcome statistics from
+ApiResult objects, e.g. as a result listener of ApiClient:
+
+    stats = RequestStats()
+    api.add_result_listener(stats.record)
+"""
+
+# Python imports
+from math import ceil, floor
+from time import monotonic
+from typing import Optional, Dict, List, Callable, Tuple, TYPE_CHECKING
+import msgspec
+
+if TYPE_CHECKING:
+    from .clients.models import ApiResult
+
+# Histogram bucket upper bounds in seconds used by distribution reports
+HISTOGRAM_BOUNDS: Tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    float("inf"),
+)
+REPORT_PERCENTILES: Tuple[float, ...] = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Compute percentile with linear interpolation between closest ranks.
+
+    Args:
+        sorted_values: Values sorted in ascending order
+        q: Percentile in range 0-100
+
+    Returns:
+        Percentile value, or 0.0 for empty input
+    """
+    if not sorted_values:
+        return 0.0
+    if not 0 <= q <= 100:
+        raise ValueError(f"percentile must be between 0 and 100, got {q}")
+    position = (len(sorted_values) - 1) * q / 100
+    lower = floor(position)
+    upper = ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    fraction = position - lower
+    return (
+        sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+    )
+
+
+class EndpointStats(msgspec.Struct):
+    """
+    Latency and outcome statistics of one endpoint.
+
+    Latencies are kept only for requests that produced a response
+    (transport failures have no meaningful response time).
+    """
+
+    key: str
+    count: int = 0
+    errors: int = 0
+    latencies: List[float] = msgspec.field(default_factory=list)
+    first_at: Optional[float] = None
+    last_at: Optional[float] = None
+
+    def record(
+        self, response_time: Optional[float], error: bool, timestamp: float
+    ) -> None:
+        """
+        Record one request outcome.
+
+        Args:
+            response_time: Response time in seconds (None if no response)
+            error: Whether request counts as error
+            timestamp: Monotonic time the request finished
+        """
+        self.count += 1
+        if error:
+            self.errors += 1
+        started = timestamp
+        if response_time is not None:
+            self.latencies.append(response_time)
+            started = timestamp - response_time
+        if self.first_at is None or started < self.first_at:
+            self.first_at = started
+        if self.last_at is None or timestamp > self.last_at:
+            self.last_at = timestamp
+
+    def merge(self, other: "EndpointStats") -> None:
+        """Merge statistics of another collector for the same endpoint."""
+        self.count += other.count
+        self.errors += other.errors
+        self.latencies.extend(other.latencies)
+        if other.first_at is not None and (
+            self.first_at is None or other.first_at < self.first_at
+        ):
+            self.first_at = other.first_at
+        if other.last_at is not None and (
+            self.last_at is None or other.last_at > self.last_at
+        ):
+            self.last_at = other.last_at
+
+    @property
+    def duration(self) -> float:
+        """Time between the first request start and the last request end."""
+        if self.first_at is None or self.last_at is None:
+            return 0.0
+        return max(self.last_at - self.first_at, 0.0)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of requests counted as errors (0.0-1.0)."""
+        return self.errors / self.count if self.count else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second over the observed duration."""
+        duration = self.duration
+        return self.count / duration if duration > 0 else 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Latency percentile in seconds.
+
+        Args:
+            q: Percentile in range 0-100 (e.g. 95)
+        """
+        # Sorting in place is O(n) when samples are already sorted
+        self.latencies.sort()
+        return percentile(self.latencies, q)
+
+    def histogram(
+        self, bounds: Tuple[float, ...] = HISTOGRAM_BOUNDS
+    ) -> List[Tuple[float, int]]:
+        """
+        Bucket latencies by upper bound.
+
+        Returns:
+            List of (upper bound in seconds, count) pairs
+        """
+        counts = [0] * len(bounds)
+        for latency in self.latencies:
+            for index, bound in enumerate(bounds):
+                if latency <= bound:
+                    counts[index] += 1
+                    break
+        return list(zip(bounds, counts))
+
+    def report(self) -> str:
+        """
+        Render human-readable distribution summary.
+
+        Returns:
+            Multi-line report with counts, percentiles and histogram
+        """
+        lines = [
+            f"{self.key}: count={self.count} errors={self.errors} "
+            f"({self.error_rate:.2%}) throughput={self.throughput:.1f} rps"
+        ]
+        if self.latencies:
+            percentiles = " ".join(
+                f"p{q:g}={self.percentile(q) * 1000:.1f}" for q in REPORT_PERCENTILES
+            )
+            lines.append(
+                f"  latency ms: min={self.latencies[0] * 1000:.1f} "
+                f"mean={self.mean * 1000:.1f} {percentiles} "
+                f"max={self.latencies[-1] * 1000:.1f}"
+            )
+            total = len(self.latencies)
+            lower = 0.0
+            for bound, bucket_count in self.histogram():
+                if bucket_count:
+                    label = (
+                        f">{lower * 1000:g}ms"
+                        if bound == float("inf")
+                        else f"<={bound * 1000:g}ms"
+                    )
+                    bar = "#" * max(1, round(40 * bucket_count / total))
+                    lines.append(f"  {label:>10} {bucket_count:>8} {bar}")
+                lower = bound
+        return "\n".join(lines)
+
+
+def default_error_predicate(result: "ApiResult") -> bool:
+    """Count transport failures, 4xx and 5xx responses as errors."""
+    return result.status_code == 0 or result.client_error or result.server_error
+
+
+def default_endpoint_key(result: "ApiResult") -> str:
+    """Group results by HTTP method and endpoint."""
+    return f"{result.method.upper()} {result.endpoint}"
+
+
+class RequestStats:
+    """
+    Per-endpoint statistics collector.
+
+    Usable as ApiClient result listener (``api.add_result_listener(stats.record)``)
+    and shareable between many clients and scenario instances.
+    """
+
+    def __init__(
+        self,
+        key_func: Callable[["ApiResult"], str] = default_endpoint_key,
+        error_predicate: Callable[["ApiResult"], bool] = default_error_predicate,
+    ) -> None:
+        """
+        Initialize statistics collector.
+
+        Args:
+            key_func: Function mapping result to endpoint key (e.g. to collapse IDs)
+            error_predicate: Function deciding whether result counts as error
+        """
+        self.key_func = key_func
+        self.error_predicate = error_predicate
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    def record(self, result: "ApiResult") -> None:
+        """
+        Record ApiResult.
+
+        Args:
+            result: Result returned by ApiClient.make_request
+        """
+        key = self.key_func(result)
+        endpoint = self.endpoints.get(key)
+        if endpoint is None:
+            endpoint = self.endpoints[key] = EndpointStats(key=key)
+        endpoint.record(
+            result.response_time if result.status_code else None,
+            self.error_predicate(result),
+            monotonic(),
+        )
+
+    def merge(self, other: "RequestStats") -> None:
+        """Merge another collector into this one."""
+        for key, endpoint in other.endpoints.items():
+            if key in self.endpoints:
+                self.endpoints[key].merge(endpoint)
+            else:
+                self.endpoints[key] = msgspec.structs.replace(
+                    endpoint, latencies=list(endpoint.latencies)
+                )
+
+    def __getitem__(self, key: str) -> EndpointStats:
+        """
+        Get statistics of one endpoint.
+
+        Raises:
+            KeyError: If no requests were recorded for endpoint
+        """
+        return self.endpoints[key]
+
+    def total(self) -> EndpointStats:
+        """Statistics aggregated over all endpoints."""
+        total = EndpointStats(key="ALL")
+        for endpoint in self.endpoints.values():
+            total.merge(endpoint)
+        return total
+
+    def report(self) -> str:
+        """Render distribution report of all endpoints."""
+        return "\n".join(self.endpoints[key].report() for key in sorted(self.endpoints))
+
+    def reset(self) -> None:
+        """Drop all collected statistics."""
+        self.endpoints.clear()
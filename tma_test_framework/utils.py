@@ -2,12 +2,10 @@
 Utility functions for API testing.
 """
 
-import hashlib
-import hmac
 import json
-import time
-from typing import Dict, Any, List, TYPE_CHECKING
-from urllib.parse import urlencode
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+from .init_data import Ed25519InitDataSigner, InitDataTemplate, InitDataUser
 
 if TYPE_CHECKING:
     from .clients.mtproto_client import UserInfo
@@ -109,6 +107,7 @@ def generate_telegram_init_data(
     bot_token: str = "test_bot_token",
     language_code: str = "ru",
     is_premium: bool = False,
+    ed25519_signer: Optional[Ed25519InitDataSigner] = None,
 ) -> str:
     """
     Generate valid Telegram init data for testing.
@@ -121,32 +120,22 @@ def generate_telegram_init_data(
         bot_token: Bot token for signature generation
         language_code: User language code
         is_premium: Whether user has premium
+        ed25519_signer: Also add third-party ``signature`` field signed with
+            this key (bot ID is taken from bot_token)
 
     Returns:
         Valid Telegram init data string
-    """
-    auth_date = int(time.time())
-    user_data = {
-        "id": user_id,
-        "first_name": first_name,
-        "last_name": last_name,
-        "username": username,
-        "language_code": language_code,
-        "is_premium": is_premium,
-        "allows_write_to_pm": True,
-    }
 
-    data = {
-        "user": json.dumps(user_data),
-        "auth_date": str(auth_date),
-    }
-
-    # Generate hash
-    check_string = "\n".join(f"{k}={v}" for k, v in sorted(data.items()))
-    secret = hmac.new(
-        "WebAppData".encode(), bot_token.encode(), hashlib.sha256
-    ).digest()
-    signature = hmac.new(secret, check_string.encode(), hashlib.sha256).hexdigest()
-
-    data["hash"] = signature
-    return urlencode(data)
+    Raises:
+        ValueError: If ed25519_signer is given and bot_token has no bot ID
+    """
+    user = InitDataUser(
+        id=user_id,
+        first_name=first_name,
+        last_name=last_name,
+        username=username,
+        language_code=language_code,
+        is_premium=is_premium,
+    )
+    # Template encodes user JSON once and reuses the signer cached per bot token
+    return InitDataTemplate(user, bot_token, ed25519_signer=ed25519_signer).sign()